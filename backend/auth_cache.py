@@ -0,0 +1,129 @@
+"""
+Authentication Cache
+Bounded in-process caches for decoded JWT claims and user documents, so authenticated
+requests skip token verification and the users lookup while an entry is fresh
+"""
+import os
+import time
+import asyncio
+import hashlib
+import logging
+from typing import Awaitable, Callable, Optional
+
+from cachetools import TLRUCache, TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Cache Configuration (user documents changed outside this process are picked up within the TTL)
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+
+class _Metered:
+    """Hit/miss/eviction counters for a cachetools cache"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def popitem(self):
+        # cachetools only calls popitem to make room, expired entries are dropped separately
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self),
+            "max_size": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+class _MeteredTTLCache(_Metered, TTLCache):
+    pass
+
+class _MeteredTLRUCache(_Metered, TLRUCache):
+    pass
+
+def _token_expiry(key: str, claims: dict, now: float) -> float:
+    # Never outlive the token itself
+    return min(now + TOKEN_CACHE_TTL_SECONDS, claims.get("exp", now + TOKEN_CACHE_TTL_SECONDS))
+
+# Keyed by SHA-256 of the token so raw tokens are not kept in memory
+token_cache = _MeteredTLRUCache(maxsize=TOKEN_CACHE_MAX_SIZE, ttu=_token_expiry, timer=time.time)
+# Keyed by user id
+user_cache = _MeteredTTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+# One users lookup per id at a time - parallel dashboard requests wait for the same load
+_loading: dict[str, asyncio.Task] = {}
+
+def decode_token(token: str, decode: Callable[[str], dict]) -> dict:
+    """
+    Decoded claims for a token, verifying it with decode on a cache miss
+
+    Args:
+        token: Bearer token
+        decode: Verifies and decodes the token (raises for invalid or expired tokens, which are not cached)
+
+    Returns:
+        dict: Token claims
+    """
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    claims = token_cache.get(key)
+    if claims is not None:
+        token_cache.hits += 1
+        return claims
+    token_cache.misses += 1
+    claims = decode(token)
+    token_cache[key] = claims
+    return claims
+
+async def _load_user(user_id: str, load: Callable[[str], Awaitable[Optional[dict]]]) -> Optional[dict]:
+    user = await load(user_id)
+    # Skip caching if the user was invalidated while this load was running
+    if user is not None and _loading.get(user_id) is asyncio.current_task():
+        user_cache[user_id] = user
+    return user
+
+async def get_user(user_id: str, load: Callable[[str], Awaitable[Optional[dict]]]) -> Optional[dict]:
+    """
+    User document by id, loading it with load on a cache miss
+
+    Args:
+        user_id: User id (the token subject)
+        load: Fetches the user document (None if it does not exist, which is not cached)
+
+    Returns:
+        dict: A copy of the user document, or None
+    """
+    user = user_cache.get(user_id)
+    if user is not None:
+        user_cache.hits += 1
+        return dict(user)
+    user_cache.misses += 1
+
+    task = _loading.get(user_id)
+    if task is None:
+        task = asyncio.ensure_future(_load_user(user_id, load))
+        _loading[user_id] = task
+        task.add_done_callback(lambda done: _loading.pop(user_id, None) if _loading.get(user_id) is done else None)
+    # Shielded so one cancelled request does not cancel the load the others are waiting for
+    user = await asyncio.shield(task)
+    return dict(user) if user is not None else None
+
+def invalidate_user(user_id: str):
+    """Drop a user's cached document - call after changing it"""
+    user_cache.invalidations += 1
+    user_cache.pop(user_id, None)
+    _loading.pop(user_id, None)
+
+def stats() -> dict:
+    return {"tokens": token_cache.stats(), "users": user_cache.stats()}
@@ -0,0 +1,159 @@
+"""
+Counter Service
+Maintains the aggregate counts the dashboard reads - websites and pages per user, pages per
+website, sections per page, videos and audio per section - with atomic $inc updates as records
+are created and deleted, and a periodic repair pass that recomputes them from the records
+"""
+import os
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+
+from pymongo import ReturnDocument, UpdateOne
+
+logger = logging.getLogger(__name__)
+
+# Repair Configuration (the first pass runs at startup and also backfills records created before counters existed)
+COUNTER_REPAIR_INTERVAL_HOURS = float(os.getenv("COUNTER_REPAIR_INTERVAL_HOURS", "24"))
+REPAIR_BATCH_SIZE = 1000
+
+SECTION_COUNTERS = {"videos": "videos_count", "audios": "audios_count"}
+
+async def websites_added(db, owner_id: str, delta: int = 1):
+    """A website was created (delta 1) or deleted (-1) for owner_id"""
+    # Only an initialized user_stats record can be adjusted, a missing one is computed on first read
+    await db.user_stats.update_one({"id": owner_id}, {"$inc": {"websites_count": delta}})
+
+async def pages_added(db, website_id: str, owner_id: str, delta: int = 1):
+    """delta pages were created in (or, if negative, deleted from) a website"""
+    await asyncio.gather(
+        db.websites.update_one({"id": website_id}, {"$inc": {"pages_count": delta}}),
+        db.user_stats.update_one({"id": owner_id}, {"$inc": {"pages_count": delta}}),
+    )
+
+async def sections_added(db, page_id: str, delta: int = 1):
+    """delta sections were created in (or, if negative, deleted from) a page"""
+    await db.pages.update_one({"id": page_id}, {"$inc": {"sections_count": delta}})
+
+async def media_added(db, collection: str, section_id: str, delta: int = 1):
+    """delta videos or audios (collection) were created in (or, if negative, deleted from) a section"""
+    await db.sections.update_one({"id": section_id}, {"$inc": {SECTION_COUNTERS[collection]: delta}})
+
+async def _count_user(db, user_id: str) -> dict:
+    websites = await db.websites.find({"owner_id": user_id}, {"_id": 0, "id": 1}).to_list(None)
+    pages_count = 0
+    if websites:
+        pages_count = await db.pages.count_documents({"website_id": {"$in": [w['id'] for w in websites]}})
+    return {"websites_count": len(websites), "pages_count": pages_count}
+
+async def user_stats(db, user_id: str) -> dict:
+    """
+    Counters of a user ({"websites_count", "pages_count"} over the websites they own)
+
+    A single read once initialized; the first read counts the records and stores the result.
+    """
+    stats = await db.user_stats.find_one({"id": user_id}, {"_id": 0})
+    if stats is None:
+        counts = await _count_user(db, user_id)
+        # $setOnInsert: a concurrent first read may have stored (and since adjusted) it already
+        stats = await db.user_stats.find_one_and_update(
+            {"id": user_id},
+            {"$setOnInsert": {"id": user_id, **counts}},
+            upsert=True,
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER,
+        )
+    return stats
+
+async def _grouped_counts(db, collection: str, key: str) -> dict:
+    rows = await db[collection].aggregate([{"$group": {"_id": f"${key}", "count": {"$sum": 1}}}]).to_list(None)
+    return {row["_id"]: row["count"] for row in rows}
+
+async def _set_counters(db, collection: str, counts_by_field: dict, upsert_ids=None) -> int:
+    """
+    Set each counter field of every record in collection to its computed value where it differs.
+    With upsert_ids, records for those ids are created if missing. Returns the number of records fixed.
+    """
+    fixed = 0
+    ops = []
+    missing = set(upsert_ids or ())
+
+    async def flush():
+        nonlocal ops, fixed
+        if ops:
+            await db[collection].bulk_write(ops, ordered=False)
+            fixed += len(ops)
+            ops = []
+
+    projection = {"_id": 0, "id": 1, **{field: 1 for field in counts_by_field}}
+    async for record in db[collection].find({}, projection):
+        missing.discard(record.get('id'))
+        changes = {
+            field: counts.get(record.get('id'), 0)
+            for field, counts in counts_by_field.items()
+            if record.get(field) != counts.get(record.get('id'), 0)
+        }
+        if changes:
+            ops.append(UpdateOne({"id": record['id']}, {"$set": changes}))
+            if len(ops) >= REPAIR_BATCH_SIZE:
+                await flush()
+    for record_id in missing:
+        values = {field: counts.get(record_id, 0) for field, counts in counts_by_field.items()}
+        ops.append(UpdateOne({"id": record_id}, {"$setOnInsert": {"id": record_id, **values}}, upsert=True))
+        if len(ops) >= REPAIR_BATCH_SIZE:
+            await flush()
+    await flush()
+    return fixed
+
+async def repair_counters(db) -> dict:
+    """
+    Recompute every counter from the records and fix the ones that drifted
+
+    Updates made while a pass runs can be overwritten with a value counted just before them;
+    the next pass corrects that.
+
+    Args:
+        db: Motor database
+
+    Returns:
+        dict: Records fixed per collection
+    """
+    videos, audios, sections, pages = await asyncio.gather(
+        _grouped_counts(db, "videos", "section_id"),
+        _grouped_counts(db, "audios", "section_id"),
+        _grouped_counts(db, "sections", "page_id"),
+        _grouped_counts(db, "pages", "website_id"),
+    )
+    owners = {
+        website['id']: website.get('owner_id')
+        async for website in db.websites.find({}, {"_id": 0, "id": 1, "owner_id": 1})
+    }
+    websites_by_owner = Counter(owners.values())
+    pages_by_owner = Counter()
+    for website_id, count in pages.items():
+        if website_id in owners:
+            pages_by_owner[owners[website_id]] += count
+    user_ids = [user['id'] async for user in db.users.find({}, {"_id": 0, "id": 1})]
+
+    report = {
+        "sections": await _set_counters(db, "sections", {"videos_count": videos, "audios_count": audios}),
+        "pages": await _set_counters(db, "pages", {"sections_count": sections}),
+        "websites": await _set_counters(db, "websites", {"pages_count": pages}),
+        "user_stats": await _set_counters(
+            db, "user_stats", {"websites_count": websites_by_owner, "pages_count": pages_by_owner}, upsert_ids=user_ids
+        ),
+        "repaired_at": datetime.now(timezone.utc).isoformat(),
+    }
+    fixed = sum(count for key, count in report.items() if key != "repaired_at")
+    logger.info(f"Counter repair fixed {fixed} records: {report}")
+    return report
+
+async def repair_periodically(db):
+    """Run repair_counters now and then every COUNTER_REPAIR_INTERVAL_HOURS until cancelled"""
+    while True:
+        try:
+            await repair_counters(db)
+        except Exception as e:
+            logger.error(f"Counter repair failed: {e}", exc_info=True)
+        await asyncio.sleep(COUNTER_REPAIR_INTERVAL_HOURS * 3600)
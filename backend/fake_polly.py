@@ -0,0 +1,135 @@
+"""
+Fake Polly Backend
+Local stand-in for the boto3 Polly client (enable with POLLY_BACKEND=fake) so audio
+generation, speech marks and long-form synthesis tasks work without AWS.
+Audio is silent MP3 whose length follows the text; speech marks are evenly paced.
+"""
+import io
+import os
+import re
+import html
+import json
+import time
+import uuid
+import logging
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Where synthesis task output is written instead of the S3 bucket
+FAKE_POLLY_OUTPUT_DIR = Path(os.getenv("FAKE_POLLY_OUTPUT_DIR", Path(__file__).parent / "uploads"))
+# Simulated time a synthesis task spends "in progress"
+FAKE_TASK_SECONDS = float(os.getenv("FAKE_POLLY_TASK_SECONDS", "1"))
+
+# One MPEG-2 Layer III frame: 24 kHz, 32 kbps, mono, all-zero side info (decodes as silence)
+SILENT_FRAME = bytes([0xFF, 0xF3, 0x44, 0xC0]) + bytes(92)
+FRAME_MS = 24
+MS_PER_CHAR = 60
+
+WORD = re.compile(r'\S+')
+SENTENCE = re.compile(r'[^.!?]+[.!?]*')
+SSML_TOKEN = re.compile(r'<mark\s+name="([^"]*)"\s*/>|<break\s+time="(\d+)ms"\s*/>|<[^>]+>|[^<]+')
+
+class _Stream(io.BytesIO):
+    """Mimics botocore's StreamingBody"""
+    def iter_chunks(self, chunk_size: int = 1024):
+        while True:
+            data = self.read(chunk_size)
+            if not data:
+                return
+            yield data
+
+def _spoken_text(text: str, text_type: str) -> tuple[str, list]:
+    """
+    Plain text to "speak" plus <mark> positions for SSML input.
+    Breaks become runs of spaces so that every character maps to MS_PER_CHAR of audio.
+    """
+    if text_type != 'ssml':
+        return text, []
+    spoken = ""
+    ssml_marks = []
+    for match in SSML_TOKEN.finditer(text):
+        mark_name, break_ms = match.group(1), match.group(2)
+        if mark_name is not None:
+            ssml_marks.append((len(spoken), mark_name))
+        elif break_ms is not None:
+            spoken += " " * (int(break_ms) // MS_PER_CHAR)
+        elif not match.group().startswith("<"):
+            spoken += html.unescape(match.group())
+    return spoken, ssml_marks
+
+def _silence(text: str) -> bytes:
+    frames = max(1, len(text) * MS_PER_CHAR // FRAME_MS)
+    return SILENT_FRAME * frames
+
+def _marks(text: str, mark_types: list, ssml_marks: list) -> bytes:
+    """Speech marks paced at MS_PER_CHAR, with byte offsets like Polly's"""
+    marks = []
+    encoded_offset = lambda index: len(text[:index].encode('utf-8'))
+    if 'ssml' in mark_types:
+        for index, name in ssml_marks:
+            marks.append({"time": index * MS_PER_CHAR, "type": "ssml", "start": encoded_offset(index),
+                          "end": encoded_offset(index), "value": name})
+    if 'sentence' in mark_types:
+        for match in SENTENCE.finditer(text):
+            value = match.group().strip()
+            if value:
+                start = match.start() + match.group().index(value)
+                marks.append({"time": start * MS_PER_CHAR, "type": "sentence", "start": encoded_offset(start),
+                              "end": encoded_offset(start + len(value)), "value": value})
+    if 'word' in mark_types:
+        for match in WORD.finditer(text):
+            marks.append({"time": match.start() * MS_PER_CHAR, "type": "word", "start": encoded_offset(match.start()),
+                          "end": encoded_offset(match.end()), "value": match.group()})
+    marks.sort(key=lambda mark: mark["time"])
+    return "".join(json.dumps(mark) + "\n" for mark in marks).encode('utf-8')
+
+class FakePollyClient:
+    """Implements the subset of the Polly client API used by polly_service"""
+
+    def __init__(self):
+        self.tasks = {}
+        self.lock = threading.Lock()
+
+    def synthesize_speech(self, Text, OutputFormat='mp3', TextType='text', SpeechMarkTypes=None, **kwargs):
+        spoken, ssml_marks = _spoken_text(Text, TextType)
+        if OutputFormat == 'json':
+            body = _marks(spoken, SpeechMarkTypes or [], ssml_marks)
+            content_type = 'application/x-json-stream'
+        else:
+            body = _silence(spoken)
+            content_type = 'audio/mpeg'
+        return {"AudioStream": _Stream(body), "ContentType": content_type, "RequestCharacters": len(spoken)}
+
+    def start_speech_synthesis_task(self, Text, OutputS3BucketName, OutputS3KeyPrefix='', OutputFormat='mp3',
+                                    TextType='text', SpeechMarkTypes=None, **kwargs):
+        task_id = str(uuid.uuid4())
+        extension = 'marks' if OutputFormat == 'json' else 'mp3'
+        output_path = FAKE_POLLY_OUTPUT_DIR / f"{OutputS3KeyPrefix}{task_id}.{extension}"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        body = self.synthesize_speech(Text, OutputFormat, TextType, SpeechMarkTypes)["AudioStream"].read()
+        output_path.write_bytes(body)
+
+        task = {
+            "TaskId": task_id,
+            "TaskStatus": "scheduled",
+            "OutputUri": output_path.resolve().as_uri(),
+            "OutputFormat": OutputFormat,
+            "RequestCharacters": len(Text),
+        }
+        with self.lock:
+            self.tasks[task_id] = (time.monotonic(), task)
+        logger.info(f"Fake Polly task {task_id} wrote {len(body)} bytes to {output_path}")
+        return {"SynthesisTask": dict(task)}
+
+    def get_speech_synthesis_task(self, TaskId):
+        with self.lock:
+            started, task = self.tasks[TaskId]
+        elapsed = time.monotonic() - started
+        status = "completed" if elapsed >= FAKE_TASK_SECONDS else "inProgress"
+        return {"SynthesisTask": {**task, "TaskStatus": status}}
+
+    def describe_voices(self, LanguageCode=None, **kwargs):
+        return {"Voices": [{"Id": "Joanna", "Name": "Joanna", "Gender": "Female",
+                            "LanguageCode": LanguageCode or "en-US", "SupportedEngines": ["neural", "standard"]}]}
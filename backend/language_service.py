@@ -0,0 +1,131 @@
+"""
+Language Detection Service
+Detects the language of section text once, locally when possible, so translations
+can pass an explicit source language instead of asking AWS to re-detect it every call
+"""
+import os
+import logging
+import unicodedata
+from collections import Counter
+from typing import Optional
+
+import boto3
+from botocore.exceptions import ClientError
+from dotenv import load_dotenv
+
+import translate_service
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# AWS Configuration
+AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
+AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
+AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
+
+# Initialize Comprehend client (fallback when local detection is not confident)
+comprehend_client = boto3.client(
+    'comprehend',
+    aws_access_key_id=AWS_ACCESS_KEY_ID,
+    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+    region_name=AWS_REGION
+)
+
+# Local detection (langdetect is optional - without it only script-based detection runs locally)
+try:
+    from langdetect import DetectorFactory, detect_langs
+    from langdetect.lang_detect_exception import LangDetectException
+    DetectorFactory.seed = 0  # deterministic results for the same text
+except ImportError:
+    detect_langs = None
+
+LOCAL_MIN_CONFIDENCE = 0.90
+LOCAL_MIN_CHARS = 20
+COMPREHEND_MAX_BYTES = 5000
+
+# Scripts that identify a single supported language on their own
+SCRIPT_LANGUAGES = {
+    'ARABIC': 'ar',
+    'HEBREW': 'he',
+    'GREEK': 'el',
+    'DEVANAGARI': 'hi',
+    'THAI': 'th',
+    'HANGUL': 'ko',
+    'HIRAGANA': 'ja',
+    'KATAKANA': 'ja',
+    'CJK': 'zh',
+    'CYRILLIC': 'ru',
+}
+
+def _supported(code: Optional[str]) -> Optional[str]:
+    """Map a detector's code (e.g. 'zh-cn') to a Translate language code, or None if unsupported"""
+    if not code:
+        return None
+    base = code.split('-')[0].lower()
+    return base if base in translate_service.SUPPORTED_LANGUAGES else None
+
+def _detect_by_script(text: str) -> Optional[str]:
+    """Language implied by the dominant non-Latin script (kana wins over CJK ideographs)"""
+    scripts = Counter()
+    for char in text:
+        if not char.isalpha():
+            continue
+        name = unicodedata.name(char, '')
+        for script in SCRIPT_LANGUAGES:
+            if name.startswith(script):
+                scripts[script] += 1
+                break
+        else:
+            scripts['OTHER'] += 1
+    if not scripts:
+        return None
+    script, count = scripts.most_common(1)[0]
+    if script == 'OTHER':
+        return None
+    if script == 'CJK' and (scripts['HIRAGANA'] or scripts['KATAKANA']):
+        return 'ja'
+    return SCRIPT_LANGUAGES[script] if count / sum(scripts.values()) >= 0.5 else None
+
+def _detect_locally(text: str) -> Optional[str]:
+    code = _detect_by_script(text)
+    if code or detect_langs is None or len(text.strip()) < LOCAL_MIN_CHARS:
+        return code
+    try:
+        best = detect_langs(text)[0]
+    except LangDetectException:
+        return None
+    return _supported(best.lang) if best.prob >= LOCAL_MIN_CONFIDENCE else None
+
+def _detect_with_comprehend(text: str) -> Optional[str]:
+    if not AWS_ACCESS_KEY_ID or not AWS_SECRET_ACCESS_KEY:
+        return None
+    sample = text.encode('utf-8')[:COMPREHEND_MAX_BYTES].decode('utf-8', errors='ignore')
+    try:
+        languages = comprehend_client.detect_dominant_language(Text=sample)['Languages']
+    except ClientError as e:
+        logger.warning(f"Comprehend language detection failed: {e}")
+        return None
+    if not languages:
+        return None
+    return _supported(max(languages, key=lambda language: language['Score'])['LanguageCode'])
+
+def detect_language(text: str) -> tuple[Optional[str], str]:
+    """
+    Detect the language of text
+
+    Args:
+        text: Text to inspect
+
+    Returns:
+        tuple: (Translate language code or None if unknown, method - "local", "comprehend" or "none")
+    """
+    if not text or not text.strip():
+        return None, "none"
+    code = _detect_locally(text)
+    if code:
+        return code, "local"
+    code = _detect_with_comprehend(text)
+    if code:
+        return code, "comprehend"
+    return None, "none"
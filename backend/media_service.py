@@ -0,0 +1,187 @@
+"""
+Media Processing Service
+Generates poster frames and thumbnail sprites for uploaded videos and
+compact, loudness-normalized audio renditions using ffmpeg
+"""
+import os
+import json
+import shutil
+import subprocess
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# ffmpeg Configuration
+FFMPEG_BINARY = os.getenv("FFMPEG_BINARY", "ffmpeg")
+FFPROBE_BINARY = os.getenv("FFPROBE_BINARY", "ffprobe")
+FFMPEG_TIMEOUT = int(os.getenv("FFMPEG_TIMEOUT", "300"))  # seconds per ffmpeg call
+
+# Poster Configuration
+POSTER_FORMAT = os.getenv("POSTER_FORMAT", "webp").lower()  # "webp" or "jpg"
+POSTER_WIDTH = 640
+
+# Sprite Configuration (a single JPEG grid of evenly spaced frames)
+SPRITE_COLUMNS = 5
+SPRITE_ROWS = 2
+SPRITE_TILE_WIDTH = 160
+SPRITE_MIN_INTERVAL = 0.5  # seconds between tiles for very short clips
+
+# Audio Rendition Configuration (speech: mono, low bitrate)
+LOUDNESS_TARGET_LUFS = float(os.getenv("LOUDNESS_TARGET_LUFS", "-16"))
+LOUDNESS_TRUE_PEAK = -1.5
+LOUDNESS_RANGE = 11
+AUDIO_RENDITIONS = [
+    # Listed in order of preference - the widget offers them as <source>s in this order
+    {"format": "opus", "extension": "opus", "content_type": "audio/ogg; codecs=opus",
+     "codec_args": ["-c:a", "libopus", "-b:a", "24k", "-application", "voip"]},
+    {"format": "aac", "extension": "m4a", "content_type": "audio/mp4; codecs=mp4a.40.2",
+     "codec_args": ["-c:a", "aac", "-b:a", "48k", "-movflags", "+faststart"]},
+]
+
+IMAGE_CONTENT_TYPES = {
+    "jpg": "image/jpeg",
+    "webp": "image/webp",
+}
+
+def is_available() -> bool:
+    """Check that ffmpeg and ffprobe are installed"""
+    return bool(shutil.which(FFMPEG_BINARY) and shutil.which(FFPROBE_BINARY))
+
+def _run(args: list) -> subprocess.CompletedProcess:
+    result = subprocess.run(args, capture_output=True, timeout=FFMPEG_TIMEOUT)
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip().splitlines()
+        raise Exception(f"{args[0]} failed: {stderr[-1] if stderr else result.returncode}")
+    return result
+
+def probe_video(source: str) -> dict:
+    """
+    Read duration and frame size of a video
+
+    Args:
+        source: Local file path or (presigned) URL of the video
+
+    Returns:
+        dict: {"duration": seconds, "width": px, "height": px}
+    """
+    result = _run([
+        FFPROBE_BINARY, "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=width,height:format=duration",
+        "-of", "json",
+        source
+    ])
+    info = json.loads(result.stdout or b"{}")
+    stream = (info.get("streams") or [{}])[0]
+    return {
+        "duration": float(info.get("format", {}).get("duration") or 0),
+        "width": int(stream.get("width") or 0),
+        "height": int(stream.get("height") or 0),
+    }
+
+def extract_poster(source: str, output_path: Path, at_seconds: float = 0.0) -> Path:
+    """Grab a single frame as a poster image (format taken from the output suffix)"""
+    codec_args = ["-c:v", "libwebp", "-quality", "80"] if output_path.suffix == ".webp" else ["-q:v", "3"]
+    _run([
+        FFMPEG_BINARY, "-y", "-v", "error",
+        "-ss", f"{at_seconds:.2f}",
+        "-i", source,
+        "-frames:v", "1",
+        "-vf", f"scale={POSTER_WIDTH}:-2",
+        *codec_args,
+        str(output_path)
+    ])
+    return output_path
+
+def build_sprite(source: str, output_path: Path, duration: float, width: int, height: int) -> dict:
+    """
+    Render evenly spaced frames into one JPEG grid
+
+    Returns:
+        dict: Sprite layout for the player ({"columns", "rows", "interval", "tile_width", "tile_height"})
+    """
+    tiles = SPRITE_COLUMNS * SPRITE_ROWS
+    interval = max(duration / tiles, SPRITE_MIN_INTERVAL) if duration else SPRITE_MIN_INTERVAL
+    tile_height = int(round(SPRITE_TILE_WIDTH * height / width / 2) * 2) if width and height else 90
+    _run([
+        FFMPEG_BINARY, "-y", "-v", "error",
+        "-i", source,
+        "-vf", f"fps=1/{interval:.3f},scale={SPRITE_TILE_WIDTH}:{tile_height},tile={SPRITE_COLUMNS}x{SPRITE_ROWS}",
+        "-frames:v", "1",
+        "-q:v", "5",
+        str(output_path)
+    ])
+    return {
+        "columns": SPRITE_COLUMNS,
+        "rows": SPRITE_ROWS,
+        "interval": round(interval, 3),
+        "tile_width": SPRITE_TILE_WIDTH,
+        "tile_height": tile_height,
+    }
+
+def generate_video_previews(source: str, work_dir: Path) -> dict:
+    """
+    Generate a poster image and a thumbnail sprite for a video
+
+    Args:
+        source: Local file path or (presigned) URL of the video
+        work_dir: Directory where output images are written
+
+    Returns:
+        dict: {"poster": Path, "poster_content_type": str, "sprite": Path, "sprite_meta": dict}
+    """
+    if not is_available():
+        raise Exception("ffmpeg is not installed - cannot generate video previews")
+
+    poster_ext = POSTER_FORMAT if POSTER_FORMAT in IMAGE_CONTENT_TYPES else "jpg"
+    info = probe_video(source)
+
+    # Skip the first frames (often black / signer getting into position)
+    poster_at = min(1.0, info["duration"] * 0.1) if info["duration"] else 0.0
+    poster = extract_poster(source, work_dir / f"poster.{poster_ext}", poster_at)
+    sprite_meta = build_sprite(source, work_dir / "sprite.jpg", info["duration"], info["width"], info["height"])
+
+    logger.info(f"Generated previews for video ({info['duration']:.1f}s, {info['width']}x{info['height']})")
+    return {
+        "poster": poster,
+        "poster_content_type": IMAGE_CONTENT_TYPES[poster_ext],
+        "sprite": work_dir / "sprite.jpg",
+        "sprite_meta": sprite_meta,
+    }
+
+def transcode_audio(source: str, work_dir: Path) -> list[dict]:
+    """
+    Produce Opus and AAC renditions normalized to LOUDNESS_TARGET_LUFS
+
+    Args:
+        source: Local file path or (presigned) URL of the original audio
+        work_dir: Directory where renditions are written
+
+    Returns:
+        list: [{"format", "content_type", "path", "size"}] in order of preference
+    """
+    if not is_available():
+        raise Exception("ffmpeg is not installed - cannot transcode audio")
+
+    loudnorm = f"loudnorm=I={LOUDNESS_TARGET_LUFS}:TP={LOUDNESS_TRUE_PEAK}:LRA={LOUDNESS_RANGE}"
+    renditions = []
+    for rendition in AUDIO_RENDITIONS:
+        output_path = work_dir / f"audio.{rendition['extension']}"
+        _run([
+            FFMPEG_BINARY, "-y", "-v", "error",
+            "-i", source,
+            "-vn", "-ac", "1", "-ar", "48000" if rendition["format"] == "opus" else "24000",
+            "-af", loudnorm,
+            *rendition["codec_args"],
+            str(output_path)
+        ])
+        renditions.append({
+            "format": rendition["format"],
+            "content_type": rendition["content_type"],
+            "path": output_path,
+            "size": output_path.stat().st_size,
+        })
+
+    logger.info("Transcoded audio renditions: " + ", ".join(f"{r['format']}={r['size']}B" for r in renditions))
+    return renditions
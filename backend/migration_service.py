@@ -0,0 +1,229 @@
+"""
+Data Migration Service
+Normalizes stored records in resumable batches so read paths can return documents as stored
+and look them up by stored keys.
+Progress is checkpointed in the migrations collection after every batch, so an interrupted
+run continues where it stopped the next time it starts.
+"""
+import os
+import re
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+import url_service
+
+logger = logging.getLogger(__name__)
+
+# Widget Configuration (EC2 URL for now, can be changed to the domain later - changing it re-runs the migration)
+WIDGET_BASE_URL = os.getenv("WIDGET_BASE_URL", "http://13.222.11.150:8001")
+MIGRATION_BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", "500"))
+WIDGET_SCRIPT_SRC = f"{WIDGET_BASE_URL}/api/widget.js"
+
+WEBSITES_MIGRATION = "normalize_websites"
+PAGES_MIGRATION = "key_page_urls"
+DUPLICATE_KEY_ERROR = 11000
+
+def embed_code(website_id: str) -> str:
+    """Widget script tag for a website"""
+    return f'<script src="{WIDGET_SCRIPT_SRC}" data-website-id="{website_id}"></script>'
+
+def _iso_created_at(value, now: str) -> str:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            # Mongo returns naive UTC datetimes
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).isoformat()
+        except ValueError:
+            pass
+    return now
+
+def _website_changes(site: dict, now: str) -> dict:
+    """Fields to $set so a website has every Website field, the current embed code, a url and an ISO created_at"""
+    changes = {}
+    if 'image_url' not in site:
+        changes['image_url'] = None
+    code = embed_code(site['id'])
+    if site.get('embed_code') != code:
+        changes['embed_code'] = code
+    if not site.get('url'):
+        domain = site.get('domain')
+        if domain:
+            changes['url'] = domain if domain.startswith('http') else f'https://{domain}'
+        else:
+            changes['url'] = 'https://example.com'
+    created_at = _iso_created_at(site.get('created_at'), now)
+    if site.get('created_at') != created_at:
+        changes['created_at'] = created_at
+    return changes
+
+async def _write_batch(db, name: str, collection: str, ops: list) -> int:
+    """Apply a batch of updates; returns how many were left out because they would duplicate a unique key"""
+    if not ops:
+        return 0
+    try:
+        await db[collection].bulk_write(ops, ordered=False)
+    except BulkWriteError as e:
+        # Updates that would duplicate a unique key are left out, anything else is a real failure
+        errors = e.details.get("writeErrors", [])
+        if any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors):
+            raise
+        logger.warning(f"{name}: {len(errors)} records left unchanged, their update would duplicate a unique key")
+        return len(errors)
+    return 0
+
+async def _sweep(db, name: str, collection: str, query: dict, projection: dict, fix_batch,
+                 batch_size: int = MIGRATION_BATCH_SIZE) -> dict:
+    """
+    Fix the records matching query in _id order, without checkpoints - for the few records a
+    completed migration still finds unmigrated on a later start (inserted by scripts, or
+    conflicts that may have been resolved since). Returns {"scanned", "updated", "conflicts"}.
+    """
+    totals = {"scanned": 0, "updated": 0, "conflicts": 0}
+    last_id = None
+    while True:
+        batch_query = {**query, "_id": {"$gt": last_id}} if last_id is not None else query
+        batch = await db[collection].find(batch_query, projection).sort("_id", 1).limit(batch_size).to_list(batch_size)
+        if not batch:
+            break
+        ops = await fix_batch(batch, datetime.now(timezone.utc).isoformat())
+        conflicts = await _write_batch(db, name, collection, ops)
+        last_id = batch[-1]['_id']
+        totals["scanned"] += len(batch)
+        totals["updated"] += len(ops) - conflicts
+        totals["conflicts"] += conflicts
+    if totals["scanned"]:
+        logger.info(f"{name}: fixed {totals['updated']} of {totals['scanned']} unmigrated {collection} records")
+    return totals
+
+async def _run_batched(db, name: str, version, collection: str, projection: dict, fix_batch,
+                       batch_size: int = MIGRATION_BATCH_SIZE) -> dict:
+    """
+    Run a migration over every record of a collection in _id order, resuming an interrupted run
+
+    A completed migration is skipped until its version changes, then runs again from the start.
+    Concurrent runs are harmless as long as fix_batch's updates are idempotent.
+
+    Args:
+        db: Motor database
+        name: Migration id in the migrations collection
+        version: Anything that, when it changes, means the records need migrating again
+        collection: Collection to walk
+        projection: Fields fix_batch needs
+        fix_batch: async (records, now) -> list of UpdateOne for the records that need changing
+        batch_size: Records per bulk write and checkpoint
+
+    Returns:
+        dict: The migration record ({"scanned", "updated", "conflicts", "status", ...})
+    """
+    state = await db.migrations.find_one({"id": name}, {"_id": 0})
+    if state and state.get("version") == version:
+        if state.get("status") == "completed":
+            return state
+        last_id = state.get("last_id")
+        logger.info(f"Resuming {name} after {state.get('scanned', 0)} records")
+    else:
+        last_id = None
+        state = {
+            "id": name,
+            "version": version,
+            "status": "running",
+            "last_id": None,
+            "scanned": 0,
+            "updated": 0,
+            "conflicts": 0,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "completed_at": None,
+        }
+        await db.migrations.replace_one({"id": name}, state, upsert=True)
+
+    while True:
+        query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+        batch = await db[collection].find(query, projection).sort("_id", 1).limit(batch_size).to_list(batch_size)
+        if not batch:
+            break
+        ops = await fix_batch(batch, datetime.now(timezone.utc).isoformat())
+        conflicts = await _write_batch(db, name, collection, ops)
+        last_id = batch[-1]['_id']
+        updated = len(ops) - conflicts
+        state["scanned"] += len(batch)
+        state["updated"] += updated
+        state["conflicts"] = state.get("conflicts", 0) + conflicts
+        await db.migrations.update_one({"id": name}, {
+            "$set": {"last_id": last_id},
+            "$inc": {"scanned": len(batch), "updated": updated, "conflicts": conflicts},
+        })
+
+    state.update(status="completed", last_id=last_id, completed_at=datetime.now(timezone.utc).isoformat())
+    await db.migrations.update_one({"id": name}, {
+        "$set": {"status": "completed", "completed_at": state["completed_at"]}
+    })
+    logger.info(f"{name}: migrated {state['updated']} of {state['scanned']} {collection} records")
+    return state
+
+async def normalize_websites(db) -> dict:
+    """
+    Normalize every website record in storage (see _website_changes)
+
+    Runs again when WIDGET_BASE_URL changes, since every embed code changes with it. Websites
+    inserted since without going through the API (setup scripts) are normalized on every start.
+    """
+    async def fix_batch(batch: list, now: str) -> list:
+        ops = []
+        for site in batch:
+            changes = _website_changes(site, now)
+            if changes:
+                ops.append(UpdateOne({"_id": site['_id']}, {"$set": changes}))
+        return ops
+
+    projection = {"id": 1, "embed_code": 1, "url": 1, "domain": 1, "image_url": 1, "created_at": 1}
+    state = await _run_batched(db, WEBSITES_MIGRATION, WIDGET_BASE_URL, "websites", projection, fix_batch)
+    unnormalized = {"$or": [
+        {"embed_code": {"$not": re.compile("^" + re.escape(f'<script src="{WIDGET_SCRIPT_SRC}" '))}},
+        {"url": {"$in": [None, ""]}},
+        {"image_url": {"$exists": False}},
+        {"created_at": {"$not": {"$type": "string"}}},
+    ]}
+    state["unnormalized"] = await _sweep(db, WEBSITES_MIGRATION, "websites", unnormalized, projection, fix_batch)
+    return state
+
+async def key_page_urls(db) -> dict:
+    """
+    Store the url_hash of every page (see url_service), with its website's URL rules
+
+    Runs again when url_service.CANONICAL_VERSION changes. Pages whose key another page of the
+    same website already has are left without one and counted as conflicts. Pages without a key
+    (conflicts, pages inserted by scripts) are retried on every start.
+    """
+    async def fix_batch(batch: list, now: str) -> list:
+        website_ids = list({page['website_id'] for page in batch})
+        websites = await db.websites.find({"id": {"$in": website_ids}}, {"_id": 0, "id": 1, "url_rules": 1}).to_list(None)
+        rules = {website['id']: website.get('url_rules') for website in websites}
+        ops = []
+        for page in batch:
+            key = url_service.url_hash(page['url'], rules.get(page['website_id']))
+            if page.get('url_hash') != key:
+                ops.append(UpdateOne({"_id": page['_id']}, {"$set": {"url_hash": key}}))
+        return ops
+
+    projection = {"website_id": 1, "url": 1, "url_hash": 1}
+    state = await _run_batched(db, PAGES_MIGRATION, url_service.CANONICAL_VERSION, "pages", projection, fix_batch)
+    state["unkeyed"] = await _sweep(db, PAGES_MIGRATION, "pages", {"url_hash": {"$exists": False}}, projection, fix_batch)
+    return state
+
+async def run_migrations(db) -> Optional[dict]:
+    """Run pending migrations, logging instead of raising so a failure never takes the API down"""
+    try:
+        return {
+            WEBSITES_MIGRATION: await normalize_websites(db),
+            PAGES_MIGRATION: await key_page_urls(db),
+        }
+    except Exception as e:
+        logger.error(f"Migrations failed, they resume on the next start: {e}", exc_info=True)
+        return None
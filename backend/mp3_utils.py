@@ -0,0 +1,210 @@
+"""
+MP3 Frame Utilities
+Frame-level helpers for joining, measuring and splitting MPEG Layer III audio
+(the format produced by AWS Polly and OpenAI TTS) without re-encoding
+"""
+from typing import Iterator, List, NamedTuple
+
+# Layer III bitrates in kbps, indexed by the 4-bit bitrate index
+BITRATES_V1 = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320]
+BITRATES_V2 = [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+
+# Sample rates in Hz, indexed by the 2-bit version id then the sample rate index
+SAMPLE_RATES = {
+    0b11: [44100, 48000, 32000],  # MPEG-1
+    0b10: [22050, 24000, 16000],  # MPEG-2
+    0b00: [11025, 12000, 8000],   # MPEG-2.5
+}
+
+class Frame(NamedTuple):
+    offset: int
+    length: int
+    samples: int
+    sample_rate: int
+
+    @property
+    def duration_ms(self) -> float:
+        return self.samples * 1000.0 / self.sample_rate
+
+def strip_id3(data: bytes) -> bytes:
+    """Remove a leading ID3v2 tag and a trailing ID3v1 tag"""
+    start = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        # Tag size is a 28-bit "syncsafe" integer; the footer flag adds 10 bytes
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        start = 10 + size + (10 if data[5] & 0x10 else 0)
+    end = len(data)
+    if end - start >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128
+    return data[start:end]
+
+def _parse_header(data: bytes, offset: int):
+    """Return a Frame for the header at offset, or None if it is not a Layer III frame header"""
+    if offset + 4 > len(data):
+        return None
+    b1, b2 = data[offset + 1], data[offset + 2]
+    if data[offset] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = (b1 >> 3) & 0b11
+    layer = (b1 >> 1) & 0b11
+    bitrate_index = (b2 >> 4) & 0x0F
+    sample_rate_index = (b2 >> 2) & 0b11
+    if version == 0b01 or layer != 0b01 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    padding = (b2 >> 1) & 0b1
+    sample_rate = SAMPLE_RATES[version][sample_rate_index]
+    if version == 0b11:
+        bitrate = BITRATES_V1[bitrate_index] * 1000
+        samples, coefficient = 1152, 144
+    else:
+        bitrate = BITRATES_V2[bitrate_index] * 1000
+        samples, coefficient = 576, 72
+    length = coefficient * bitrate // sample_rate + padding
+    return Frame(offset, length, samples, sample_rate)
+
+def _is_info_frame(data: bytes, frame: Frame) -> bool:
+    """Detect the Xing/Info/VBRI metadata frame encoders put first (it carries whole-file totals)"""
+    b1, b3 = data[frame.offset + 1], data[frame.offset + 3]
+    mono = (b3 >> 6) & 0b11 == 0b11
+    if (b1 >> 3) & 0b11 == 0b11:
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+    tag_at = frame.offset + 4 + side_info
+    return (
+        data[tag_at:tag_at + 4] in (b"Xing", b"Info")
+        or data[frame.offset + 36:frame.offset + 40] == b"VBRI"
+    )
+
+def iter_frames(data: bytes) -> Iterator[Frame]:
+    """
+    Iterate over audio frames, skipping ID3 tags, metadata frames and garbage between frames
+
+    Args:
+        data: MP3 bytes with any ID3 tags already stripped
+
+    Yields:
+        Frame: offset/length into data plus frame duration information
+    """
+    offset = 0
+    first = True
+    while offset + 4 <= len(data):
+        frame = _parse_header(data, offset)
+        if frame is None or frame.length <= 4:
+            offset += 1
+            continue
+        if first and _is_info_frame(data, frame):
+            offset += frame.length
+            first = False
+            continue
+        first = False
+        yield frame
+        offset += frame.length
+
+class FrameStream:
+    """
+    Incremental frame parser for MP3 data that arrives in pieces.
+    feed() returns only whole audio frames (ID3 tag and metadata frame removed), so the
+    output of several streams can be written back to back; duration_ms grows as frames pass.
+    """
+    def __init__(self):
+        self.buffer = bytearray()
+        self.skip = 0
+        self.started = False
+        self.first = True
+        self.elapsed_ms = 0.0
+        self.sample_rate = 0
+
+    @property
+    def duration_ms(self) -> int:
+        return int(round(self.elapsed_ms))
+
+    def reset(self):
+        """Prepare for the next MP3 file in the stream (duration keeps accumulating)"""
+        self.buffer.clear()
+        self.skip = 0
+        self.started = False
+        self.first = True
+
+    def feed(self, data: bytes) -> bytes:
+        self.buffer += data
+        if not self.started:
+            if len(self.buffer) < 10:
+                return b""
+            if self.buffer[:3] == b"ID3":
+                size = (self.buffer[6] << 21) | (self.buffer[7] << 14) | (self.buffer[8] << 7) | self.buffer[9]
+                self.skip = 10 + size + (10 if self.buffer[5] & 0x10 else 0)
+            self.started = True
+        if self.skip:
+            skipped = min(self.skip, len(self.buffer))
+            del self.buffer[:skipped]
+            self.skip -= skipped
+
+        output = bytearray()
+        offset = 0
+        while offset + 4 <= len(self.buffer):
+            frame = _parse_header(self.buffer, offset)
+            if frame is None or frame.length <= 4:
+                offset += 1
+                continue
+            if offset + frame.length > len(self.buffer):
+                # Wait for the rest of the frame
+                break
+            if self.first and _is_info_frame(self.buffer, frame):
+                self.first = False
+                offset += frame.length
+                continue
+            self.first = False
+            self.sample_rate = self.sample_rate or frame.sample_rate
+            output += self.buffer[offset:offset + frame.length]
+            self.elapsed_ms += frame.duration_ms
+            offset += frame.length
+        del self.buffer[:offset]
+        return bytes(output)
+
+def duration_ms(data: bytes) -> int:
+    """Exact playing time of an MP3 in milliseconds"""
+    return int(round(sum(frame.duration_ms for frame in iter_frames(strip_id3(data)))))
+
+def sample_rate(data: bytes) -> int:
+    """Sample rate of the first audio frame (0 if no frame is found)"""
+    for frame in iter_frames(strip_id3(data)):
+        return frame.sample_rate
+    return 0
+
+def concat(parts: List[bytes]) -> bytes:
+    """
+    Join MP3 files into one stream by concatenating their audio frames.
+    All parts must share the same sample rate and channel layout (true for a single TTS voice).
+    """
+    output = bytearray()
+    for part in parts:
+        data = strip_id3(part)
+        for frame in iter_frames(data):
+            output += data[frame.offset:frame.offset + frame.length]
+    return bytes(output)
+
+def split(data: bytes, boundaries_ms: List[float]) -> List[bytes]:
+    """
+    Cut an MP3 at the given times (frame accurate, no re-encoding)
+
+    Args:
+        data: MP3 bytes
+        boundaries_ms: Ascending cut points in milliseconds
+
+    Returns:
+        list: len(boundaries_ms) + 1 MP3 segments
+    """
+    data = strip_id3(data)
+    segments = [bytearray() for _ in range(len(boundaries_ms) + 1)]
+    index = 0
+    elapsed = 0.0
+    for frame in iter_frames(data):
+        # A frame belongs to the segment its midpoint falls in
+        midpoint = elapsed + frame.duration_ms / 2
+        while index < len(boundaries_ms) and midpoint >= boundaries_ms[index]:
+            index += 1
+        segments[index] += data[frame.offset:frame.offset + frame.length]
+        elapsed += frame.duration_ms
+    return [bytes(segment) for segment in segments]
@@ -0,0 +1,91 @@
+"""
+Page Narration Service
+Joins the audio of a page's sections into one MP3 narration with a chapter index
+"""
+import logging
+from typing import Callable, Iterator, Optional, TypedDict
+
+import mp3_utils
+import polly_service
+
+logger = logging.getLogger(__name__)
+
+# Every chapter must share one sample rate to be joined frame by frame; Polly neural
+# (and OpenAI) MP3 is 24 kHz, and newly synthesized chapters are requested at this rate
+NARRATION_SAMPLE_RATE = 24000
+
+class Segment(TypedDict):
+    section_id: str
+    text: str
+    audio_id: Optional[str]
+    # Opens the existing section audio as a stream of MP3 blocks (None if the section has no audio)
+    open_audio: Optional[Callable[[], Iterator[bytes]]]
+
+class NarrationStream:
+    """
+    Iterating yields the narration MP3 one block at a time, so it can be streamed into storage.
+
+    Each section reuses its existing audio when it is an MP3 at NARRATION_SAMPLE_RATE,
+    otherwise its text is synthesized with Polly. Once iteration finishes, `chapters`
+    holds [{"section_id", "audio_id", "start_ms", "duration_ms"}] in reading order
+    (audio_id is None for synthesized chapters) and `duration_ms` the total length.
+
+    Args:
+        segments: Sections in reading order
+        language: Language for sections that need synthesis
+        voice_id: Polly voice for sections that need synthesis (optional)
+    """
+    def __init__(self, segments: list[Segment], language: str, voice_id: str = None):
+        self.segments = segments
+        self.language = language
+        self.voice_id = voice_id
+        self.chapters = []
+        self.duration_ms = 0
+
+    def _existing_audio(self, segment: Segment, frames: mp3_utils.FrameStream) -> Iterator[bytes]:
+        """Frames of the section's stored audio; yields nothing (and leaves frames at 0 ms) if it cannot be joined"""
+        blocks = segment['open_audio']()
+        try:
+            for block in blocks:
+                data = frames.feed(block)
+                if not data:
+                    continue
+                if frames.sample_rate != NARRATION_SAMPLE_RATE:
+                    logger.info(f"Audio {segment['audio_id']} is {frames.sample_rate} Hz, re-synthesizing section {segment['section_id']}")
+                    frames.elapsed_ms = 0.0
+                    return
+                yield data
+        finally:
+            close = getattr(blocks, "close", None)
+            if close:
+                close()
+
+    def __iter__(self):
+        for segment in self.segments:
+            start_ms = self.duration_ms
+            audio_id = None
+            emitted = 0.0
+
+            if segment['open_audio']:
+                frames = mp3_utils.FrameStream()
+                yield from self._existing_audio(segment, frames)
+                emitted = frames.elapsed_ms
+                audio_id = segment['audio_id'] if emitted else None
+
+            if not emitted and segment['text']:
+                speech = polly_service.SpeechStream(segment['text'], self.language, self.voice_id,
+                                                    'neural', sample_rate=NARRATION_SAMPLE_RATE)
+                yield from speech
+                emitted = speech.duration_ms
+
+            if not emitted:
+                continue
+            self.duration_ms = start_ms + int(round(emitted))
+            self.chapters.append({
+                "section_id": segment['section_id'],
+                "audio_id": audio_id,
+                "start_ms": start_ms,
+                "duration_ms": self.duration_ms - start_ms,
+            })
+
+        logger.info(f"Built {self.duration_ms}ms narration with {len(self.chapters)} chapters")
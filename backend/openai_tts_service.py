@@ -0,0 +1,183 @@
+"""
+OpenAI TTS Service
+Text-to-speech via the OpenAI audio API over one shared, pooled HTTP client
+"""
+import os
+import time
+import random
+import asyncio
+import logging
+from typing import AsyncIterator, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# OpenAI Configuration
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_TTS_URL = "https://api.openai.com/v1/audio/speech"
+OPENAI_TTS_MODEL = os.getenv("OPENAI_TTS_MODEL", "tts-1")  # tts-1 (standard) or tts-1-hd (high quality)
+
+# Retry Configuration (429 and 5xx are retried with exponential backoff + jitter)
+MAX_ATTEMPTS = int(os.getenv("OPENAI_TTS_MAX_ATTEMPTS", "3"))
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 8.0
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Circuit breaker: after this many consecutive failures, skip OpenAI for a while
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("OPENAI_TTS_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = int(os.getenv("OPENAI_TTS_BREAKER_RESET", "30"))
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+class TTSUnavailable(Exception):
+    """OpenAI TTS cannot serve the request right now (breaker open or retries exhausted) - use another provider"""
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe"""
+
+    def __init__(self, failure_threshold: int, reset_seconds: int):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self.probing:
+            # Let exactly one request through to test the upstream
+            self.probing = True
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.probing = False
+        if self.failures >= self.failure_threshold or self.opened_at is not None:
+            if self.opened_at is None:
+                logger.warning(f"OpenAI TTS circuit opened after {self.failures} consecutive failures")
+            self.opened_at = time.monotonic()
+
+breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS)
+
+# Shared client, created on app startup and closed on shutdown
+http_client: Optional[httpx.AsyncClient] = None
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401 - optional, enables HTTP/2 in httpx
+        return True
+    except ImportError:
+        return False
+
+async def startup():
+    """Open the shared connection pool (keep-alive, HTTP/2 when the h2 package is installed)"""
+    global http_client
+    if http_client is not None:
+        return
+    http_client = httpx.AsyncClient(
+        http2=_http2_available(),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+        headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
+    )
+
+async def shutdown():
+    global http_client
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after and retry_after.replace(".", "", 1).isdigit():
+        return min(float(retry_after), BACKOFF_MAX_SECONDS)
+    return min(BACKOFF_BASE_SECONDS * (2 ** attempt), BACKOFF_MAX_SECONDS) * (0.5 + random.random() / 2)
+
+async def stream_speech(text: str, voice: str = "alloy") -> AsyncIterator[bytes]:
+    """
+    Stream MP3 audio for text from OpenAI TTS
+
+    Retries happen only before the first byte is yielded; once audio is flowing a
+    failure is raised to the caller.
+
+    Args:
+        text: Text to convert to speech
+        voice: OpenAI voice (alloy, echo, fable, onyx, nova, shimmer)
+
+    Yields:
+        bytes: MP3 data as it arrives
+
+    Raises:
+        TTSUnavailable: Circuit open, or retries exhausted on 429/5xx/network errors
+    """
+    if not breaker.allow():
+        raise TTSUnavailable("OpenAI TTS circuit is open")
+    if http_client is None:
+        await startup()
+
+    payload = {
+        "model": OPENAI_TTS_MODEL,
+        "voice": voice,
+        "input": text,
+        "response_format": "mp3",
+    }
+
+    last_error = None
+    started = False
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            async with http_client.stream("POST", OPENAI_TTS_URL, json=payload) as resp:
+                if resp.status_code in RETRYABLE_STATUS:
+                    await resp.aread()
+                    last_error = f"HTTP {resp.status_code}"
+                    logger.warning(f"OpenAI TTS attempt {attempt + 1} failed: {resp.status_code}")
+                    if attempt + 1 < MAX_ATTEMPTS:
+                        await asyncio.sleep(_retry_delay(attempt, resp))
+                    continue
+                if resp.status_code != 200:
+                    body = (await resp.aread()).decode(errors="replace")
+                    # Client errors (bad voice, bad key) are not an upstream outage
+                    breaker.record_success()
+                    raise Exception(f"OpenAI TTS error: {resp.status_code} - {body[:500]}")
+
+                async for chunk in resp.aiter_bytes(STREAM_CHUNK_SIZE):
+                    started = True
+                    yield chunk
+                breaker.record_success()
+                return
+        except (httpx.TimeoutException, httpx.TransportError) as e:
+            if started:
+                # Part of the audio was already handed out - it cannot be replayed
+                breaker.record_failure()
+                raise TTSUnavailable(f"OpenAI TTS stream interrupted: {e}")
+            last_error = str(e) or e.__class__.__name__
+            logger.warning(f"OpenAI TTS attempt {attempt + 1} failed: {last_error}")
+            if attempt + 1 < MAX_ATTEMPTS:
+                await asyncio.sleep(_retry_delay(attempt))
+
+    breaker.record_failure()
+    raise TTSUnavailable(f"OpenAI TTS failed after {MAX_ATTEMPTS} attempts: {last_error}")
+
+async def generate_speech(text: str, voice: str = "alloy") -> bytes:
+    """Buffered variant of stream_speech for callers that need the whole file"""
+    return b"".join([chunk async for chunk in stream_speech(text, voice)])
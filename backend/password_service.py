@@ -0,0 +1,128 @@
+"""
+Password Hashing Service
+Runs bcrypt in a small dedicated thread pool (bcrypt releases the GIL) so hashing never blocks
+the event loop, sheds load when too many requests are waiting, and upgrades stored hashes
+whose cost differs from the configured one
+"""
+import os
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import bcrypt
+
+logger = logging.getLogger(__name__)
+
+# bcrypt Configuration
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Pool Configuration - requests beyond workers + queue are rejected instead of piling up
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "32"))
+
+class PasswordServiceBusy(Exception):
+    """Too many password operations are waiting - the caller should retry later"""
+
+executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+
+metrics = {
+    "in_flight": 0,  # running + queued
+    "max_in_flight": 0,
+    "completed": 0,
+    "rejected": 0,
+    "rehashed": 0,
+    "queue_wait_ms_total": 0.0,
+    "run_ms_total": 0.0,
+}
+
+def _cost(hashed: str) -> Optional[int]:
+    # $2b$12$<salt+hash>
+    parts = hashed.split("$")
+    return int(parts[2]) if len(parts) > 3 and parts[2].isdigit() else None
+
+def needs_rehash(hashed: str) -> bool:
+    return _cost(hashed) != BCRYPT_ROUNDS
+
+def _hash(password: str) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+def _verify(password: str, hashed: str) -> tuple[bool, Optional[str]]:
+    try:
+        valid = bcrypt.checkpw(password.encode(), hashed.encode())
+    except ValueError:
+        logger.warning("Stored password hash is malformed")
+        return False, None
+    # Rehash while the plain password is at hand, in the same pool slot
+    if valid and needs_rehash(hashed):
+        return True, _hash(password)
+    return valid, None
+
+async def _run(func, *args):
+    if metrics["in_flight"] >= PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE:
+        metrics["rejected"] += 1
+        raise PasswordServiceBusy("Too many sign-in requests, try again shortly")
+
+    metrics["in_flight"] += 1
+    metrics["max_in_flight"] = max(metrics["max_in_flight"], metrics["in_flight"])
+    submitted = time.monotonic()
+    timing = {}
+
+    def timed():
+        timing["started"] = time.monotonic()
+        try:
+            return func(*args)
+        finally:
+            timing["finished"] = time.monotonic()
+
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, timed)
+    finally:
+        metrics["in_flight"] -= 1
+        if "finished" in timing:
+            metrics["completed"] += 1
+            metrics["queue_wait_ms_total"] += (timing["started"] - submitted) * 1000
+            metrics["run_ms_total"] += (timing["finished"] - timing["started"]) * 1000
+
+async def hash_password(password: str) -> str:
+    """
+    Hash a password with the configured bcrypt cost
+
+    Raises:
+        PasswordServiceBusy: The pool queue is full
+    """
+    return await _run(_hash, password)
+
+async def verify_password(password: str, hashed: str) -> tuple[bool, Optional[str]]:
+    """
+    Check a password against a stored bcrypt hash
+
+    Returns:
+        tuple: (valid, new hash to store if the stored one uses a different cost, else None)
+
+    Raises:
+        PasswordServiceBusy: The pool queue is full
+    """
+    valid, new_hash = await _run(_verify, password, hashed)
+    if new_hash:
+        metrics["rehashed"] += 1
+    return valid, new_hash
+
+def stats() -> dict:
+    completed = metrics["completed"]
+    return {
+        "workers": PASSWORD_HASH_WORKERS,
+        "max_queue": PASSWORD_HASH_MAX_QUEUE,
+        "rounds": BCRYPT_ROUNDS,
+        "in_flight": metrics["in_flight"],
+        "queued": max(0, metrics["in_flight"] - PASSWORD_HASH_WORKERS),
+        "max_in_flight": metrics["max_in_flight"],
+        "completed": completed,
+        "rejected": metrics["rejected"],
+        "rehashed": metrics["rehashed"],
+        "avg_queue_wait_ms": round(metrics["queue_wait_ms_total"] / completed, 1) if completed else None,
+        "avg_run_ms": round(metrics["run_ms_total"] / completed, 1) if completed else None,
+    }
+
+def shutdown():
+    executor.shutdown(wait=False, cancel_futures=True)
@@ -8,6 +8,14 @@ import os
 from dotenv import load_dotenv
 from pathlib import Path
 import logging
+import re
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator
+from xml.sax.saxutils import escape
+
+import mp3_utils
 
 load_dotenv()
 
@@ -18,13 +26,48 @@ AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 
+# "aws" (default) or "fake" - a local stand-in that produces silent audio without AWS (see fake_polly.py)
+POLLY_BACKEND = os.getenv("POLLY_BACKEND", "aws").lower()
+
 # Initialize Polly client
-polly_client = boto3.client(
-    'polly',
-    aws_access_key_id=AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-    region_name=AWS_REGION
-)
+if POLLY_BACKEND == "fake":
+    from fake_polly import FakePollyClient
+    polly_client = FakePollyClient()
+else:
+    polly_client = boto3.client(
+        'polly',
+        aws_access_key_id=AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+        region_name=AWS_REGION
+    )
+
+# Long-text synthesis: SynthesizeSpeech accepts at most 3000 billed characters per request,
+# so longer text is split at sentence boundaries and chunks are synthesized concurrently
+MAX_CHUNK_CHARS = int(os.getenv("POLLY_MAX_CHUNK_CHARS", "2500"))
+SYNTHESIS_CONCURRENCY = int(os.getenv("POLLY_SYNTHESIS_CONCURRENCY", "4"))
+synthesis_pool = ThreadPoolExecutor(max_workers=SYNTHESIS_CONCURRENCY, thread_name_prefix="polly-synth")
+
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?\u3002\uff01\uff1f])\s+|(?<=[\u3002\uff01\uff1f])')
+CLAUSE_BOUNDARY = re.compile(r'(?<=[,;:\u3001\uff0c])\s*')
+
+# Streaming synthesis reads Polly's AudioStream in blocks of this size
+STREAM_READ_SIZE = 64 * 1024
+
+# Long-form synthesis: StartSpeechSynthesisTask accepts up to 100,000 billed characters
+# and writes its output to S3; text above LONG_FORM_MIN_CHARS is sent this way
+LONG_FORM_MIN_CHARS = int(os.getenv("POLLY_LONG_FORM_MIN_CHARS", "10000"))
+LONG_FORM_MAX_CHARS = 100000
+
+# Speech marks requested alongside audio for synchronized highlighting
+TIMING_MARK_TYPES = ['sentence', 'word']
+
+# Batch synthesis: many short texts share one SSML request, separated by <mark>s and a pause.
+# BATCH_MAX_CHARS bounds the spoken text (billed characters), SSML_MAX_CHARS the request as sent -
+# tags and escaped entities included (Polly rejects SSML input over 6000 characters)
+BATCH_MAX_CHARS = int(os.getenv("POLLY_BATCH_MAX_CHARS", "2500"))
+SSML_MAX_CHARS = 6000
+BATCH_BREAK_MS = 400
+BATCH_BREAK = f'<break time="{BATCH_BREAK_MS}ms"/>'
 
 # Language to Voice ID mapping for common languages
 # Using neural voices for better quality
@@ -82,6 +125,10 @@ LANGUAGE_CODE_MAP = {
     'polish': 'pl-PL',
 }
 
+def credentials_configured() -> bool:
+    """AWS credentials are present (or not needed because the fake backend is active)"""
+    return POLLY_BACKEND == "fake" or bool(AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY)
+
 def normalize_language_code(language: str) -> tuple[str, str]:
     """
     Normalize language input to AWS format
@@ -107,10 +154,96 @@ def normalize_language_code(language: str) -> tuple[str, str]:
     
     return lang_code, voice_id
 
+def _split_long_piece(piece: str, max_chars: int) -> list[str]:
+    """Split a single over-long sentence at clause boundaries, then whitespace, then hard cuts"""
+    parts = []
+    for clause in CLAUSE_BOUNDARY.split(piece):
+        while len(clause) > max_chars:
+            cut = clause.rfind(' ', 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            parts.append(clause[:cut].strip())
+            clause = clause[cut:].strip()
+        if clause:
+            parts.append(clause)
+    return parts
+
+def split_text(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list[str]:
+    """
+    Split text into chunks of at most max_chars, breaking between sentences where possible
+    
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+    
+    Returns:
+        list: Chunks in reading order
+    """
+    text = text.strip()
+    if len(text) <= max_chars:
+        return [text] if text else []
+    
+    pieces = []
+    for sentence in SENTENCE_BOUNDARY.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence) > max_chars:
+            pieces.extend(_split_long_piece(sentence, max_chars))
+        else:
+            pieces.append(sentence)
+    
+    # Greedily pack sentences into as few chunks as possible
+    chunks = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + 1 + len(piece) > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+def _request_synthesis(text: str, lang_code: str, voice: str, engine: str, **options) -> dict:
+    """
+    Single SynthesizeSpeech call, falling back to the standard engine for voices without neural support.
+    Extra options (TextType, OutputFormat, SpeechMarkTypes) are passed through to Polly.
+    The response's AudioStream is left unread.
+    """
+    params = {
+        'Text': text,
+        'OutputFormat': 'mp3',
+        'VoiceId': voice,
+        'LanguageCode': lang_code,
+        **options
+    }
+    try:
+        response = polly_client.synthesize_speech(Engine=engine, **params)
+    except ClientError as e:
+        # If neural fails, try standard
+        if 'neural' in str(e).lower() and engine == 'neural':
+            logger.warning(f"Neural not available for {voice}, using standard")
+            response = polly_client.synthesize_speech(Engine='standard', **params)
+        else:
+            raise
+    return response
+
+def _synthesize(text: str, lang_code: str, voice: str, engine: str, **options) -> bytes:
+    """Single SynthesizeSpeech call returning the whole output"""
+    return _request_synthesis(text, lang_code, voice, engine, **options)['AudioStream'].read()
+
+def parse_speech_marks(data: bytes) -> list[dict]:
+    """Parse Polly's newline-delimited JSON speech marks"""
+    return [json.loads(line) for line in data.decode('utf-8').splitlines() if line.strip()]
+
 def generate_speech(text: str, language: str = 'en-US', voice_id: str = None, engine: str = 'neural') -> bytes:
     """
     Generate speech audio using AWS Polly
     
+    Text longer than MAX_CHUNK_CHARS is split at sentence boundaries, the chunks are
+    synthesized concurrently on a bounded pool and their MP3 frames joined into one stream.
+    
     Args:
         text: Text to convert to speech
         language: Language code (e.g., 'en-US', 'es', 'Spanish')
@@ -120,7 +253,7 @@ def generate_speech(text: str, language: str = 'en-US', voice_id: str = None, en
     Returns:
         bytes: Audio data in MP3 format
     """
-    if not AWS_ACCESS_KEY_ID or not AWS_SECRET_ACCESS_KEY:
+    if not credentials_configured():
         raise Exception("AWS credentials not configured for Polly")
     
     # Normalize language and get voice
@@ -128,32 +261,15 @@ def generate_speech(text: str, language: str = 'en-US', voice_id: str = None, en
     voice = voice_id or default_voice
     
     try:
-        # Check if voice supports neural engine
-        # Some voices only support standard
-        try:
-            response = polly_client.synthesize_speech(
-                Text=text,
-                OutputFormat='mp3',
-                VoiceId=voice,
-                LanguageCode=lang_code,
-                Engine=engine
-            )
-        except ClientError as e:
-            # If neural fails, try standard
-            if 'neural' in str(e).lower() and engine == 'neural':
-                logger.warning(f"Neural not available for {voice}, using standard")
-                response = polly_client.synthesize_speech(
-                    Text=text,
-                    OutputFormat='mp3',
-                    VoiceId=voice,
-                    LanguageCode=lang_code,
-                    Engine='standard'
-                )
-            else:
-                raise
+        chunks = split_text(text)
+        if len(chunks) <= 1:
+            audio_data = _synthesize(text, lang_code, voice, engine)
+        else:
+            # map() keeps reading order regardless of which chunk finishes first
+            parts = list(synthesis_pool.map(lambda chunk: _synthesize(chunk, lang_code, voice, engine), chunks))
+            audio_data = mp3_utils.concat(parts)
         
-        audio_data = response['AudioStream'].read()
-        logger.info(f"Generated {len(audio_data)} bytes of audio for language {lang_code} using voice {voice}")
+        logger.info(f"Generated {len(audio_data)} bytes of audio for language {lang_code} using voice {voice} ({len(chunks)} chunk(s))")
         return audio_data
         
     except ClientError as e:
@@ -165,6 +281,342 @@ def generate_speech(text: str, language: str = 'en-US', voice_id: str = None, en
         logger.error(error_msg)
         raise Exception(error_msg)
 
+def _synthesize_with_marks(text: str, lang_code: str, voice: str, engine: str) -> tuple[bytes, list[dict]]:
+    """Audio plus word/sentence speech marks for one chunk of text (two Polly calls)"""
+    audio_data = _synthesize(text, lang_code, voice, engine)
+    marks_data = _synthesize(text, lang_code, voice, engine, OutputFormat='json', SpeechMarkTypes=TIMING_MARK_TYPES)
+    return audio_data, parse_speech_marks(marks_data)
+
+def _join_marked_chunks(results: list[tuple[bytes, list[dict]]]) -> tuple[bytes, list[dict]]:
+    """Join chunk audio in order, shifting mark times by the duration of the preceding chunks"""
+    marks = []
+    offset_ms = 0
+    for audio_part, part_marks in results:
+        marks += [{**mark, "time": mark["time"] + offset_ms} for mark in part_marks]
+        offset_ms += mp3_utils.duration_ms(audio_part)
+    audio_data = results[0][0] if len(results) == 1 else mp3_utils.concat([audio for audio, _ in results])
+    return audio_data, marks
+
+def generate_speech_with_marks(text: str, language: str = 'en-US', voice_id: str = None, engine: str = 'neural') -> tuple[bytes, list[dict]]:
+    """
+    Generate speech audio plus word and sentence speech marks using AWS Polly
+    
+    Long text is chunked exactly like generate_speech; mark times are shifted by the
+    duration of the preceding chunks so they line up with the joined audio.
+    
+    Args:
+        text: Text to convert to speech
+        language: Language code (e.g., 'en-US', 'es', 'Spanish')
+        voice_id: Specific voice ID (optional, auto-selected if not provided)
+        engine: 'neural' (better quality) or 'standard' (cheaper)
+    
+    Returns:
+        tuple: (MP3 bytes, speech marks as [{"time", "type", "start", "end", "value"}])
+    """
+    if not credentials_configured():
+        raise Exception("AWS credentials not configured for Polly")
+    
+    lang_code, default_voice = normalize_language_code(language)
+    voice = voice_id or default_voice
+    
+    try:
+        chunks = split_text(text) or [text]
+        results = list(synthesis_pool.map(lambda chunk: _synthesize_with_marks(chunk, lang_code, voice, engine), chunks))
+        audio_data, marks = _join_marked_chunks(results)
+        
+        logger.info(f"Generated {len(audio_data)} bytes of audio and {len(marks)} speech marks for language {lang_code} using voice {voice}")
+        return audio_data, marks
+        
+    except ClientError as e:
+        error_msg = f"AWS Polly error: {str(e)}"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+    except Exception as e:
+        error_msg = f"Error generating speech: {str(e)}"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+
+class SpeechStream:
+    """
+    Streaming variant of generate_speech_with_marks
+    
+    Iterating yields MP3 data as it is read from Polly, so a caller can pipe it into
+    storage without holding the file in memory. At most SYNTHESIS_CONCURRENCY chunk
+    responses are open at once; only the chunk being read is transferred, the others
+    wait unread on their connections. Once iteration finishes, `marks` holds the speech
+    marks (shifted onto the joined audio) and `duration_ms` the total playing time.
+    
+    Args:
+        text: Text to convert to speech
+        language: Language code (e.g., 'en-US', 'es', 'Spanish')
+        voice_id: Specific voice ID (optional, auto-selected if not provided)
+        engine: 'neural' (better quality) or 'standard' (cheaper)
+        sample_rate: Output sample rate in Hz (optional, Polly's default for the engine otherwise)
+    """
+    def __init__(self, text: str, language: str = 'en-US', voice_id: str = None, engine: str = 'neural',
+                 sample_rate: int = None):
+        if not credentials_configured():
+            raise Exception("AWS credentials not configured for Polly")
+        self.lang_code, default_voice = normalize_language_code(language)
+        self.voice = voice_id or default_voice
+        self.engine = engine
+        self.audio_options = {'SampleRate': str(sample_rate)} if sample_rate else {}
+        self.chunks = split_text(text) or [text]
+        self.marks = []
+        self.frames = mp3_utils.FrameStream()
+    
+    @property
+    def duration_ms(self) -> int:
+        return self.frames.duration_ms
+    
+    def _start_chunk(self, chunk: str):
+        marks_data = _synthesize(chunk, self.lang_code, self.voice, self.engine,
+                                 OutputFormat='json', SpeechMarkTypes=TIMING_MARK_TYPES)
+        response = _request_synthesis(chunk, self.lang_code, self.voice, self.engine, **self.audio_options)
+        return response['AudioStream'], parse_speech_marks(marks_data)
+    
+    def __iter__(self):
+        pending = deque()
+        remaining = iter(self.chunks)
+        
+        def submit_next():
+            chunk = next(remaining, None)
+            if chunk is not None:
+                pending.append(synthesis_pool.submit(self._start_chunk, chunk))
+        
+        try:
+            for _ in range(SYNTHESIS_CONCURRENCY):
+                submit_next()
+            while pending:
+                stream, chunk_marks = pending.popleft().result()
+                submit_next()
+                offset_ms = self.frames.duration_ms
+                self.marks += [{**mark, "time": mark["time"] + offset_ms} for mark in chunk_marks]
+                self.frames.reset()
+                try:
+                    for block in stream.iter_chunks(STREAM_READ_SIZE):
+                        data = self.frames.feed(block)
+                        if data:
+                            yield data
+                finally:
+                    stream.close()
+            logger.info(f"Streamed {self.duration_ms}ms of audio and {len(self.marks)} speech marks for language {self.lang_code} using voice {self.voice} ({len(self.chunks)} chunk(s))")
+        except ClientError as e:
+            error_msg = f"AWS Polly error: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+        finally:
+            # Release connections held by chunks that will not be read
+            for future in pending:
+                if not future.cancel():
+                    try:
+                        future.result()[0].close()
+                    except Exception:
+                        pass
+
+def _ssml_fragment(position: int, text: str) -> str:
+    """A text as it appears in a batch request, preceded by the mark of its position in the batch"""
+    return f'<mark name="s{position}"/>{escape(text, {chr(34): "&quot;", chr(39): "&apos;"})}'
+
+def _batch_ssml(texts: list[str]) -> str:
+    return "<speak>" + BATCH_BREAK.join(_ssml_fragment(i, text) for i, text in enumerate(texts)) + "</speak>"
+
+def _pack_batches(texts: list[str], max_chars: int, max_ssml_chars: int = SSML_MAX_CHARS) -> list[list[int]]:
+    """
+    Group text indexes into batches whose combined text stays under max_chars and whose
+    rendered SSML (see _batch_ssml) stays under max_ssml_chars
+    """
+    empty_ssml = len("<speak></speak>")
+    batches = []
+    current, size, ssml_size = [], 0, empty_ssml
+    for index, text in enumerate(texts):
+        added = len(_ssml_fragment(len(current), text)) + (len(BATCH_BREAK) if current else 0)
+        if current and (size + len(text) > max_chars or ssml_size + added > max_ssml_chars):
+            batches.append(current)
+            current, size, ssml_size = [], 0, empty_ssml
+            added = len(_ssml_fragment(0, text))
+        current.append(index)
+        size += len(text)
+        ssml_size += added
+    if current:
+        batches.append(current)
+    return batches
+
+def _synthesize_ssml_batch(texts: list[str], lang_code: str, voice: str, engine: str) -> list[tuple[bytes, list[dict]]]:
+    """Synthesize several texts in one SSML request and cut the audio (and timing marks) at the <mark> timestamps"""
+    ssml = _batch_ssml(texts)
+    
+    audio_data = _synthesize(ssml, lang_code, voice, engine, TextType='ssml')
+    marks = parse_speech_marks(_synthesize(ssml, lang_code, voice, engine, TextType='ssml',
+                                           OutputFormat='json', SpeechMarkTypes=['ssml', *TIMING_MARK_TYPES]))
+    mark_times = {mark['value']: mark['time'] for mark in marks if mark['type'] == 'ssml'}
+    if len(mark_times) != len(texts):
+        raise Exception(f"Expected {len(texts)} speech marks, got {len(mark_times)}")
+    
+    # Cut in the middle of the pause between texts so each clip keeps a little silence at both ends
+    boundaries = [max(mark_times[f"s{i}"] - BATCH_BREAK_MS / 2, 0) for i in range(1, len(texts))]
+    clips = mp3_utils.split(audio_data, boundaries)
+    
+    # Hand each clip the word/sentence marks that fall inside it, re-based to the clip start
+    results = []
+    clip_start = 0
+    for index, clip in enumerate(clips):
+        clip_end = boundaries[index] if index < len(boundaries) else float('inf')
+        clip_marks = [
+            {**mark, "time": max(mark["time"] - clip_start, 0)}
+            for mark in marks
+            if mark['type'] in TIMING_MARK_TYPES and clip_start <= mark["time"] < clip_end
+        ]
+        results.append((clip, clip_marks))
+        clip_start += mp3_utils.duration_ms(clip)
+    return results
+
+def synthesize_batch(texts: list[str], language: str = 'en-US', voice_id: str = None,
+                     engine: str = 'neural') -> Iterator[tuple[list[int], list[tuple[bytes, list[dict]]]]]:
+    """
+    Generate speech for many short texts with as few Polly requests as possible
+    
+    Texts are packed into SSML requests of up to BATCH_MAX_CHARS characters of text (and
+    SSML_MAX_CHARS of rendered SSML), each text preceded by a <mark>. The audio is split at the speech mark timestamps into one MP3 per text, and the
+    word/sentence marks requested in the same call are distributed to the clips.
+    Texts that do not fit a batch on their own are chunked like generate_speech_with_marks.
+    All requests share synthesis_pool; results are yielded as soon as each batch (or long text) is done,
+    so callers can store them while the rest is still being synthesized.
+    
+    Args:
+        texts: Texts to convert to speech
+        language: Language code (e.g., 'en-US', 'es', 'Spanish')
+        voice_id: Specific voice ID (optional, auto-selected if not provided)
+        engine: 'neural' (better quality) or 'standard' (cheaper)
+    
+    Yields:
+        tuple: (indexes into texts, (MP3 bytes, speech marks) for each of them), in completion order
+    """
+    if not credentials_configured():
+        raise Exception("AWS credentials not configured for Polly")
+    
+    lang_code, default_voice = normalize_language_code(language)
+    voice = voice_id or default_voice
+    
+    long_indexes = [i for i, text in enumerate(texts) if len(text) > BATCH_MAX_CHARS]
+    short_indexes = [i for i, text in enumerate(texts) if len(text) <= BATCH_MAX_CHARS]
+    batches = [[short_indexes[i] for i in batch]
+               for batch in _pack_batches([texts[i] for i in short_indexes], BATCH_MAX_CHARS)]
+    
+    def run_batch(batch: list[int]) -> list[tuple[bytes, list[dict]]]:
+        if len(batch) == 1:
+            return [_synthesize_with_marks(texts[batch[0]], lang_code, voice, engine)]
+        try:
+            return _synthesize_ssml_batch([texts[i] for i in batch], lang_code, voice, engine)
+        except Exception as e:
+            # Marks did not line up (or SSML was rejected) - fall back to one request per text
+            logger.warning(f"SSML batch of {len(batch)} failed, synthesizing individually: {e}")
+            return [_synthesize_with_marks(texts[i], lang_code, voice, engine) for i in batch]
+    
+    batch_futures = {synthesis_pool.submit(run_batch, batch): batch for batch in batches}
+    # Long texts are submitted chunk by chunk rather than through generate_speech_with_marks,
+    # whose own synthesis_pool.map would block a pool worker waiting on the same pool
+    chunk_futures = {}
+    long_parts = {}
+    for index in long_indexes:
+        chunks = split_text(texts[index]) or [texts[index]]
+        long_parts[index] = [None] * len(chunks)
+        for position, chunk in enumerate(chunks):
+            chunk_futures[synthesis_pool.submit(_synthesize_with_marks, chunk, lang_code, voice, engine)] = (index, position)
+    
+    try:
+        for future in as_completed([*batch_futures, *chunk_futures]):
+            if future in batch_futures:
+                yield batch_futures[future], future.result()
+                continue
+            index, position = chunk_futures[future]
+            long_parts[index][position] = future.result()
+            if all(part is not None for part in long_parts[index]):
+                yield [index], [_join_marked_chunks(long_parts.pop(index))]
+    except ClientError as e:
+        error_msg = f"AWS Polly error: {str(e)}"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+    finally:
+        # Nothing left to wait for once the caller stops early or a request failed
+        for future in [*batch_futures, *chunk_futures]:
+            future.cancel()
+    
+    logger.info(f"Generated audio for {len(texts)} texts in {len(batches)} batch(es) for language {lang_code} using voice {voice}")
+
+def start_long_form_synthesis(text: str, output_bucket: str, output_prefix: str, language: str = 'en-US',
+                              voice_id: str = None, engine: str = 'neural') -> dict:
+    """
+    Start asynchronous synthesis tasks that write the audio (and its speech marks)
+    straight to S3, for text too long to synthesize inside a request
+    
+    Polly names the output objects {output_prefix}{TaskId}.mp3 and {output_prefix}{TaskId}.marks.
+    
+    Args:
+        text: Text to convert to speech (up to LONG_FORM_MAX_CHARS)
+        output_bucket: S3 bucket the tasks write to
+        output_prefix: Key prefix for the output objects
+        language: Language code (e.g., 'en-US', 'es', 'Spanish')
+        voice_id: Specific voice ID (optional, auto-selected if not provided)
+        engine: 'neural' (better quality) or 'standard' (cheaper)
+    
+    Returns:
+        dict: {"audio_task_id", "marks_task_id", "voice", "lang_code"}
+    """
+    if not credentials_configured():
+        raise Exception("AWS credentials not configured for Polly")
+    if len(text) > LONG_FORM_MAX_CHARS:
+        raise Exception(f"Text is too long for a synthesis task ({len(text)} > {LONG_FORM_MAX_CHARS} characters)")
+    
+    lang_code, default_voice = normalize_language_code(language)
+    voice = voice_id or default_voice
+    params = {
+        'Text': text,
+        'VoiceId': voice,
+        'LanguageCode': lang_code,
+        'OutputS3BucketName': output_bucket,
+        'OutputS3KeyPrefix': output_prefix,
+    }
+    
+    def start(**options):
+        try:
+            return polly_client.start_speech_synthesis_task(Engine=engine, **params, **options)
+        except ClientError as e:
+            if 'neural' in str(e).lower() and engine == 'neural':
+                logger.warning(f"Neural not available for {voice}, using standard")
+                return polly_client.start_speech_synthesis_task(Engine='standard', **params, **options)
+            raise
+    
+    try:
+        audio_task = start(OutputFormat='mp3')['SynthesisTask']
+        marks_task = start(OutputFormat='json', SpeechMarkTypes=TIMING_MARK_TYPES)['SynthesisTask']
+    except ClientError as e:
+        error_msg = f"AWS Polly error: {str(e)}"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+    
+    logger.info(f"Started synthesis tasks {audio_task['TaskId']} / {marks_task['TaskId']} ({len(text)} chars, voice {voice})")
+    return {
+        "audio_task_id": audio_task['TaskId'],
+        "marks_task_id": marks_task['TaskId'],
+        "voice": voice,
+        "lang_code": lang_code,
+    }
+
+def get_synthesis_task(task_id: str) -> dict:
+    """
+    Current state of a synthesis task
+    
+    Returns:
+        dict: {"status": "scheduled" | "inProgress" | "completed" | "failed", "output_uri", "reason"}
+    """
+    task = polly_client.get_speech_synthesis_task(TaskId=task_id)['SynthesisTask']
+    return {
+        "status": task['TaskStatus'],
+        "output_uri": task.get('OutputUri'),
+        "reason": task.get('TaskStatusReason'),
+    }
+
 def get_available_voices(language_code: str = None):
     """
     Get list of available voices for a language
@@ -0,0 +1,281 @@
+"""
+Storage Reconciliation Service
+Finds stored files no record points at (orphaned objects) and records pointing at files that
+are gone (dangling references) by merging two key-sorted streams - the bucket or upload
+directory listing and the file keys referenced from Mongo - so memory stays bounded however
+many objects there are. Fixes are applied in bulk batches.
+"""
+import os
+import re
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import AsyncIterator
+
+from pymongo import DeleteOne, UpdateOne
+
+import s3_service
+from counter_service import SECTION_COUNTERS
+
+logger = logging.getLogger(__name__)
+
+# Bucket prefixes holding media (listings are concatenated in prefix order, so none may contain another)
+RECONCILE_PREFIXES = sorted(filter(None, os.getenv("RECONCILE_PREFIXES", "audio/,media/,videos/").split(",")))
+# Unreferenced files younger than this may belong to an upload or synthesis task that is not recorded yet
+ORPHAN_MIN_AGE_HOURS = float(os.getenv("ORPHAN_MIN_AGE_HOURS", "24"))
+FIX_BATCH_SIZE = 1000
+SAMPLE_SIZE = 100
+
+# File references of each media collection: (reference name, path field, url field).
+# A url starting with "/" is a file in local storage, anything else an S3 object.
+FILE_REFERENCES = {
+    "videos": [("file", "file_path", "video_url"), ("poster", "poster_path", "poster_url"),
+               ("sprite", "sprite_path", "sprite_url")],
+    "audios": [("file", "file_path", "audio_url"), ("vtt", "vtt_path", "vtt_url")],
+    "narrations": [("file", "file_path", "audio_url")],
+}
+# Collections whose records list more files in a renditions array
+RENDITION_COLLECTIONS = {"audios"}
+# A missing derived file is cleared from its record; a missing main file removes the record
+DERIVED_FIELDS = {
+    "poster": {"poster_url": None, "poster_path": None},
+    "sprite": {"sprite_url": None, "sprite_path": None, "sprite": None},
+    "vtt": {"vtt_url": None, "vtt_path": None},
+}
+
+def _reference_stages(collection: str, local: bool, key_pattern: str, created_before: str) -> list:
+    """Aggregation stages turning a collection's records into one {key, field, collection, id, section_id} per file"""
+    files = [{"field": name, "key": f"${path}", "url": f"${url}"} for name, path, url in FILE_REFERENCES[collection]]
+    if collection in RENDITION_COLLECTIONS:
+        files = {"$concatArrays": [files, {"$map": {
+            "input": {"$ifNull": ["$renditions", []]},
+            "as": "rendition",
+            "in": {"field": "rendition", "key": "$$rendition.file_path", "url": "$$rendition.audio_url"},
+        }}]}
+    return [
+        # Records created while reconciling may point at files the listing has already passed.
+        # $not $gte rather than $lt: Mongo never compares strings with dates, and a record whose
+        # created_at is a BSON date or missing must still count as a reference or its files look orphaned
+        {"$match": {"created_at": {"$not": {"$gte": created_before}}}},
+        {"$project": {"_id": 0, "id": 1, "section_id": 1, "files": files}},
+        {"$unwind": "$files"},
+        {"$match": {
+            "files.key": {"$regex": key_pattern},
+            "files.url": {"$regex": "^/"} if local else {"$not": re.compile("^/")},
+        }},
+        {"$project": {"key": "$files.key", "field": "$files.field", "id": 1, "section_id": 1,
+                      "collection": {"$literal": collection}}},
+    ]
+
+def _references(db, local: bool, key_pattern: str, created_before: str) -> AsyncIterator[dict]:
+    """Every file reference from videos, audios and narrations, sorted by key (spills to disk on the server)"""
+    collections = list(FILE_REFERENCES)
+    pipeline = _reference_stages(collections[0], local, key_pattern, created_before)
+    for collection in collections[1:]:
+        pipeline.append({"$unionWith": {
+            "coll": collection,
+            "pipeline": _reference_stages(collection, local, key_pattern, created_before),
+        }})
+    pipeline.append({"$sort": {"key": 1}})
+    return aiter(db[collections[0]].aggregate(pipeline, allowDiskUse=True))
+
+async def _bucket_listing(prefixes: list) -> AsyncIterator[tuple]:
+    """(key, last_modified, size) for every object under the prefixes, in key order"""
+    for prefix in prefixes:
+        pages = s3_service.list_object_pages(prefix)
+        while True:
+            page = await asyncio.to_thread(next, pages, None)
+            if page is None:
+                break
+            for obj in page:
+                yield obj["Key"], obj["LastModified"], obj["Size"]
+
+async def _local_listing(upload_dir: Path) -> AsyncIterator[tuple]:
+    """(path, modified, size) for every file in local storage, in path order"""
+    def scan():
+        # Local storage is only the fallback when S3 fails, so it is small enough to sort in memory
+        files = []
+        for path in upload_dir.rglob("*"):
+            if path.is_file():
+                stat = path.stat()
+                files.append((str(path), datetime.fromtimestamp(stat.st_mtime, timezone.utc), stat.st_size))
+        return sorted(files)
+    for item in await asyncio.to_thread(scan):
+        yield item
+
+async def _diff(stored: AsyncIterator[tuple], referenced: AsyncIterator[dict]) -> AsyncIterator[tuple]:
+    """
+    Sorted merge of stored files against references.
+    Yields ("orphan", (key, modified, size)) and ("dangling", reference).
+    """
+    obj = await anext(stored, None)
+    ref = await anext(referenced, None)
+    while obj is not None or ref is not None:
+        if ref is None or (obj is not None and obj[0] < ref["key"]):
+            yield "orphan", obj
+            obj = await anext(stored, None)
+        elif obj is None or ref["key"] < obj[0]:
+            yield "dangling", ref
+            ref = await anext(referenced, None)
+        else:
+            # Stored and referenced, possibly by several records
+            key = obj[0]
+            while ref is not None and ref["key"] == key:
+                ref = await anext(referenced, None)
+            obj = await anext(stored, None)
+
+class _Reconciliation:
+    """Collects the differences for one storage backend and applies fixes in FIX_BATCH_SIZE batches"""
+
+    def __init__(self, db, local: bool, dry_run: bool, orphaned_before: datetime):
+        self.db = db
+        self.local = local
+        self.dry_run = dry_run
+        self.orphaned_before = orphaned_before
+        self.orphan_keys = []
+        self.record_ops = {collection: [] for collection in FILE_REFERENCES}
+        self.counter_ops = []
+        self.report = {
+            "orphaned_objects": 0,
+            "orphaned_bytes": 0,
+            "recent_unreferenced": 0,
+            "deleted_objects": 0,
+            "failed_objects": [],
+            "dangling_records": 0,
+            "dangling_derived_files": 0,
+            "orphaned_sample": [],
+            "dangling_sample": [],
+        }
+
+    def _exists(self, key: str) -> bool:
+        return Path(key).exists() if self.local else s3_service.object_exists(key)
+
+    def _delete_objects(self, keys: list) -> tuple[int, list]:
+        if not self.local:
+            return s3_service.delete_objects(keys)
+        deleted, failed = 0, []
+        for key in keys:
+            try:
+                Path(key).unlink(missing_ok=True)
+                deleted += 1
+            except OSError as e:
+                logger.warning(f"Could not delete local file {key}: {e}")
+                failed.append(key)
+        return deleted, failed
+
+    async def orphan(self, key: str, modified: datetime, size: int):
+        if modified >= self.orphaned_before:
+            self.report["recent_unreferenced"] += 1
+            return
+        self.report["orphaned_objects"] += 1
+        self.report["orphaned_bytes"] += size
+        if len(self.report["orphaned_sample"]) < SAMPLE_SIZE:
+            self.report["orphaned_sample"].append(key)
+        if self.dry_run:
+            return
+        self.orphan_keys.append(key)
+        if len(self.orphan_keys) >= FIX_BATCH_SIZE:
+            await self._flush_objects()
+
+    async def dangling(self, ref: dict):
+        # The listing is not a snapshot - confirm the file is really gone before touching the record
+        if await asyncio.to_thread(self._exists, ref["key"]):
+            return
+        collection, field = ref["collection"], ref["field"]
+        if field == "file":
+            self.report["dangling_records"] += 1
+        else:
+            self.report["dangling_derived_files"] += 1
+        if len(self.report["dangling_sample"]) < SAMPLE_SIZE:
+            self.report["dangling_sample"].append({k: ref.get(k) for k in ("collection", "id", "field", "key")})
+        if self.dry_run:
+            return
+
+        if field == "file":
+            self.record_ops[collection].append(DeleteOne({"id": ref["id"]}))
+            if collection in SECTION_COUNTERS:
+                self.counter_ops.append(UpdateOne({"id": ref["section_id"]}, {"$inc": {SECTION_COUNTERS[collection]: -1}}))
+        elif field == "rendition":
+            self.record_ops[collection].append(UpdateOne({"id": ref["id"]}, {"$pull": {"renditions": {"file_path": ref["key"]}}}))
+        else:
+            self.record_ops[collection].append(UpdateOne({"id": ref["id"]}, {"$set": DERIVED_FIELDS[field]}))
+        if sum(map(len, self.record_ops.values())) >= FIX_BATCH_SIZE:
+            await self._flush_records()
+
+    async def _flush_objects(self):
+        if not self.orphan_keys:
+            return
+        deleted, failed = await asyncio.to_thread(self._delete_objects, self.orphan_keys)
+        if not self.local:
+            # Content-addressed objects must not be offered for deduplication once they are gone
+            await self.db.media_objects.delete_many({"file_key": {"$in": self.orphan_keys}})
+        self.report["deleted_objects"] += deleted
+        self.report["failed_objects"].extend(failed[:SAMPLE_SIZE - len(self.report["failed_objects"])])
+        self.orphan_keys = []
+
+    async def _flush_records(self):
+        for collection, ops in self.record_ops.items():
+            if ops:
+                await self.db[collection].bulk_write(ops, ordered=False)
+                self.record_ops[collection] = []
+        if self.counter_ops:
+            await self.db.sections.bulk_write(self.counter_ops, ordered=False)
+            self.counter_ops = []
+
+    async def run(self, stored: AsyncIterator[tuple], referenced: AsyncIterator[dict]) -> dict:
+        async for kind, item in _diff(stored, referenced):
+            if kind == "orphan":
+                await self.orphan(*item)
+            else:
+                await self.dangling(item)
+        await self._flush_objects()
+        await self._flush_records()
+        return self.report
+
+async def reconcile_storage(db, upload_dir: Path, dry_run: bool = False,
+                            min_age_hours: float = ORPHAN_MIN_AGE_HOURS) -> dict:
+    """
+    Reconcile S3 and local storage with the media records
+
+    Orphaned files older than min_age_hours are deleted. Records whose main file is missing are
+    deleted (and their section counters decremented); missing posters, sprites, captions and
+    renditions are cleared from their record.
+
+    Args:
+        db: Motor database
+        upload_dir: Local storage root (files served from /api/uploads)
+        dry_run: Only report what would be fixed
+        min_age_hours: Grace period before an unreferenced file counts as orphaned
+
+    Returns:
+        dict: {"s3": report, "local": report} (a backend that could not be listed reports {"error"})
+    """
+    started = datetime.now(timezone.utc)
+    created_before = started.isoformat()
+    orphaned_before = started - timedelta(hours=min_age_hours)
+
+    # Nested prefixes would break the key order of the concatenated listings (and list objects twice)
+    prefixes = []
+    for prefix in RECONCILE_PREFIXES:
+        if not any(prefix.startswith(outer) for outer in prefixes):
+            prefixes.append(prefix)
+
+    backends = {
+        "s3": (False, lambda: _bucket_listing(prefixes), "^(" + "|".join(map(re.escape, prefixes)) + ")"),
+        "local": (True, lambda: _local_listing(upload_dir), "^" + re.escape(str(upload_dir) + os.sep)),
+    }
+    result = {}
+    for name, (local, listing, key_pattern) in backends.items():
+        try:
+            reconciliation = _Reconciliation(db, local, dry_run, orphaned_before)
+            result[name] = await reconciliation.run(listing(), _references(db, local, key_pattern, created_before))
+        except Exception as e:
+            logger.error(f"Reconciling {name} storage failed: {e}", exc_info=True)
+            result[name] = {"error": str(e)}
+            continue
+        report = result[name]
+        logger.info(f"Reconciled {name} storage: {report['orphaned_objects']} orphaned objects, "
+                    f"{report['dangling_records']} dangling records, {report['dangling_derived_files']} missing derived files"
+                    f"{' (dry run)' if dry_run else ''}")
+    return result
@@ -5,6 +5,7 @@ import boto3
 from botocore.config import Config
 from botocore.exceptions import ClientError
 import os
+import hashlib
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -32,6 +33,12 @@ s3_client = boto3.client(
     config=s3_config
 )
 
+# Streaming uploads are sent in parts of this size (S3 minimum for all but the last part)
+MULTIPART_PART_SIZE = 5 * 1024 * 1024
+
+# DeleteObjects accepts at most 1,000 keys per request
+DELETE_BATCH_SIZE = 1000
+
 # File Upload Configuration
 ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv"}
 ALLOWED_AUDIO_EXTENSIONS = {".mp3", ".wav", ".flac", ".aac", ".m4a"}
@@ -135,3 +142,147 @@ def generate_presigned_url(file_key: str) -> str:
 def get_public_url(file_key: str) -> str:
     """Generate public URL for accessing an uploaded file"""
     return f"https://{S3_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com/{file_key}"
+
+def object_exists(file_key: str) -> bool:
+    """HEAD the object; False only if the bucket reports it missing"""
+    try:
+        s3_client.head_object(Bucket=S3_BUCKET_NAME, Key=file_key)
+        return True
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise
+
+def sha256_of_object(file_key: str) -> tuple[str, int]:
+    """
+    Hash an object by streaming it from the bucket
+    
+    Returns:
+        tuple: (hex SHA-256 digest, size in bytes)
+    """
+    body = s3_client.get_object(Bucket=S3_BUCKET_NAME, Key=file_key)["Body"]
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in body.iter_chunks(MULTIPART_PART_SIZE):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+def list_object_pages(prefix: str):
+    """
+    List the objects under a prefix, one ListObjectsV2 page (up to 1,000 objects) at a time
+    
+    Yields:
+        list: [{"Key", "LastModified", "Size", ...}] in ascending key order across pages
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=S3_BUCKET_NAME, Prefix=prefix):
+        contents = page.get("Contents", [])
+        if contents:
+            yield contents
+
+def delete_objects(file_keys: list[str]) -> tuple[int, list[str]]:
+    """
+    Delete objects from the bucket in DELETE_BATCH_SIZE batches
+    
+    Args:
+        file_keys: S3 object keys (missing keys count as deleted)
+    
+    Returns:
+        tuple: (number of keys deleted, keys that could not be deleted)
+    """
+    deleted = 0
+    failed = []
+    for start in range(0, len(file_keys), DELETE_BATCH_SIZE):
+        batch = file_keys[start:start + DELETE_BATCH_SIZE]
+        try:
+            response = s3_client.delete_objects(
+                Bucket=S3_BUCKET_NAME,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+            )
+        except ClientError as e:
+            print(f"Error deleting {len(batch)} objects: {e}")
+            failed.extend(batch)
+            continue
+        # Quiet mode only reports the keys that failed
+        errors = [error["Key"] for error in response.get("Errors", [])]
+        failed.extend(errors)
+        deleted += len(batch) - len(errors)
+    return deleted, failed
+
+class MultipartUploadWriter:
+    """
+    Upload a stream of bytes to S3 without holding the whole object in memory.
+    At most one part is buffered; objects smaller than a part are sent with a single put_object.
+    """
+    def __init__(self, file_key: str, content_type: str, part_size: int = MULTIPART_PART_SIZE):
+        self.file_key = file_key
+        self.content_type = content_type
+        self.part_size = part_size
+        self.buffer = bytearray()
+        self.upload_id = None
+        self.parts = []
+        self.size = 0
+
+    @property
+    def parts_uploaded(self) -> int:
+        return len(self.parts)
+
+    def pending(self) -> bytes:
+        """Data received but not yet sent to S3"""
+        return bytes(self.buffer)
+
+    def write(self, data: bytes):
+        self.buffer += data
+        self.size += len(data)
+        while len(self.buffer) >= self.part_size:
+            self._upload_part(bytes(self.buffer[:self.part_size]))
+            del self.buffer[:self.part_size]
+
+    def _upload_part(self, body: bytes):
+        if self.upload_id is None:
+            response = s3_client.create_multipart_upload(
+                Bucket=S3_BUCKET_NAME,
+                Key=self.file_key,
+                ContentType=self.content_type
+            )
+            self.upload_id = response["UploadId"]
+        part_number = len(self.parts) + 1
+        response = s3_client.upload_part(
+            Bucket=S3_BUCKET_NAME,
+            Key=self.file_key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=body
+        )
+        self.parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    def close(self):
+        """Send the remaining data and finish the object"""
+        if self.upload_id is None:
+            s3_client.put_object(
+                Bucket=S3_BUCKET_NAME,
+                Key=self.file_key,
+                Body=bytes(self.buffer),
+                ContentType=self.content_type
+            )
+        else:
+            if self.buffer:
+                self._upload_part(bytes(self.buffer))
+            s3_client.complete_multipart_upload(
+                Bucket=S3_BUCKET_NAME,
+                Key=self.file_key,
+                UploadId=self.upload_id,
+                MultipartUpload={"Parts": self.parts}
+            )
+        self.buffer.clear()
+
+    def abort(self):
+        """Discard an unfinished multipart upload (no-op for small objects)"""
+        if self.upload_id is None:
+            return
+        try:
+            s3_client.abort_multipart_upload(Bucket=S3_BUCKET_NAME, Key=self.file_key, UploadId=self.upload_id)
+        except ClientError as e:
+            print(f"Error aborting multipart upload for {self.file_key}: {e}")
+        self.upload_id = None
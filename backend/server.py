@@ -1,21 +1,31 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, Form, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, Form, Query, Response, status, BackgroundTasks
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from bson import ObjectId
+from bson.errors import InvalidId
 import os
+import re
+import json
+import base64
 import logging
+from collections import Counter
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional
+from typing import AsyncIterator, Iterator, List, Optional
+from urllib.parse import urlparse, unquote
 import uuid
+import hashlib
+import tempfile
+import shutil
 from datetime import datetime, timezone, timedelta
-import bcrypt
 import jwt
 import aiofiles
 from bs4 import BeautifulSoup
 import requests
-import httpx
 import asyncio
 
 # IMPORTANT: Load .env BEFORE importing services so credentials are available
@@ -26,6 +36,19 @@ load_dotenv(ROOT_DIR / '.env')
 import s3_service
 import polly_service
 import translate_service
+import media_service
+import openai_tts_service
+import timing_service
+import narration_service
+import language_service
+import reconcile_service
+import migration_service
+import counter_service
+import url_service
+import widget_cache
+import auth_cache
+import password_service
+import mp3_utils
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
@@ -63,9 +86,107 @@ async def check_website_access(website_id: str, user_id: str) -> bool:
     
     return False
 
+# Helper to turn a stored media reference into a playable URL
+def sign_media_url(url: Optional[str], key: Optional[str] = None) -> Optional[str]:
+    """Sign S3 objects for viewing; locally served files (/api/uploads/...) are returned as-is"""
+    if not url or url.startswith("/"):
+        return url
+    if not key and 'amazonaws.com' in url:
+        key = url.split('.amazonaws.com/')[-1]
+    return s3_service.generate_presigned_url(key) if key else url
+
+def sign_video_urls(video: dict) -> dict:
+    """Sign the video URL and its poster/sprite previews in place"""
+    if video.get('video_url'):
+        video['video_url'] = sign_media_url(video['video_url'], video.get('file_path'))
+    for preview in ('poster', 'sprite'):
+        if video.get(f'{preview}_url'):
+            video[f'{preview}_url'] = sign_media_url(video[f'{preview}_url'], video.get(f'{preview}_path'))
+    return video
+
+def sign_audio_urls(audio: dict) -> dict:
+    """Sign the audio URL and its compact renditions in place"""
+    if audio.get('audio_url'):
+        audio['audio_url'] = sign_media_url(audio['audio_url'], audio.get('file_path'))
+    for rendition in audio.get('renditions') or []:
+        rendition['audio_url'] = sign_media_url(rendition['audio_url'], rendition.get('file_path'))
+    if audio.get('vtt_url'):
+        audio['vtt_url'] = sign_media_url(audio['vtt_url'], audio.get('vtt_path'))
+    return audio
+
+def section_text(section: dict) -> str:
+    return section.get("text_content") or section.get("selected_text") or ""
+
+def content_hash(text: str) -> str:
+    """SHA-256 of section text - lets derived audio/translations tell when they are out of date"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+# List pagination - results come back in index order, and the position after the last
+# one is returned in the X-Next-Cursor header (absent on the last page)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def list_projection(model: type[BaseModel], fields: Optional[str]) -> dict:
+    """Mongo projection for a comma-separated list of the model's fields (all of them if fields is empty)"""
+    allowed = set(model.model_fields)
+    requested = {name.strip() for name in (fields or "").split(",") if name.strip()} or allowed
+    unknown = requested - allowed
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return {name: 1 for name in requested | {"id"}}
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps([str(value) if isinstance(value, ObjectId) else value for value in values])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, sort_keys: tuple) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(sort_keys):
+            raise ValueError("cursor does not match the sort keys")
+        values[-1] = ObjectId(values[-1])
+    except (ValueError, TypeError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+async def find_page(collection, query: dict, projection: dict, response: Response, limit: int,
+                    cursor: Optional[str] = None, sort_keys: tuple = ("_id",)) -> list:
+    """
+    One page of a keyset-paginated listing, setting the next page's cursor on the response
+
+    Args:
+        collection: Motor collection
+        query: Filter (an index on its fields followed by sort_keys keeps pages cheap)
+        projection: Fields to return
+        response: Response to set the X-Next-Cursor header on
+        limit: Page size
+        cursor: X-Next-Cursor value from the previous page
+        sort_keys: Ascending sort order, ending with _id so every position is unique
+
+    Returns:
+        list: Documents with the projected fields
+    """
+    if cursor:
+        after = decode_cursor(cursor, sort_keys)
+        # Strictly after the cursor: (k1 > v1) or (k1 = v1 and k2 > v2) or ...
+        query = {"$and": [query, {"$or": [
+            {**dict(zip(sort_keys[:i], after[:i])), key: {"$gt": after[i]}}
+            for i, key in enumerate(sort_keys)
+        ]}]}
+    docs = await collection.find(query, {**projection, **{key: 1 for key in sort_keys}}) \
+        .sort([(key, 1) for key in sort_keys]).limit(limit + 1).to_list(limit + 1)
+    if len(docs) > limit:
+        docs = docs[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor([docs[-1].get(key) for key in sort_keys])
+    for doc in docs:
+        for key in sort_keys:
+            if key not in projection:
+                doc.pop(key, None)
+    return docs
+
 # Initialize OpenAI TTS
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
+if not openai_tts_service.OPENAI_API_KEY:
     raise RuntimeError("Missing OPENAI_API_KEY environment variable for TTS")
 
 # Create the main app
@@ -99,6 +220,11 @@ class Token(BaseModel):
     token_type: str = "bearer"
     user: User
 
+class UrlRules(BaseModel):
+    """Per-site URL canonicalization rules (see url_service.canonicalize)"""
+    ignored_params: List[str] = []  # query parameters that do not change the page, "prefix*" allowed
+    path_aliases: dict[str, str] = {}  # alias path -> canonical path, e.g. {"/home": "/"}
+
 class Website(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -107,6 +233,8 @@ class Website(BaseModel):
     url: str
     embed_code: str = ""
     image_url: Optional[str] = None
+    pages_count: int = 0
+    url_rules: UrlRules = Field(default_factory=UrlRules)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class WebsiteCreate(BaseModel):
@@ -118,6 +246,7 @@ class Page(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     website_id: str
     url: str
+    url_hash: Optional[str] = None  # url_service.url_hash of url with the website's rules
     status: str = "Not Setup"  # Not Setup, Active, Inactive
     sections_count: int = 0
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -135,6 +264,9 @@ class Section(BaseModel):
     status: str = "Not Setup"  # Not Setup, Needs Review, Active
     videos_count: int = 0
     audios_count: int = 0
+    content_hash: Optional[str] = None  # Hash of the section text; derived audio/translations record the one they were built from
+    detected_language: Optional[str] = None  # Translate code detected from the section text
+    detected_language_hash: Optional[str] = None  # Hash of the text the detection was made on
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class SectionCreate(BaseModel):
@@ -152,6 +284,12 @@ class Video(BaseModel):
     language: str  # ASL, LSM, BSL, etc.
     video_url: str
     file_path: str
+    poster_url: Optional[str] = None
+    poster_path: Optional[str] = None
+    sprite_url: Optional[str] = None
+    sprite_path: Optional[str] = None
+    sprite: Optional[dict] = None  # {"columns", "rows", "interval", "tile_width", "tile_height"}
+    content_sha256: Optional[str] = None  # Set when file_path is a shared media object
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class Audio(BaseModel):
@@ -162,6 +300,14 @@ class Audio(BaseModel):
     audio_url: str
     file_path: str
     captions: Optional[str] = None
+    renditions: List[dict] = []  # Compact transcodes: [{"format", "content_type", "audio_url", "file_path", "size"}]
+    timing: Optional[dict] = None  # {"duration", "words": [[ms, start, end]], "sentences": [[ms, start, end]]}
+    vtt_url: Optional[str] = None
+    vtt_path: Optional[str] = None
+    source_hash: Optional[str] = None  # Section content_hash the audio was generated from (None for uploads)
+    provider: Optional[str] = None  # polly / openai for generated audio
+    voice: Optional[str] = None
+    content_sha256: Optional[str] = None  # Set when file_path is a shared media object
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class SectionOrderUpdate(BaseModel):
@@ -176,11 +322,26 @@ class UploadUrlRequest(BaseModel):
     filename: str
     content_type: str = "video/mp4"
     file_size: int = 0  # File size in bytes (optional, for validation)
+    content_sha256: Optional[str] = None  # Hex SHA-256 of the file - enables deduplicated storage
 
 class ConfirmUploadRequest(BaseModel):
     file_key: str
     public_url: str
     language: str = "American Sign Language"
+    content_sha256: Optional[str] = None  # Must match the uploaded bytes (verified on first upload)
+
+class MediaObject(BaseModel):
+    """One stored copy of an uploaded file, shared by every video/audio of a website with the same content"""
+    model_config = ConfigDict(extra="ignore")
+    id: str  # {website_id}/{sha256} - content is only shared within a website
+    website_id: str
+    content_sha256: str
+    file_key: str  # media/objects/{website_id}/{sha256}.{ext}
+    public_url: str
+    content_type: str
+    size: int
+    ref_count: int = 0  # Video/Audio records pointing at file_key
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class TextTranslation(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -189,8 +350,16 @@ class TextTranslation(BaseModel):
     language: str  # Spanish, Chinese, French, etc.
     language_code: str  # ES, ZH, FR, etc.
     text_content: str
+    source_hash: Optional[str] = None  # Section content_hash the translation was generated from (None if written by hand)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class SectionFull(BaseModel):
+    """A section with its media and translations, for the section detail page"""
+    section: Section
+    videos: List[Video]
+    audios: List[Audio]
+    translations: List[TextTranslation]
+
 class Analytics(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -200,26 +369,67 @@ class Analytics(BaseModel):
     interactions: int = 0
     date: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class Narration(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    page_id: str
+    language: str
+    audio_url: str
+    file_path: str
+    duration_ms: int
+    chapters: List[dict] = []  # [{"section_id", "audio_id", "start_ms", "duration_ms"}] in reading order
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class SectionCoverage(Section):
+    # {"videos": {"count", "languages"}, "audios": {"count", "languages", "stale"}, "translations": {"count", "languages", "stale"}}
+    coverage: dict
+
+class PageOverview(BaseModel):
+    """A page with coverage summaries for all its sections, for the page editor"""
+    page: Page
+    sections: List[SectionCoverage]
+    narrations: List[Narration]
+
+class Job(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    type: str  # long_form_audio, ...
+    status: str = "queued"  # queued, running, succeeded, failed
+    website_id: Optional[str] = None
+    created_by: str
+    params: dict = {}
+    progress: dict = {}
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
 # Auth utilities
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+PASSWORD_BUSY_RETRY_SECONDS = "2"
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+def password_service_busy(e: password_service.PasswordServiceBusy) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": PASSWORD_BUSY_RETRY_SECONDS})
 
 def create_access_token(user_id: str) -> str:
     expire = datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION)
     to_encode = {"sub": user_id, "exp": expire}
     return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
+def decode_access_token(token: str) -> dict:
+    return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+
+async def load_user(user_id: str) -> Optional[dict]:
+    # The password hash stays out of the cache and out of request handlers
+    return await db.users.find_one({"id": user_id}, {"_id": 0, "password": 0})
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     try:
         token = credentials.credentials
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = auth_cache.decode_token(token, decode_access_token)
         user_id = payload.get("sub")
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
-        user = await db.users.find_one({"id": user_id}, {"_id": 0})
+        user = await auth_cache.get_user(user_id, load_user)
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
         return user
@@ -228,6 +438,15 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+# Operators allowed to run /admin endpoints besides users with role "admin" (comma-separated emails)
+ADMIN_EMAILS = {email.strip().lower() for email in os.getenv("ADMIN_EMAILS", "").split(",") if email.strip()}
+
+async def get_admin_user(current_user: dict = Depends(get_current_user)) -> dict:
+    """Current user if they may run instance-wide admin operations, 403 otherwise"""
+    if current_user.get('role') != "admin" and current_user.get('email', '').lower() not in ADMIN_EMAILS:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return current_user
+
 # Auth routes
 @api_router.post("/auth/register", response_model=Token)
 async def register(user_data: UserCreate):
@@ -241,7 +460,10 @@ async def register(user_data: UserCreate):
     user = User(email=email, name=user_data.name)
     user_dict = user.model_dump()
     user_dict['timestamp'] = user_dict['created_at'].isoformat()
-    user_dict['password'] = hash_password(user_data.password)
+    try:
+        user_dict['password'] = await password_service.hash_password(user_data.password)
+    except password_service.PasswordServiceBusy as e:
+        raise password_service_busy(e)
     
     await db.users.insert_one(user_dict)
     
@@ -254,9 +476,20 @@ async def login(credentials: UserLogin):
     email = credentials.email.lower().strip()
     
     user_doc = await db.users.find_one({"email": email})
-    if not user_doc or not verify_password(credentials.password, user_doc['password']):
+    if not user_doc:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    try:
+        valid, new_hash = await password_service.verify_password(credentials.password, user_doc['password'])
+    except password_service.PasswordServiceBusy as e:
+        raise password_service_busy(e)
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
+    # Stored hash used an older bcrypt cost - replace it transparently
+    if new_hash:
+        await db.users.update_one({"id": user_doc['id']}, {"$set": {"password": new_hash}})
+        auth_cache.invalidate_user(user_doc['id'])
+    
     user = User(**{k: v for k, v in user_doc.items() if k != 'password'})
     token = create_access_token(user.id)
     return Token(access_token=token, user=user)
@@ -277,86 +510,50 @@ async def serve_widget_api():
     return FileResponse(widget_path, media_type="application/javascript")
 
 # Website routes
-@api_router.get("/websites", response_model=List[Website])
-async def get_websites(current_user: dict = Depends(get_current_user)):
+@api_router.get("/websites")
+async def get_websites(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Websites the user owns or collaborates on, oldest first, one page at a time.
+    `fields` is a comma-separated subset of the Website fields to return; the next page's
+    cursor is in the X-Next-Cursor header.
+    """
+    projection = list_projection(Website, fields)
     try:
         # Get websites where user is owner OR collaborator
-        websites = await db.websites.find({
+        websites = await find_page(db.websites, {
             "$or": [
                 {"owner_id": current_user['id']},
                 {"collaborators": current_user['id']}
             ]
-        }, {"_id": 0}).to_list(1000)
-        
-        # FORCE FIX: Ensure embed code is always correct, even for old records
-        # Also fix created_at format if it's a string
-        # And ensure required fields are present
-        for site in websites:
-            # Use EC2 URL for widget (can be changed to domain later)
-            widget_url = os.getenv("WIDGET_BASE_URL", "http://13.222.11.150:8001")
-            correct_code = f'<script src="{widget_url}/api/widget.js" data-website-id="{site["id"]}"></script>'
-            if site.get('embed_code') != correct_code:
-                site['embed_code'] = correct_code
-            
-            # Fix url field - use domain if url is missing
-            if 'url' not in site or not site.get('url'):
-                if 'domain' in site and site.get('domain'):
-                    # Use domain as url, add https:// if not present
-                    domain = site['domain']
-                    if not domain.startswith('http'):
-                        site['url'] = f'https://{domain}'
-                    else:
-                        site['url'] = domain
-                else:
-                    # Fallback to a default URL
-                    site['url'] = 'https://example.com'
-            
-            # Fix created_at if it's a string
-            if 'created_at' in site:
-                created_at = site['created_at']
-                if isinstance(created_at, str):
-                    try:
-                        # Try to parse ISO format string
-                        site['created_at'] = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    except (ValueError, AttributeError):
-                        # If parsing fails, use current time as fallback
-                        site['created_at'] = datetime.now(timezone.utc)
-                elif not isinstance(created_at, datetime):
-                    # If it's not a datetime object, convert it
-                    site['created_at'] = datetime.now(timezone.utc)
-            else:
-                # If created_at is missing, add it
-                site['created_at'] = datetime.now(timezone.utc)
-            
-        return websites
+        }, projection, response, limit, cursor)
+        # Full records go through the model so fields older records lack (pages_count, url_rules) get defaults
+        return websites if fields else [Website(**website) for website in websites]
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Error in get_websites: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch websites: {str(e)}")
 
 @api_router.get("/stats")
 async def get_dashboard_stats(current_user: dict = Depends(get_current_user)):
-    """Get aggregated statistics for dashboard in a single query"""
-    # Get total websites count
-    websites = await db.websites.find({"owner_id": current_user['id']}, {"_id": 0, "id": 1}).to_list(1000)
-    website_ids = [w['id'] for w in websites]
-    
-    # Get total pages count for all user's websites
-    total_pages = 0
-    if website_ids:
-        total_pages = await db.pages.count_documents({"website_id": {"$in": website_ids}})
+    """Get aggregated statistics for dashboard from the user's maintained counters"""
+    stats = await counter_service.user_stats(db, current_user['id'])
     
     return {
-        "total_websites": len(websites),
-        "total_pages": total_pages,
+        "total_websites": stats['websites_count'],
+        "total_pages": stats['pages_count'],
         "total_users": 1  # Current user
     }
 
 @api_router.post("/websites", response_model=Website)
 async def create_website(website_data: WebsiteCreate, current_user: dict = Depends(get_current_user)):
     try:
-        # Use EC2 URL for widget (can be changed to domain later)
-        widget_url = os.getenv("WIDGET_BASE_URL", "http://13.222.11.150:8001")
-        
         # Extract OpenGraph/featured image from website (non-blocking)
         try:
             image_url = await extract_og_image(website_data.url)
@@ -369,14 +566,15 @@ async def create_website(website_data: WebsiteCreate, current_user: dict = Depen
             owner_id=current_user['id'],
             name=website_data.name,
             url=website_data.url,
-            embed_code=f'<script src="{widget_url}/api/widget.js" data-website-id="{{website_id}}"></script>',
             image_url=image_url
         )
+        # Stored in the normalized form get_websites returns as-is
+        website.embed_code = migration_service.embed_code(website.id)
         website_dict = website.model_dump()
         website_dict['created_at'] = website_dict['created_at'].isoformat()
-        website_dict['embed_code'] = website_dict['embed_code'].replace('{website_id}', website.id)
         
         await db.websites.insert_one(website_dict)
+        await counter_service.websites_added(db, current_user['id'])
         return website
     except Exception as e:
         logging.error(f"Failed to create website: {str(e)}")
@@ -390,17 +588,122 @@ async def get_website(website_id: str, current_user: dict = Depends(get_current_
         raise HTTPException(status_code=404, detail="Website not found")
     
     website = await db.websites.find_one({"id": website_id}, {"_id": 0})
-    
-    # FORCE FIX: Ensure embed code is always correct
-    if website:
-        widget_url = os.getenv("WIDGET_BASE_URL", "http://13.222.11.150:8001")
-        correct_code = f'<script src="{widget_url}/api/widget.js" data-website-id="{website["id"]}"></script>'
-        website['embed_code'] = correct_code
-        
     return website
 
+# Cascading delete - Mongo records go in one pass of bulk deletes, stored files are removed by a background job
+async def collect_stored_files(collection: str, records: list) -> tuple[list, list]:
+    """
+    Split the files of deleted media records into (S3 keys, local paths) to remove.
+    Shared content-addressed files are released instead and only included once unreferenced.
+    """
+    s3_keys, local_paths = [], []
+    for record in records:
+        files = [
+            (record.get(path), record.get(url))
+            for name, path, url in reconcile_service.FILE_REFERENCES[collection]
+            if not (name == "file" and record.get("content_sha256"))
+        ]
+        files += [(rendition.get("file_path"), rendition.get("audio_url")) for rendition in record.get("renditions") or []]
+        for file_path, url in files:
+            if not file_path or not url:
+                continue
+            (local_paths if url.startswith("/") else s3_keys).append(file_path)
+    s3_keys += await release_media_objects([record['file_path'] for record in records if record.get("content_sha256")])
+    return s3_keys, local_paths
+
+async def cascade_delete(website_ids: list = (), page_ids: list = (), section_ids: list = ()) -> dict:
+    """
+    Delete pages, sections and everything under them (videos, audios, translations, narrations).
+    The websites themselves are left to the caller. Returns {"deleted": {collection: count},
+    "s3_keys": [...], "local_paths": [...]} - the stored files still have to be removed.
+    """
+    page_ids = list(page_ids)
+    if website_ids:
+        pages = await db.pages.find({"website_id": {"$in": list(website_ids)}}, {"_id": 0, "id": 1}).to_list(None)
+        page_ids += [page['id'] for page in pages]
+    section_ids = list(section_ids)
+    if page_ids:
+        sections = await db.sections.find({"page_id": {"$in": page_ids}}, {"_id": 0, "id": 1}).to_list(None)
+        section_ids += [section['id'] for section in sections]
+    
+    # Only the fields that point at stored files are needed
+    s3_keys, local_paths = [], []
+    file_projection = lambda collection: {"_id": 0, "renditions": 1, "content_sha256": 1, **{
+        field: 1 for _, path, url in reconcile_service.FILE_REFERENCES[collection] for field in (path, url)
+    }}
+    for collection, query in (
+        ("videos", {"section_id": {"$in": section_ids}}),
+        ("audios", {"section_id": {"$in": section_ids}}),
+        ("narrations", {"page_id": {"$in": page_ids}}),
+    ):
+        records = await db[collection].find(query, file_projection(collection)).to_list(None)
+        keys, paths = await collect_stored_files(collection, records)
+        s3_keys += keys
+        local_paths += paths
+    
+    deletes = {
+        "videos": db.videos.delete_many({"section_id": {"$in": section_ids}}),
+        "audios": db.audios.delete_many({"section_id": {"$in": section_ids}}),
+        "text_translations": db.text_translations.delete_many({"section_id": {"$in": section_ids}}),
+        "narrations": db.narrations.delete_many({"page_id": {"$in": page_ids}}),
+        "sections": db.sections.delete_many({"id": {"$in": section_ids}}),
+        "pages": db.pages.delete_many({"id": {"$in": page_ids}}),
+    }
+    results = await asyncio.gather(*deletes.values())
+    widget_cache.invalidate(*website_ids, *page_ids, *section_ids)
+    return {
+        "deleted": {collection: result.deleted_count for collection, result in zip(deletes, results)},
+        "s3_keys": s3_keys,
+        "local_paths": local_paths,
+    }
+
+async def delete_stored_files(job_id: str, s3_keys: list, local_paths: list) -> dict:
+    """Job handler: remove deleted records' files from S3 (batched DeleteObjects) and local storage"""
+    # A content-addressed object may have been uploaded again since it was released
+    reused = await db.media_objects.find(
+        {"file_key": {"$in": [key for key in s3_keys if key.startswith(MEDIA_OBJECT_PREFIX)]}},
+        {"_id": 0, "file_key": 1}
+    ).to_list(None)
+    if reused:
+        reused_keys = {media_object['file_key'] for media_object in reused}
+        s3_keys = [key for key in s3_keys if key not in reused_keys]
+    deleted, failed = await asyncio.to_thread(s3_service.delete_objects, s3_keys)
+    for local_path in local_paths:
+        try:
+            await asyncio.to_thread(Path(local_path).unlink, missing_ok=True)
+            deleted += 1
+        except OSError as e:
+            logging.warning(f"Could not delete local file {local_path}: {e}")
+            failed.append(local_path)
+    if failed:
+        logging.warning(f"Storage cleanup job {job_id} left {len(failed)} files behind")
+    return {"deleted": deleted, "failed": failed}
+
+async def schedule_storage_cleanup(
+    background_tasks: BackgroundTasks,
+    user_id: str,
+    website_id: Optional[str],
+    s3_keys: list,
+    local_paths: list
+) -> Optional[str]:
+    """
+    Queue a storage cleanup job for the files of deleted records; returns the job id (None if there is nothing to delete).
+    The records are already gone, so the file list is stored with the job and an interrupted cleanup resumes on restart.
+    """
+    if not s3_keys and not local_paths:
+        return None
+    job = await create_job(
+        "storage_cleanup",
+        user_id,
+        website_id,
+        {"s3_objects": len(s3_keys), "local_files": len(local_paths)},
+        args=[s3_keys, local_paths]
+    )
+    background_tasks.add_task(run_job, job.id, delete_stored_files, s3_keys, local_paths)
+    return job.id
+
 @api_router.delete("/websites/{website_id}")
-async def delete_website(website_id: str, current_user: dict = Depends(get_current_user)):
+async def delete_website(website_id: str, background_tasks: BackgroundTasks, current_user: dict = Depends(get_current_user)):
     # Check if user has access (owner or collaborator)
     has_access = await check_website_access(website_id, current_user['id'])
     if not has_access:
@@ -419,59 +722,84 @@ async def delete_website(website_id: str, current_user: dict = Depends(get_curre
         raise HTTPException(status_code=403, detail="You don't have permission to delete this website")
     
     # Delete the website and all associated data
-    # First delete pages, sections, videos, audios, translations
-    pages = await db.pages.find({"website_id": website_id}).to_list(1000)
-    page_ids = [page['id'] for page in pages]
-    
-    if page_ids:
-        # Delete sections
-        await db.sections.delete_many({"page_id": {"$in": page_ids}})
-        # Delete videos
-        await db.videos.delete_many({"section_id": {"$in": [s['id'] for s in await db.sections.find({"page_id": {"$in": page_ids}}).to_list(10000)]}})
-        # Delete audios
-        await db.audios.delete_many({"section_id": {"$in": [s['id'] for s in await db.sections.find({"page_id": {"$in": page_ids}}).to_list(10000)]}})
-        # Delete translations
-        await db.translations.delete_many({"section_id": {"$in": [s['id'] for s in await db.sections.find({"page_id": {"$in": page_ids}}).to_list(10000)]}})
-        # Delete pages
-        await db.pages.delete_many({"website_id": website_id})
-    
-    # Delete the website
     result = await db.websites.delete_one({"id": website_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Website not found")
     
-    return {"message": "Website deleted successfully"}
+    cascade = await cascade_delete(website_ids=[website_id])
+    await db.analytics.delete_many({"website_id": website_id})
+    await counter_service.websites_added(db, website['owner_id'], -1)
+    await counter_service.pages_added(db, website_id, website['owner_id'], -cascade['deleted']['pages'])
+    cleanup_job_id = await schedule_storage_cleanup(
+        background_tasks, current_user['id'], website_id, cascade['s3_keys'], cascade['local_paths']
+    )
+    
+    return {"message": "Website deleted successfully", "deleted": cascade['deleted'], "cleanup_job_id": cleanup_job_id}
+
+@api_router.put("/websites/{website_id}/url-rules")
+async def update_url_rules(website_id: str, rules: UrlRules, current_user: dict = Depends(get_current_user)):
+    """
+    Set the website's URL canonicalization rules and re-key its pages with them.
+    Pages whose new key another page already has are left unkeyed and listed as conflicts.
+    """
+    if not await check_website_access(website_id, current_user['id']):
+        raise HTTPException(status_code=404, detail="Website not found")
+    
+    rules_dict = rules.model_dump()
+    await db.websites.update_one({"id": website_id}, {"$set": {"url_rules": rules_dict}})
+    widget_cache.invalidate(website_id)
+    
+    pages = await db.pages.find({"website_id": website_id}, {"_id": 0, "id": 1, "url": 1, "url_hash": 1}).to_list(None)
+    rekeyed = {page['id']: url_service.url_hash(page['url'], rules_dict) for page in pages}
+    rekeyed = {page['id']: rekeyed[page['id']] for page in pages if page.get('url_hash') != rekeyed[page['id']]}
+    conflicts = []
+    if rekeyed:
+        # Clear the old keys first so pages can swap keys without tripping the unique index
+        await db.pages.update_many({"id": {"$in": list(rekeyed)}}, {"$unset": {"url_hash": ""}})
+        page_ids = list(rekeyed)
+        ops = [UpdateOne({"id": page_id}, {"$set": {"url_hash": rekeyed[page_id]}}) for page_id in page_ids]
+        try:
+            await db.pages.bulk_write(ops, ordered=False)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != migration_service.DUPLICATE_KEY_ERROR for error in errors):
+                raise
+            conflicts = [page_ids[error["index"]] for error in errors]
+    
+    return {"url_rules": rules_dict, "rekeyed": len(rekeyed) - len(conflicts), "conflicts": conflicts}
 
 # Page routes
-@api_router.get("/websites/{website_id}/pages", response_model=List[Page])
-async def get_pages(website_id: str, current_user: dict = Depends(get_current_user)):
+@api_router.get("/websites/{website_id}/pages")
+async def get_pages(
+    website_id: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """Pages of a website, oldest first (paginated and projected like GET /websites)"""
     # Check if user has access (owner or collaborator)
     has_access = await check_website_access(website_id, current_user['id'])
     if not has_access:
         raise HTTPException(status_code=404, detail="Website not found")
     
-    pages = await db.pages.find({"website_id": website_id}, {"_id": 0}).to_list(1000)
+    projection = list_projection(Page, fields)
+    pages = await find_page(db.pages, {"website_id": website_id}, projection, response, limit, cursor)
     
-    # Calculate status for each page based on content
-    for page in pages:
-        # Get sections for this page
-        sections = await db.sections.find({"page_id": page['id']}, {"_id": 0}).to_list(1000)
-        
-        # Calculate if page has any content
-        has_content = False
-        for section in sections:
-            # Check if section has videos or audio
-            videos_count = await db.videos.count_documents({"section_id": section['id']})
-            audios_count = await db.audios.count_documents({"section_id": section['id']})
-            
-            if videos_count > 0 or audios_count > 0:
-                has_content = True
-                break
-        
-        # Set status
-        page['status'] = 'Active' if has_content else 'Not Setup'
+    # Status reflects content: Active once any section has videos or audio
+    if "status" in projection and pages:
+        sections = await db.sections.find(
+            {"page_id": {"$in": [page['id'] for page in pages]}}, {"_id": 0, "id": 1, "page_id": 1}
+        ).to_list(None)
+        section_ids = [section['id'] for section in sections]
+        with_media = set(await db.videos.distinct("section_id", {"section_id": {"$in": section_ids}}))
+        with_media |= set(await db.audios.distinct("section_id", {"section_id": {"$in": section_ids}}))
+        active = {section['page_id'] for section in sections if section['id'] in with_media}
+        for page in pages:
+            page['status'] = 'Active' if page['id'] in active else 'Not Setup'
     
-    return pages
+    return pages if fields else [Page(**page) for page in pages]
 
 @api_router.patch("/pages/{page_id}/status")
 async def update_page_status(page_id: str, status_data: dict, current_user: dict = Depends(get_current_user)):
@@ -495,6 +823,7 @@ async def update_page_status(page_id: str, status_data: dict, current_user: dict
         {"id": page_id},
         {"$set": {"status": new_status}}
     )
+    widget_cache.invalidate(page_id)
     
     return {"message": "Status updated", "status": new_status}
 
@@ -504,29 +833,38 @@ async def create_page(website_id: str, page_data: PageCreate, current_user: dict
     has_access = await check_website_access(website_id, current_user['id'])
     if not has_access:
         raise HTTPException(status_code=404, detail="Website not found")
+    website = await db.websites.find_one({"id": website_id}, {"_id": 0, "owner_id": 1, "url_rules": 1})
     
-    page = Page(website_id=website_id, url=page_data.url)
+    page = Page(website_id=website_id, url=page_data.url, url_hash=url_service.url_hash(page_data.url, website.get('url_rules')))
     page_dict = page.model_dump()
     page_dict['created_at'] = page_dict['created_at'].isoformat()
     
-    await db.pages.insert_one(page_dict)
+    try:
+        await db.pages.insert_one(page_dict)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="This page has already been added to the website")
+    await counter_service.pages_added(db, website_id, website['owner_id'])
     
     # Auto-scrape page content
     try:
         sections = await scrape_page_content(page_data.url)
+        section_dicts = []
         for idx, text in enumerate(sections, 1):
             section = Section(
                 page_id=page.id,
                 selected_text=text,
                 text_content=text,
+                content_hash=content_hash(text),
                 position_order=idx
             )
             section_dict = section.model_dump()
             section_dict['created_at'] = section_dict['created_at'].isoformat()
-            await db.sections.insert_one(section_dict)
+            section_dicts.append(section_dict)
         
-        page_dict['sections_count'] = len(sections)
-        await db.pages.update_one({"id": page.id}, {"$set": {"sections_count": len(sections)}})
+        if section_dicts:
+            await db.sections.insert_many(section_dicts)
+            await counter_service.sections_added(db, page.id, len(section_dicts))
+            page.sections_count = len(section_dicts)
     except Exception as e:
         logging.error(f"Error scraping page: {e}")
     
@@ -666,8 +1004,8 @@ async def get_page(page_id: str, current_user: dict = Depends(get_current_user))
     return page
 
 @api_router.delete("/pages/{page_id}")
-async def delete_page(page_id: str, current_user: dict = Depends(get_current_user)):
-    """Delete a page and all its associated content (sections, videos, audio, translations)"""
+async def delete_page(page_id: str, background_tasks: BackgroundTasks, current_user: dict = Depends(get_current_user)):
+    """Delete a page and all its associated content (sections, videos, audio, translations, narrations)"""
     # Find the page
     page = await db.pages.find_one({"id": page_id}, {"_id": 0})
     if not page:
@@ -677,37 +1015,108 @@ async def delete_page(page_id: str, current_user: dict = Depends(get_current_use
     if not await check_website_access(page['website_id'], current_user['id']):
         raise HTTPException(status_code=403, detail="Access denied")
     
-    # Get all sections for this page
-    sections = await db.sections.find({"page_id": page_id}, {"_id": 0}).to_list(1000)
-    section_ids = [section['id'] for section in sections]
-    
-    if section_ids:
-        # Delete all videos for these sections
-        await db.videos.delete_many({"section_id": {"$in": section_ids}})
-        # Delete all audio for these sections
-        await db.audios.delete_many({"section_id": {"$in": section_ids}})
-        # Delete all translations for these sections
-        await db.text_translations.delete_many({"section_id": {"$in": section_ids}})
-        # Delete all sections
-        await db.sections.delete_many({"page_id": page_id})
-    
-    # Delete the page itself
-    await db.pages.delete_one({"id": page_id})
-    
-    # Update website page count
-    page_count = await db.pages.count_documents({"website_id": page['website_id']})
-    await db.websites.update_one(
-        {"id": page['website_id']},
-        {"$set": {"pages_count": page_count}}
+    cascade = await cascade_delete(page_ids=[page_id])
+    cleanup_job_id = await schedule_storage_cleanup(
+        background_tasks, current_user['id'], page['website_id'], cascade['s3_keys'], cascade['local_paths']
     )
     
-    return {"message": "Page and all associated content deleted successfully"}
+    # Update website and owner page counts
+    website = await db.websites.find_one({"id": page['website_id']}, {"_id": 0, "owner_id": 1})
+    if website:
+        await counter_service.pages_added(db, page['website_id'], website['owner_id'], -cascade['deleted']['pages'])
+    
+    return {"message": "Page and all associated content deleted successfully", "cleanup_job_id": cleanup_job_id}
 
 # Section routes
-@api_router.get("/pages/{page_id}/sections", response_model=List[Section])
-async def get_sections(page_id: str, current_user: dict = Depends(get_current_user)):
-    sections = await db.sections.find({"page_id": page_id}, {"_id": 0}).sort("position_order", 1).to_list(1000)
-    return sections
+@api_router.get("/pages/{page_id}/sections")
+async def get_sections(
+    page_id: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """Sections of a page in reading order (paginated and projected like GET /websites)"""
+    page = await db.pages.find_one({"id": page_id}, {"_id": 0, "website_id": 1})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    sections = await find_page(db.sections, {"page_id": page_id}, list_projection(Section, fields),
+                               response, limit, cursor, sort_keys=("position_order", "_id"))
+    return sections if fields else [Section(**section) for section in sections]
+
+def coverage_lookup(collection: str, fields: list) -> dict:
+    """$lookup of a section's media/translations, keeping only the fields the coverage summary needs"""
+    return {"$lookup": {
+        "from": collection,
+        "let": {"section_id": "$id"},
+        "pipeline": [
+            {"$match": {"$expr": {"$eq": ["$section_id", "$$section_id"]}}},
+            {"$project": {"_id": 0, **{field: 1 for field in fields}}},
+        ],
+        "as": collection,
+    }}
+
+def stale_count(items: str) -> dict:
+    """Items built from a different section text (untracked items and unhashed sections are not counted)"""
+    return {"$size": {"$filter": {
+        "input": items,
+        "cond": {"$and": [
+            {"$gt": ["$$this.source_hash", None]},
+            {"$gt": ["$content_hash", None]},
+            {"$ne": ["$$this.source_hash", "$content_hash"]},
+        ]},
+    }}}
+
+@api_router.get("/pages/{page_id}/overview", response_model=PageOverview)
+async def get_page_overview(page_id: str, current_user: dict = Depends(get_current_user)):
+    """
+    Page, narrations and every section with its video/audio/translation coverage
+    (counts, languages present, stale items), computed in one aggregation
+    """
+    page = await db.pages.find_one({"id": page_id}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    pipeline = [
+        {"$match": {"page_id": page_id}},
+        {"$sort": {"position_order": 1}},
+        coverage_lookup("videos", ["language"]),
+        coverage_lookup("audios", ["language", "source_hash"]),
+        coverage_lookup("text_translations", ["language", "source_hash"]),
+        {"$addFields": {"coverage": {
+            "videos": {
+                "count": {"$size": "$videos"},
+                "languages": {"$setUnion": ["$videos.language", []]},
+            },
+            "audios": {
+                "count": {"$size": "$audios"},
+                "languages": {"$setUnion": ["$audios.language", []]},
+                "stale": stale_count("$audios"),
+            },
+            "translations": {
+                "count": {"$size": "$text_translations"},
+                "languages": {"$setUnion": ["$text_translations.language", []]},
+                "stale": stale_count("$text_translations"),
+            },
+        }}},
+        {"$project": {"_id": 0, "videos": 0, "audios": 0, "text_translations": 0}},
+    ]
+    sections, narrations = await asyncio.gather(
+        db.sections.aggregate(pipeline).to_list(None),
+        db.narrations.find({"page_id": page_id}, {"_id": 0}).to_list(100),
+    )
+    for narration in narrations:
+        narration['audio_url'] = sign_media_url(narration['audio_url'], narration.get('file_path'))
+    
+    return {"page": page, "sections": sections, "narrations": narrations}
 
 @api_router.put("/pages/{page_id}/sections/reorder")
 async def reorder_sections(page_id: str, request: ReorderRequest, current_user: dict = Depends(get_current_user)):
@@ -727,6 +1136,7 @@ async def reorder_sections(page_id: str, request: ReorderRequest, current_user:
             {"id": item.id, "page_id": page_id},
             {"$set": {"position_order": item.position_order}}
         )
+    widget_cache.invalidate(page_id)
         
     return {"message": "Sections reordered successfully"}
 
@@ -744,12 +1154,15 @@ async def create_section(page_id: str, section_data: SectionCreate, current_user
         page_id=page_id,
         selected_text=section_data.selected_text,
         text_content=section_data.selected_text,
+        content_hash=content_hash(section_data.selected_text),
         position_order=section_data.position_order
     )
     section_dict = section.model_dump()
     section_dict['created_at'] = section_dict['created_at'].isoformat()
     
     await db.sections.insert_one(section_dict)
+    await counter_service.sections_added(db, page_id)
+    widget_cache.invalidate(page_id)
     return section
 
 @api_router.get("/sections/{section_id}", response_model=Section)
@@ -759,6 +1172,34 @@ async def get_section(section_id: str, current_user: dict = Depends(get_current_
         raise HTTPException(status_code=404, detail="Section not found")
     return section
 
+@api_router.get("/sections/{section_id}/full", response_model=SectionFull)
+async def get_section_full(section_id: str, current_user: dict = Depends(get_current_user)):
+    """Section, signed videos/audio and text translations in one request, with a single access check"""
+    section = await db.sections.find_one({"id": section_id}, {"_id": 0})
+    if not section:
+        raise HTTPException(status_code=404, detail="Section not found")
+    
+    page = await db.pages.find_one({"id": section['page_id']}, {"_id": 0, "website_id": 1})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied: You don't have access to this section")
+    
+    videos, audios, translations = await asyncio.gather(
+        db.videos.find({"section_id": section_id}, {"_id": 0}).sort("_id", 1).to_list(None),
+        db.audios.find({"section_id": section_id}, {"_id": 0}).sort("_id", 1).to_list(None),
+        db.text_translations.find({"section_id": section_id}, {"_id": 0}).sort("_id", 1).to_list(None),
+    )
+    
+    # SIGN URLS
+    for video in videos:
+        sign_video_urls(video)
+    for audio in audios:
+        sign_audio_urls(audio)
+    
+    return {"section": section, "videos": videos, "audios": audios, "translations": translations}
+
 @api_router.patch("/sections/{section_id}", response_model=Section)
 async def update_section(
     section_id: str,
@@ -782,6 +1223,8 @@ async def update_section(
     if payload.text_content is not None:
         update_data["text_content"] = payload.text_content
         update_data["selected_text"] = payload.text_content  # keep in sync with edits
+        # Audio and translations built from the old text now show up as stale
+        update_data["content_hash"] = content_hash(payload.text_content)
 
     if payload.status is not None:
         update_data["status"] = payload.status
@@ -791,13 +1234,14 @@ async def update_section(
             {"id": section_id},
             {"$set": update_data}
         )
+        widget_cache.invalidate(section_id)
 
     updated_section = await db.sections.find_one({"id": section_id}, {"_id": 0})
     return updated_section
 
 
 @api_router.delete("/sections/{section_id}")
-async def delete_section(section_id: str, current_user: dict = Depends(get_current_user)):
+async def delete_section(section_id: str, background_tasks: BackgroundTasks, current_user: dict = Depends(get_current_user)):
     """Delete a section and all its associated media"""
     # Find the section
     section = await db.sections.find_one({"id": section_id}, {"_id": 0})
@@ -812,17 +1256,247 @@ async def delete_section(section_id: str, current_user: dict = Depends(get_curre
     if not await check_website_access(page['website_id'], current_user['id']):
         raise HTTPException(status_code=403, detail="Access denied")
     
-    # Delete all videos associated with this section
-    await db.videos.delete_many({"section_id": section_id})
-    
-    # Delete all audios associated with this section
-    await db.audios.delete_many({"section_id": section_id})
+    # Videos, audios and translations of the section, then the section itself
+    cascade = await cascade_delete(section_ids=[section_id])
+    await counter_service.sections_added(db, section['page_id'], -cascade['deleted']['sections'])
+    cleanup_job_id = await schedule_storage_cleanup(
+        background_tasks, current_user['id'], page['website_id'], cascade['s3_keys'], cascade['local_paths']
+    )
     
-    # Delete the section itself
-    await db.sections.delete_one({"id": section_id})
+    return {"message": "Section and all associated media deleted successfully", "cleanup_job_id": cleanup_job_id}
+
+
+# Derived media (video previews, audio renditions)
+async def store_derived_file(local_file: Path, key: str, content_type: str) -> tuple[str, str]:
+    """
+    Store a generated file under media/... in S3, falling back to local uploads.
+    Returns (url, file_path) in the same shape as media records.
+    """
+    try:
+        await asyncio.to_thread(
+            s3_service.s3_client.upload_file,
+            str(local_file),
+            s3_service.S3_BUCKET_NAME,
+            key,
+            ExtraArgs={"ContentType": content_type}
+        )
+        return s3_service.get_public_url(key), key
+    except Exception as s3_error:
+        logging.warning(f"S3 upload failed for {key}, using local storage: {s3_error}")
+        relative = key.removeprefix("media/")
+        local_path = UPLOAD_DIR / relative
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(local_file, local_path)
+        return f"/api/uploads/{relative}", str(local_path)
+
+async def store_derived_bytes(data: bytes, key: str, content_type: str) -> tuple[str, str]:
+    """store_derived_file for in-memory content (small text files such as captions)"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        local_file = Path(work_dir) / Path(key).name
+        local_file.write_bytes(data)
+        return await store_derived_file(local_file, key, content_type)
+
+async def process_video_previews(video_id: str):
+    """Extract a poster and thumbnail sprite for a video and attach them to its record"""
+    video = await db.videos.find_one({"id": video_id}, {"_id": 0})
+    if not video:
+        return
+    if not media_service.is_available():
+        logging.warning(f"ffmpeg not installed, skipping previews for video {video_id}")
+        return
+
+    # ffmpeg reads S3 objects over a signed URL so only the needed ranges are fetched
+    if video['video_url'].startswith("/"):
+        source = video['file_path']
+    else:
+        source = sign_media_url(video['video_url'], video.get('file_path'))
+
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            previews = await asyncio.to_thread(media_service.generate_video_previews, source, Path(work_dir))
+            poster = previews['poster']
+            poster_url, poster_path = await store_derived_file(
+                poster, f"media/previews/{video_id}/poster{poster.suffix}", previews['poster_content_type']
+            )
+            sprite_url, sprite_path = await store_derived_file(
+                previews['sprite'], f"media/previews/{video_id}/sprite.jpg", "image/jpeg"
+            )
+    except Exception as e:
+        logging.error(f"Preview generation failed for video {video_id}: {e}")
+        return
+
+    await db.videos.update_one(
+        {"id": video_id},
+        {"$set": {
+            "poster_url": poster_url,
+            "poster_path": poster_path,
+            "sprite_url": sprite_url,
+            "sprite_path": sprite_path,
+            "sprite": previews['sprite_meta'],
+        }}
+    )
+    widget_cache.invalidate(video['section_id'])
+
+async def process_audio_renditions(audio_id: str):
+    """Transcode an audio record into loudness-normalized Opus/AAC renditions"""
+    audio = await db.audios.find_one({"id": audio_id}, {"_id": 0})
+    if not audio:
+        return
+    if not media_service.is_available():
+        logging.warning(f"ffmpeg not installed, skipping renditions for audio {audio_id}")
+        return
+
+    if audio['audio_url'].startswith("/"):
+        source = audio['file_path']
+    else:
+        source = sign_media_url(audio['audio_url'], audio.get('file_path'))
+
+    renditions = []
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            transcoded = await asyncio.to_thread(media_service.transcode_audio, source, Path(work_dir))
+            for rendition in transcoded:
+                audio_url, file_path = await store_derived_file(
+                    rendition['path'],
+                    f"media/renditions/{audio_id}/{rendition['path'].name}",
+                    rendition['content_type'].split(';')[0]
+                )
+                renditions.append({
+                    "format": rendition['format'],
+                    "content_type": rendition['content_type'],
+                    "audio_url": audio_url,
+                    "file_path": file_path,
+                    "size": rendition['size'],
+                })
+    except Exception as e:
+        logging.error(f"Audio transcoding failed for audio {audio_id}: {e}")
+        return
+
+    await db.audios.update_one({"id": audio_id}, {"$set": {"renditions": renditions}})
+    widget_cache.invalidate(audio['section_id'])
+
+# Content-addressed uploads - identical files uploaded to the same website share one object under
+# media/objects/{website_id}/, reference counted. Objects are never shared across websites, so a
+# content hash alone never reveals or grants access to another tenant's file.
+MEDIA_OBJECT_PREFIX = "media/objects/"
+SHA256_HEX = re.compile(r'^[0-9a-f]{64}$')
+
+def normalize_sha256(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    value = value.strip().lower()
+    if not SHA256_HEX.match(value):
+        raise HTTPException(status_code=400, detail="content_sha256 must be a hex SHA-256 digest")
+    return value
+
+def media_object_id(website_id: str, content_sha256: str) -> str:
+    return f"{website_id}/{content_sha256}"
+
+def media_object_key(website_id: str, content_sha256: str, filename: str, default_ext: str) -> str:
+    file_ext = filename.split('.')[-1].lower() if '.' in filename else default_ext
+    return f"{MEDIA_OBJECT_PREFIX}{media_object_id(website_id, content_sha256)}.{file_ext}"
+
+async def find_media_object(website_id: str, content_sha256: str) -> Optional[dict]:
+    """The website's stored object with this content, if the bucket still has it"""
+    object_id = media_object_id(website_id, content_sha256)
+    media_object = await db.media_objects.find_one({"id": object_id}, {"_id": 0})
+    if not media_object:
+        return None
+    if not await asyncio.to_thread(s3_service.object_exists, media_object['file_key']):
+        await db.media_objects.delete_one({"id": object_id})
+        return None
+    return media_object
+
+async def acquire_media_object(
+    website_id: str,
+    content_sha256: str,
+    file_key: str,
+    public_url: str,
+    verified_size: Optional[int] = None
+) -> dict:
+    """
+    Add a reference to the website's object with this content, registering file_key as that
+    object if it is the first upload. Unless the server hashed the bytes itself (verified_size),
+    the uploaded object is hashed first and a mismatching upload is deleted.
+    """
+    object_id = media_object_id(website_id, content_sha256)
+    media_object = await db.media_objects.find_one_and_update(
+        {"id": object_id},
+        {"$inc": {"ref_count": 1}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if media_object:
+        return media_object
     
-    return {"message": "Section and all associated media deleted successfully"}
+    if not file_key.startswith(f"{MEDIA_OBJECT_PREFIX}{object_id}."):
+        raise HTTPException(status_code=400, detail="file_key does not belong to content_sha256")
+    size = verified_size
+    if size is None:
+        try:
+            digest, size = await asyncio.to_thread(s3_service.sha256_of_object, file_key)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Uploaded file not found: {str(e)}")
+        if digest != content_sha256:
+            await asyncio.to_thread(delete_stored_object, file_key, False)
+            raise HTTPException(status_code=400, detail="Uploaded file does not match content_sha256")
+    
+    media_object = MediaObject(
+        id=object_id,
+        website_id=website_id,
+        content_sha256=content_sha256,
+        file_key=file_key,
+        public_url=public_url,
+        content_type=s3_service.get_content_type(file_key),
+        size=size,
+    )
+    media_object_dict = media_object.model_dump(exclude={"ref_count"})
+    media_object_dict['created_at'] = media_object_dict['created_at'].isoformat()
+    # A concurrent upload of the same content may have registered it in the meantime
+    media_object = await db.media_objects.find_one_and_update(
+        {"id": object_id},
+        {"$setOnInsert": media_object_dict, "$inc": {"ref_count": 1}},
+        projection={"_id": 0},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    return media_object
+
+async def release_media_objects(file_keys: list) -> list:
+    """Drop references to shared objects (by file key); returns the keys of objects nothing refers to any more"""
+    unreferenced = []
+    for file_key, count in Counter(file_keys).items():
+        media_object = await db.media_objects.find_one_and_update(
+            {"file_key": file_key},
+            {"$inc": {"ref_count": -count}},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+        if not media_object or media_object['ref_count'] > 0:
+            continue
+        # Only delete if no new reference was added since
+        result = await db.media_objects.delete_one({"id": media_object['id'], "ref_count": {"$lte": 0}})
+        if result.deleted_count:
+            unreferenced.append(media_object['file_key'])
+    return unreferenced
+
+def upload_url_response(upload_data: dict, content_sha256: Optional[str]) -> dict:
+    return {
+        "upload_url": upload_data['upload_url'],
+        "public_url": upload_data['public_url'],
+        "file_key": upload_data['file_key'],
+        "content_sha256": content_sha256,
+    }
 
+def existing_upload_response(media_object: dict) -> dict:
+    """upload-url response when the content is already stored - the client skips the upload and confirms"""
+    return {
+        "exists": True,
+        "upload_url": None,
+        "public_url": media_object['public_url'],
+        "file_key": media_object['file_key'],
+        "content_sha256": media_object['content_sha256'],
+    }
 
 # Video routes - R2 Direct Upload (NEW - RECOMMENDED)
 @api_router.post("/sections/{section_id}/video/upload-url")
@@ -854,10 +1528,18 @@ async def get_video_upload_url(
     if not is_valid:
         raise HTTPException(status_code=400, detail=error_msg)
     
-    # Generate unique filename
-    file_id = str(uuid.uuid4())
-    file_ext = request.filename.split('.')[-1] if '.' in request.filename else 'mp4'
-    unique_filename = f"videos/{file_id}.{file_ext}"
+    # Identical content is stored once - skip the upload entirely if it already is
+    content_sha256 = normalize_sha256(request.content_sha256)
+    if content_sha256:
+        media_object = await find_media_object(page['website_id'], content_sha256)
+        if media_object:
+            return existing_upload_response(media_object)
+        unique_filename = media_object_key(page['website_id'], content_sha256, request.filename, 'mp4')
+    else:
+        # Generate unique filename
+        file_id = str(uuid.uuid4())
+        file_ext = request.filename.split('.')[-1] if '.' in request.filename else 'mp4'
+        unique_filename = f"videos/{file_id}.{file_ext}"
     
     # Generate presigned upload URL for S3
     try:
@@ -867,11 +1549,7 @@ async def get_video_upload_url(
             file_size=request.file_size
         )
         
-        return {
-            "upload_url": upload_data['upload_url'],
-            "public_url": upload_data['public_url'],
-            "file_key": upload_data['file_key']
-        }
+        return upload_url_response(upload_data, content_sha256)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate upload URL: {str(e)}")
 
@@ -880,6 +1558,7 @@ async def get_video_upload_url(
 async def confirm_video_upload(
     section_id: str,
     request: ConfirmUploadRequest,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -898,22 +1577,31 @@ async def confirm_video_upload(
     if not await check_website_access(page['website_id'], current_user['id']):
         raise HTTPException(status_code=403, detail="Access denied")
     
+    file_key, public_url = request.file_key, request.public_url
+    content_sha256 = normalize_sha256(request.content_sha256)
+    if content_sha256:
+        media_object = await acquire_media_object(page['website_id'], content_sha256, file_key, public_url)
+        file_key, public_url = media_object['file_key'], media_object['public_url']
+    
     # Create video record
     video_obj = Video(
         section_id=section_id,
         language=request.language,
-        video_url=request.public_url,
-        file_path=request.file_key  # Store R2 key for future reference
+        video_url=public_url,
+        file_path=file_key,  # Store R2 key for future reference
+        content_sha256=content_sha256
     )
     video_dict = video_obj.model_dump()
     video_dict['created_at'] = video_dict['created_at'].isoformat()
     
     await db.videos.insert_one(video_dict)
-    await db.sections.update_one({"id": section_id}, {"$inc": {"videos_count": 1}})
+    await counter_service.media_added(db, "videos", section_id)
+    widget_cache.invalidate(section_id)
+    background_tasks.add_task(process_video_previews, video_obj.id)
     
     # SIGN THE URL for immediate playback
-    if not request.public_url.startswith("/"):
-        signed_url = s3_service.generate_presigned_url(request.file_key)
+    if not public_url.startswith("/"):
+        signed_url = s3_service.generate_presigned_url(file_key)
         video_obj.video_url = signed_url
     
     return video_obj
@@ -923,6 +1611,7 @@ async def confirm_video_upload(
 @api_router.post("/sections/{section_id}/videos", response_model=Video)
 async def upload_video(
     section_id: str,
+    background_tasks: BackgroundTasks,
     language: str = Form(...),
     video: UploadFile = File(...),
     current_user: dict = Depends(get_current_user)
@@ -959,12 +1648,22 @@ async def upload_video(
     video_dict['created_at'] = video_dict['created_at'].isoformat()
     
     await db.videos.insert_one(video_dict)
-    await db.sections.update_one({"id": section_id}, {"$inc": {"videos_count": 1}})
+    await counter_service.media_added(db, "videos", section_id)
+    widget_cache.invalidate(section_id)
+    background_tasks.add_task(process_video_previews, video_obj.id)
     
     return video_obj
 
-@api_router.get("/sections/{section_id}/videos", response_model=List[Video])
-async def get_videos(section_id: str, current_user: dict = Depends(get_current_user)):
+@api_router.get("/sections/{section_id}/videos")
+async def get_videos(
+    section_id: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """Videos of a section, oldest first (paginated and projected like GET /websites)"""
     # Security: Verify section belongs to current user
     section = await db.sections.find_one({"id": section_id}, {"_id": 0})
     if not section:
@@ -978,21 +1677,17 @@ async def get_videos(section_id: str, current_user: dict = Depends(get_current_u
     if not await check_website_access(page['website_id'], current_user['id']):
         raise HTTPException(status_code=403, detail="Access denied: You don't have access to this section")
     
-    videos = await db.videos.find({"section_id": section_id}, {"_id": 0}).to_list(1000)
+    projection = list_projection(Video, fields)
+    videos = await find_page(db.videos, {"section_id": section_id}, projection, response, limit, cursor)
     
     # SIGN URLS
     for video in videos:
-        if not video['video_url'].startswith("/"):
-            key = video.get('file_path')
-            if not key and 'amazonaws.com' in video['video_url']:
-                key = video['video_url'].split('.amazonaws.com/')[-1]
-            if key:
-                video['video_url'] = s3_service.generate_presigned_url(key)
+        sign_video_urls(video)
     
-    return videos
+    return videos if fields else [Video(**video) for video in videos]
 
 @api_router.delete("/videos/{video_id}")
-async def delete_video(video_id: str, current_user: dict = Depends(get_current_user)):
+async def delete_video(video_id: str, background_tasks: BackgroundTasks, current_user: dict = Depends(get_current_user)):
     """Delete a video"""
     # Find the video
     video = await db.videos.find_one({"id": video_id}, {"_id": 0})
@@ -1012,17 +1707,42 @@ async def delete_video(video_id: str, current_user: dict = Depends(get_current_u
         raise HTTPException(status_code=403, detail="Access denied")
     
     # Delete from database
-    await db.videos.delete_one({"id": video_id})
-    
-    # Update section video count
-    videos_count = await db.videos.count_documents({"section_id": video['section_id']})
-    await db.sections.update_one(
-        {"id": video['section_id']},
-        {"$set": {"videos_count": videos_count}}
-    )
+    result = await db.videos.delete_one({"id": video_id})
+    await counter_service.media_added(db, "videos", video['section_id'], -result.deleted_count)
+    widget_cache.invalidate(video['section_id'])
+    s3_keys, local_paths = await collect_stored_files("videos", [video])
+    await schedule_storage_cleanup(background_tasks, current_user['id'], page['website_id'], s3_keys, local_paths)
     
     return {"message": "Video deleted successfully"}
 
+@api_router.post("/videos/{video_id}/previews")
+async def regenerate_video_previews(
+    video_id: str,
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(get_current_user)
+):
+    """(Re)generate poster and thumbnail sprite for a video, e.g. for videos uploaded before previews existed"""
+    video = await db.videos.find_one({"id": video_id}, {"_id": 0})
+    if not video:
+        raise HTTPException(status_code=404, detail="Video not found")
+    
+    section = await db.sections.find_one({"id": video['section_id']}, {"_id": 0})
+    if not section:
+        raise HTTPException(status_code=404, detail="Section not found")
+    
+    page = await db.pages.find_one({"id": section['page_id']}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    if not media_service.is_available():
+        raise HTTPException(status_code=503, detail="Video processing is not available on this server")
+    
+    background_tasks.add_task(process_video_previews, video_id)
+    return {"message": "Preview generation started", "video_id": video_id}
+
 
 # Audio routes - Manual Upload via S3 Presigned URL (RECOMMENDED)
 @api_router.post("/sections/{section_id}/audio/upload-url")
@@ -1051,10 +1771,18 @@ async def get_audio_upload_url(
     if not is_valid:
         raise HTTPException(status_code=400, detail=error_msg)
     
-    # Generate unique filename
-    file_id = str(uuid.uuid4())
-    file_ext = request.filename.split('.')[-1] if '.' in request.filename else 'mp3'
-    unique_filename = f"audio/{file_id}.{file_ext}"
+    # Identical content is stored once - skip the upload entirely if it already is
+    content_sha256 = normalize_sha256(request.content_sha256)
+    if content_sha256:
+        media_object = await find_media_object(page['website_id'], content_sha256)
+        if media_object:
+            return existing_upload_response(media_object)
+        unique_filename = media_object_key(page['website_id'], content_sha256, request.filename, 'mp3')
+    else:
+        # Generate unique filename
+        file_id = str(uuid.uuid4())
+        file_ext = request.filename.split('.')[-1] if '.' in request.filename else 'mp3'
+        unique_filename = f"audio/{file_id}.{file_ext}"
     
     try:
         upload_data = s3_service.generate_presigned_upload_url(
@@ -1063,11 +1791,7 @@ async def get_audio_upload_url(
             file_size=request.file_size
         )
         
-        return {
-            "upload_url": upload_data['upload_url'],
-            "public_url": upload_data['public_url'],
-            "file_key": upload_data['file_key']
-        }
+        return upload_url_response(upload_data, content_sha256)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate upload URL: {str(e)}")
 
@@ -1076,6 +1800,7 @@ async def get_audio_upload_url(
 async def confirm_audio_upload(
     section_id: str,
     request: ConfirmUploadRequest,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(get_current_user)
 ):
     """Confirm audio upload and save to database"""
@@ -1090,21 +1815,30 @@ async def confirm_audio_upload(
     if not await check_website_access(page['website_id'], current_user['id']):
         raise HTTPException(status_code=403, detail="Access denied")
     
+    file_key, public_url = request.file_key, request.public_url
+    content_sha256 = normalize_sha256(request.content_sha256)
+    if content_sha256:
+        media_object = await acquire_media_object(page['website_id'], content_sha256, file_key, public_url)
+        file_key, public_url = media_object['file_key'], media_object['public_url']
+    
     audio_obj = Audio(
         section_id=section_id,
         language=request.language,
-        audio_url=request.public_url,
-        file_path=request.file_key
+        audio_url=public_url,
+        file_path=file_key,
+        content_sha256=content_sha256
     )
     audio_dict = audio_obj.model_dump()
     audio_dict['created_at'] = audio_dict['created_at'].isoformat()
     
     await db.audios.insert_one(audio_dict)
-    await db.sections.update_one({"id": section_id}, {"$inc": {"audios_count": 1}})
+    await counter_service.media_added(db, "audios", section_id)
+    widget_cache.invalidate(section_id)
+    background_tasks.add_task(process_audio_renditions, audio_obj.id)
     
     # SIGN THE URL
-    if not request.public_url.startswith("/"):
-        signed_url = s3_service.generate_presigned_url(request.file_key)
+    if not public_url.startswith("/"):
+        signed_url = s3_service.generate_presigned_url(file_key)
         audio_obj.audio_url = signed_url
     
     return audio_obj
@@ -1114,6 +1848,7 @@ async def confirm_audio_upload(
 @api_router.post("/sections/{section_id}/audio", response_model=Audio)
 async def upload_audio(
     section_id: str,
+    background_tasks: BackgroundTasks,
     language: str = Form(...),
     audio: UploadFile = File(...),
     current_user: dict = Depends(get_current_user)
@@ -1146,23 +1881,30 @@ async def upload_audio(
         raise HTTPException(status_code=400, detail=error_msg)
     
     file_id = str(uuid.uuid4())
-    unique_filename = f"audio/{file_id}.{file_ext}"
+    content_sha256 = hashlib.sha256(content).hexdigest()
+    unique_filename = media_object_key(page['website_id'], content_sha256, audio.filename, 'mp3')
     
     try:
-        # Upload to S3
-        content_type = s3_service.get_content_type(audio.filename)
-        s3_service.s3_client.put_object(
-            Bucket=s3_service.S3_BUCKET_NAME,
-            Key=unique_filename,
-            Body=content,
-            ContentType=content_type
+        # Upload to S3 unless identical audio is already stored
+        media_object = await find_media_object(page['website_id'], content_sha256)
+        if not media_object:
+            content_type = s3_service.get_content_type(audio.filename)
+            s3_service.s3_client.put_object(
+                Bucket=s3_service.S3_BUCKET_NAME,
+                Key=unique_filename,
+                Body=content,
+                ContentType=content_type
+            )
+        media_object = await acquire_media_object(
+            page['website_id'], content_sha256, unique_filename, s3_service.get_public_url(unique_filename), verified_size=file_size
         )
         
         # Get presigned URL for access
-        audio_url = s3_service.generate_presigned_url(unique_filename)
-        file_path = unique_filename  # Store S3 key
+        file_path = media_object['file_key']  # Store S3 key
+        audio_url = s3_service.generate_presigned_url(file_path)
         
     except Exception as s3_error:
+        content_sha256 = None
         # Fallback to local storage if S3 fails
         logging.warning(f"S3 upload failed, using local storage: {s3_error}")
         file_path = AUDIO_DIR / f"{file_id}.{file_ext}"
@@ -1175,140 +1917,434 @@ async def upload_audio(
         section_id=section_id,
         language=language,
         audio_url=audio_url,
-        file_path=file_path
+        file_path=file_path,
+        content_sha256=content_sha256
     )
     audio_dict = audio_obj.model_dump()
     audio_dict['created_at'] = audio_dict['created_at'].isoformat()
     
     await db.audios.insert_one(audio_dict)
-    await db.sections.update_one({"id": section_id}, {"$inc": {"audios_count": 1}})
+    await counter_service.media_added(db, "audios", section_id)
+    widget_cache.invalidate(section_id)
+    background_tasks.add_task(process_audio_renditions, audio_obj.id)
     
     return audio_obj
 
-async def generate_tts_audio(text: str, voice: str = "alloy") -> bytes:
-    url = "https://api.openai.com/v1/audio/speech"
-    payload = {
-        "model": "tts-1",  # OpenAI TTS model: tts-1 (standard) or tts-1-hd (high quality)
-        "voice": voice,
-        "input": text,
-        "format": "mp3",
-    }
-
-    headers = {
-        "Authorization": f"Bearer {OPENAI_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    async with httpx.AsyncClient(timeout=60) as client:
-        resp = await client.post(url, json=payload, headers=headers)
-        if resp.status_code != 200:
-            logging.error(f"OpenAI TTS error: {resp.status_code} - {resp.text}")
-            raise HTTPException(status_code=500, detail="Text-to-speech generation failed")
-        return resp.content
-@api_router.post("/sections/{section_id}/audio/generate", response_model=Audio)
-async def generate_audio(
-    section_id: str,
-    language: str = Form(...),
-    voice: str = Form("alloy"),
-    provider: str = Form("polly"),  # "openai" or "polly" - default to polly
-    current_user: dict = Depends(get_current_user)
-):
+# Background jobs - long-running work is recorded in db.jobs and polled by the client
+async def create_job(
+    job_type: str,
+    user_id: str,
+    website_id: Optional[str],
+    params: dict,
+    args: Optional[list] = None
+) -> Job:
     """
-    Generate audio using AWS Polly or OpenAI TTS (default).
-    This generates audio from section text automatically.
-    For manual audio upload, use /audio/upload-url or /audio endpoints.
+    Record a queued job. args are the handler's arguments, stored (but not returned by
+    GET /jobs/{job_id}) so a job of a RESUMABLE_JOBS type can be run again after a restart.
     """
-    # Security: Verify section belongs to current user
-    section = await db.sections.find_one({"id": section_id}, {"_id": 0})
-    if not section:
-        raise HTTPException(status_code=404, detail="Section not found")
-    
-    # Check ownership
-    page = await db.pages.find_one({"id": section['page_id']}, {"_id": 0})
-    if not page:
-        raise HTTPException(status_code=404, detail="Page not found")
-    
-    # Check website access (owner or collaborator)
-    if not await check_website_access(page['website_id'], current_user['id']):
-        raise HTTPException(status_code=403, detail="Access denied: You don't have access to this section")
-    
+    job = Job(type=job_type, created_by=user_id, website_id=website_id, params=params)
+    job_dict = job.model_dump()
+    job_dict['created_at'] = job_dict['created_at'].isoformat()
+    job_dict['updated_at'] = job_dict['updated_at'].isoformat()
+    if args is not None:
+        job_dict['args'] = args
+    await db.jobs.insert_one(job_dict)
+    return job
+
+async def update_job(job_id: str, **fields):
+    fields['updated_at'] = datetime.now(timezone.utc).isoformat()
+    await db.jobs.update_one({"id": job_id}, {"$set": fields})
+
+async def run_job(job_id: str, handler, *args):
+    """Run handler(job_id, *args) as a background task, recording its status and result on the job"""
+    await update_job(job_id, status="running")
     try:
-        source_text = section.get("text_content") or section.get("selected_text", "")
-        if not source_text:
-            raise HTTPException(status_code=400, detail="Section has no text to generate audio from")
+        result = await handler(job_id, *args)
+    except Exception as e:
+        logging.error(f"Job {job_id} failed: {e}", exc_info=True)
+        await update_job(job_id, status="failed", error=str(e))
+        return
+    await update_job(job_id, status="succeeded", result=result)
+
+@api_router.get("/jobs/{job_id}", response_model=Job)
+async def get_job(job_id: str, current_user: dict = Depends(get_current_user)):
+    job = await db.jobs.find_one({"id": job_id}, {"_id": 0})
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if job['created_by'] != current_user['id'] and not (
+        job.get('website_id') and await check_website_access(job['website_id'], current_user['id'])
+    ):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    return Job(**job)
+
+# Long-form synthesis (Polly writes the output to the media bucket; the job polls for completion)
+LONG_FORM_AUDIO_PREFIX = "audio/long-form/"
+LONG_FORM_POLL_SECONDS = float(os.getenv("POLLY_TASK_POLL_SECONDS", "5"))
+LONG_FORM_TIMEOUT_SECONDS = int(os.getenv("POLLY_TASK_TIMEOUT_SECONDS", "1800"))
+
+async def wait_for_synthesis_task(task_id: str, deadline: float) -> dict:
+    loop = asyncio.get_running_loop()
+    while True:
+        task = await asyncio.to_thread(polly_service.get_synthesis_task, task_id)
+        if task['status'] == "completed":
+            return task
+        if task['status'] == "failed":
+            raise Exception(f"Polly synthesis task {task_id} failed: {task.get('reason')}")
+        if loop.time() > deadline:
+            raise Exception(f"Polly synthesis task {task_id} did not finish in {LONG_FORM_TIMEOUT_SECONDS}s")
+        await asyncio.sleep(LONG_FORM_POLL_SECONDS)
+
+def task_output_location(output_uri: str, key: str) -> tuple[str, str, bool]:
+    """
+    Where a synthesis task put its output: (audio_url, file_path, is_local).
+    Polly writes to the bucket under key; the fake backend writes a local file (file:// URI).
+    """
+    if output_uri and output_uri.startswith("file://"):
+        local_path = Path(unquote(urlparse(output_uri).path))
+        relative = local_path.resolve().relative_to(UPLOAD_DIR.resolve()).as_posix()
+        return f"/api/uploads/{relative}", str(local_path), True
+    return s3_service.generate_presigned_url(key), key, False
+
+def read_stored_blocks(file_path: str, is_local: bool, block_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Read a stored object (S3 key or local file) in blocks"""
+    if is_local:
+        with open(file_path, "rb") as f:
+            while block := f.read(block_size):
+                yield block
+        return
+    body = s3_service.s3_client.get_object(Bucket=s3_service.S3_BUCKET_NAME, Key=file_path)['Body']
+    try:
+        yield from body.iter_chunks(block_size)
+    finally:
+        body.close()
+
+def measure_stored_audio(file_path: str, is_local: bool) -> int:
+    """Duration of a stored MP3 in ms, read as a stream"""
+    frames = mp3_utils.FrameStream()
+    for block in read_stored_blocks(file_path, is_local):
+        frames.feed(block)
+    return frames.duration_ms
+
+def delete_stored_object(file_path: str, is_local: bool):
+    if is_local:
+        Path(file_path).unlink(missing_ok=True)
+    else:
+        s3_service.s3_client.delete_object(Bucket=s3_service.S3_BUCKET_NAME, Key=file_path)
+
+async def synthesize_long_form_audio(job_id: str, section_id: str, text: str, language: str, voice: Optional[str]) -> dict:
+    """Job handler: run Polly synthesis tasks for text and attach the result to the section as an audio"""
+    tasks = await asyncio.to_thread(
+        polly_service.start_long_form_synthesis,
+        text,
+        s3_service.S3_BUCKET_NAME,
+        LONG_FORM_AUDIO_PREFIX,
+        language,
+        voice,
+        'neural'
+    )
+    await update_job(job_id, progress={"stage": "synthesizing", **tasks})
+    
+    deadline = asyncio.get_running_loop().time() + LONG_FORM_TIMEOUT_SECONDS
+    audio_task = await wait_for_synthesis_task(tasks['audio_task_id'], deadline)
+    marks_task = await wait_for_synthesis_task(tasks['marks_task_id'], deadline)
+    await update_job(job_id, progress={"stage": "attaching", **tasks})
+    
+    audio_url, file_path, is_local = task_output_location(
+        audio_task['output_uri'], f"{LONG_FORM_AUDIO_PREFIX}{tasks['audio_task_id']}.mp3"
+    )
+    _, marks_path, marks_local = task_output_location(
+        marks_task['output_uri'], f"{LONG_FORM_AUDIO_PREFIX}{tasks['marks_task_id']}.marks"
+    )
+    marks_data = await asyncio.to_thread(lambda: b"".join(read_stored_blocks(marks_path, marks_local)))
+    duration_ms = await asyncio.to_thread(measure_stored_audio, file_path, is_local)
+    
+    audio_obj = Audio(
+        section_id=section_id,
+        language=language,
+        audio_url=audio_url,
+        file_path=file_path,
+        captions=text,
+        source_hash=content_hash(text),
+        provider="polly",
+        voice=voice,
+    )
+    await attach_timing_track(audio_obj, text, polly_service.parse_speech_marks(marks_data), duration_ms)
+    
+    audio_dict = audio_obj.model_dump()
+    audio_dict["created_at"] = audio_dict["created_at"].isoformat()
+    await db.audios.insert_one(audio_dict)
+    await counter_service.media_added(db, "audios", section_id)
+    widget_cache.invalidate(section_id)
+    
+    # The speech marks now live in the timing track
+    try:
+        await asyncio.to_thread(delete_stored_object, marks_path, marks_local)
+    except Exception as e:
+        logging.warning(f"Could not delete speech marks output {marks_path}: {e}")
+    
+    await process_audio_renditions(audio_obj.id)
+    return {"audio_id": audio_obj.id, "duration_ms": duration_ms}
+
+async def build_page_narration(job_id: str, page_id: str, language: str, voice: Optional[str]) -> dict:
+    """Job handler: join the page's section audio (synthesizing what is missing) into one narration"""
+    sections = await db.sections.find(
+        {"page_id": page_id, "status": "Active"},
+        {"_id": 0, "id": 1, "text_content": 1, "selected_text": 1}
+    ).sort([("position_order", 1), ("order", 1)]).to_list(1000)
+    
+    # Newest MP3 per section in this language (uploaded WAV/M4A files cannot be joined)
+    latest_audio = {}
+    async for audio in db.audios.find(
+        {"section_id": {"$in": [section['id'] for section in sections]}, "language": language},
+        {"_id": 0, "id": 1, "section_id": 1, "audio_url": 1, "file_path": 1}
+    ).sort("created_at", -1):
+        if audio['section_id'] not in latest_audio and audio['file_path'].lower().endswith(".mp3"):
+            latest_audio[audio['section_id']] = audio
+    
+    segments = []
+    for section in sections:
+        audio = latest_audio.get(section['id'])
+        segments.append({
+            "section_id": section['id'],
+            "text": section.get("text_content") or section.get("selected_text") or "",
+            "audio_id": audio['id'] if audio else None,
+            "open_audio": (
+                lambda audio=audio: read_stored_blocks(audio['file_path'], audio['audio_url'].startswith("/"))
+            ) if audio else None,
+        })
+    await update_job(job_id, progress={"stage": "joining", "sections": len(segments), "reused": len(latest_audio)})
+    
+    narration_stream = narration_service.NarrationStream(segments, language, voice)
+    audio_url, file_path = await store_audio_stream(iterate_in_thread(narration_stream))
+    if not narration_stream.chapters:
+        await asyncio.to_thread(delete_stored_object, file_path, audio_url.startswith("/"))
+        raise Exception("Page has no sections with text or audio to narrate")
+    
+    narration = Narration(
+        page_id=page_id,
+        language=language,
+        audio_url=audio_url,
+        file_path=file_path,
+        duration_ms=narration_stream.duration_ms,
+        chapters=narration_stream.chapters,
+    )
+    narration_dict = narration.model_dump()
+    narration_dict['created_at'] = narration_dict['created_at'].isoformat()
+    
+    # One narration per page and language - replace the previous one
+    previous = await db.narrations.find_one_and_replace(
+        {"page_id": page_id, "language": language},
+        narration_dict,
+        projection={"_id": 0, "file_path": 1, "audio_url": 1},
+        upsert=True,
+        return_document=ReturnDocument.BEFORE
+    )
+    widget_cache.invalidate(page_id)
+    if previous and previous['file_path'] != narration.file_path:
+        try:
+            await asyncio.to_thread(delete_stored_object, previous['file_path'], previous['audio_url'].startswith("/"))
+        except Exception as e:
+            logging.warning(f"Could not delete previous narration {previous['file_path']}: {e}")
+    
+    return {"narration_id": narration.id, "duration_ms": narration.duration_ms, "chapters": len(narration.chapters)}
+
+async def store_generated_audio(audio_bytes: bytes) -> tuple[str, str]:
+    """
+    Upload synthesized MP3 audio to S3, falling back to local storage.
+    Returns (audio_url, file_path).
+    """
+    file_id = str(uuid.uuid4())
+    file_ext = "mp3"
+    unique_filename = f"audio/{file_id}.{file_ext}"
+    
+    try:
+        # Upload to S3
+        await asyncio.to_thread(
+            s3_service.s3_client.put_object,
+            Bucket=s3_service.S3_BUCKET_NAME,
+            Key=unique_filename,
+            Body=audio_bytes,
+            ContentType='audio/mpeg'
+        )
         
-        # Generate audio bytes based on provider
-        audio_bytes = None
-        if provider.lower() == "polly":
-            # Use AWS Polly (run in thread since it's synchronous)
-            audio_bytes = await asyncio.to_thread(
-                polly_service.generate_speech,
-                source_text,
-                language,
-                voice if voice != "alloy" else None,
-                'neural'  # Use neural for better quality
-            )
-        else:
-            # Use OpenAI, but fallback to Polly if it fails
+        # Get presigned URL for access
+        audio_url = s3_service.generate_presigned_url(unique_filename)
+        file_path = unique_filename  # Store S3 key
+    except Exception as s3_error:
+        # Fallback to local storage if S3 fails
+        logging.warning(f"S3 upload failed, using local storage: {s3_error}")
+        file_path = AUDIO_DIR / f"{file_id}.{file_ext}"
+        async with aiofiles.open(file_path, "wb") as f:
+            await f.write(audio_bytes)
+        audio_url = f"/api/uploads/audio/{file_id}.{file_ext}"
+    
+    return audio_url, str(file_path)
+
+async def attach_timing_track(audio_obj: Audio, text: str, marks: list, duration_ms: int):
+    """Build the word/sentence timing track and WebVTT captions for a generated audio"""
+    if not marks:
+        return
+    try:
+        track = timing_service.build_timing_track(text, marks, duration_ms)
+        audio_obj.timing = track
+        audio_obj.vtt_url, audio_obj.vtt_path = await store_derived_bytes(
+            timing_service.to_webvtt(text, track).encode("utf-8"),
+            f"media/captions/{audio_obj.id}.vtt",
+            "text/vtt"
+        )
+    except Exception as e:
+        # Captions are an enhancement - never fail audio generation over them
+        logging.warning(f"Failed to build timing track for audio {audio_obj.id}: {e}")
+
+async def iterate_in_thread(iterable) -> AsyncIterator:
+    """Consume a blocking iterator (e.g. a Polly SpeechStream) from async code, one item per worker-thread hop"""
+    iterator = iter(iterable)
+    done = object()
+    try:
+        while True:
+            item = await asyncio.to_thread(next, iterator, done)
+            if item is done:
+                return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close:
+            await asyncio.to_thread(close)
+
+async def store_speech_stream(text: str, language: str, voice: Optional[str]) -> tuple[str, str, list, int]:
+    """
+    Synthesize text with Polly straight into storage.
+    Returns (audio_url, file_path, speech_marks, duration_ms).
+    """
+    speech = await asyncio.to_thread(polly_service.SpeechStream, text, language, voice, 'neural')
+    audio_url, file_path = await store_audio_stream(iterate_in_thread(speech))
+    return audio_url, file_path, speech.marks, speech.duration_ms
+
+async def synthesize_to_storage(text: str, language: str, provider: str, voice: Optional[str]) -> dict:
+    """
+    Generate speech with the requested provider straight into storage, falling back from OpenAI to Polly.
+    Returns {"audio_url", "file_path", "speech_marks", "duration_ms", "provider", "voice"} (marks only from Polly).
+    """
+    polly_voice = voice if voice != "alloy" else None
+    if provider.lower() != "polly":
+        try:
+            audio_url, file_path = await store_audio_stream(openai_tts_service.stream_speech(text, voice))
+            return {"audio_url": audio_url, "file_path": file_path, "speech_marks": [], "duration_ms": 0,
+                    "provider": "openai", "voice": voice}
+        except Exception as openai_error:
+            # Fallback to Polly if OpenAI fails (quota, rate limit, etc.)
+            logging.warning(f"OpenAI TTS failed, falling back to Polly: {openai_error}")
+    audio_url, file_path, speech_marks, duration_ms = await store_speech_stream(text, language, polly_voice)
+    return {"audio_url": audio_url, "file_path": file_path, "speech_marks": speech_marks, "duration_ms": duration_ms,
+            "provider": "polly", "voice": polly_voice}
+
+async def store_audio_stream(chunks: AsyncIterator[bytes]) -> tuple[str, str]:
+    """
+    Stream synthesized MP3 audio into S3 (multipart, at most one part in memory),
+    falling back to local storage if S3 fails before any part was sent.
+    Returns (audio_url, file_path). Errors from the audio source abort the upload and propagate.
+    """
+    file_id = str(uuid.uuid4())
+    unique_filename = f"audio/{file_id}.mp3"
+    local_path = AUDIO_DIR / f"{file_id}.mp3"
+    writer = s3_service.MultipartUploadWriter(unique_filename, 'audio/mpeg')
+    local_file = None
+    
+    async def fall_back_to_local(s3_error: Exception):
+        if writer.parts_uploaded:
+            raise s3_error
+        logging.warning(f"S3 upload failed, using local storage: {s3_error}")
+        await asyncio.to_thread(writer.abort)
+        handle = await aiofiles.open(local_path, "wb")
+        await handle.write(writer.pending())
+        return handle
+    
+    try:
+        async for chunk in chunks:
+            if local_file is None:
+                try:
+                    await asyncio.to_thread(writer.write, chunk)
+                except Exception as s3_error:
+                    # The failed chunk is still in the writer's pending buffer
+                    local_file = await fall_back_to_local(s3_error)
+                continue
+            await local_file.write(chunk)
+        if local_file is None:
             try:
-                audio_bytes = await generate_tts_audio(
-                    text=source_text,
-                    voice=voice,
-                )
-            except Exception as openai_error:
-                # Fallback to Polly if OpenAI fails (quota, rate limit, etc.)
-                logging.warning(f"OpenAI TTS failed, falling back to Polly: {openai_error}")
-                audio_bytes = await asyncio.to_thread(
-                    polly_service.generate_speech,
-                    source_text,
-                    language,
-                    voice if voice != "alloy" else None,
-                    'neural'
-                )
+                await asyncio.to_thread(writer.close)
+            except Exception as s3_error:
+                local_file = await fall_back_to_local(s3_error)
+    except BaseException:
+        await asyncio.to_thread(writer.abort)
+        if local_file is not None:
+            await local_file.close()
+            local_path.unlink(missing_ok=True)
+        raise
+    
+    if local_file is not None:
+        await local_file.close()
+        return f"/api/uploads/audio/{file_id}.mp3", str(local_path)
+    return s3_service.generate_presigned_url(unique_filename), unique_filename
 
-        file_id = str(uuid.uuid4())
-        file_ext = "mp3"
-        unique_filename = f"audio/{file_id}.{file_ext}"
+@api_router.post("/sections/{section_id}/audio/generate", response_model=Audio)
+async def generate_audio(
+    section_id: str,
+    background_tasks: BackgroundTasks,
+    language: str = Form(...),
+    voice: str = Form("alloy"),
+    provider: str = Form("polly"),  # "openai" or "polly" - default to polly
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Generate audio using AWS Polly or OpenAI TTS (default).
+    This generates audio from section text automatically.
+    For manual audio upload, use /audio/upload-url or /audio endpoints.
+    """
+    # Security: Verify section belongs to current user
+    section = await db.sections.find_one({"id": section_id}, {"_id": 0})
+    if not section:
+        raise HTTPException(status_code=404, detail="Section not found")
+    
+    # Check ownership
+    page = await db.pages.find_one({"id": section['page_id']}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    # Check website access (owner or collaborator)
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied: You don't have access to this section")
+    
+    try:
+        source_text = section.get("text_content") or section.get("selected_text", "")
+        if not source_text:
+            raise HTTPException(status_code=400, detail="Section has no text to generate audio from")
         
-        # Upload to S3 instead of local storage
-        try:
-            # Upload to S3
-            s3_service.s3_client.put_object(
-                Bucket=s3_service.S3_BUCKET_NAME,
-                Key=unique_filename,
-                Body=audio_bytes,
-                ContentType='audio/mpeg'
-            )
-            
-            # Get presigned URL for access
-            audio_url = s3_service.generate_presigned_url(unique_filename)
-            file_path = unique_filename  # Store S3 key
-        except Exception as s3_error:
-            # Fallback to local storage if S3 fails
-            logging.warning(f"S3 upload failed, using local storage: {s3_error}")
-            file_path = AUDIO_DIR / f"{file_id}.{file_ext}"
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(audio_bytes)
-            audio_url = f"/api/uploads/audio/{file_id}.{file_ext}"
+        # Stream audio from the provider straight into storage (Polly also returns word/sentence speech marks)
+        generated = await synthesize_to_storage(source_text, language, provider, voice)
 
         # Build response object
         audio_obj = Audio(
             section_id=section_id,
             language=language,
-            audio_url=audio_url,
-            file_path=str(file_path),
+            audio_url=generated['audio_url'],
+            file_path=str(generated['file_path']),
             captions=source_text,
+            source_hash=content_hash(source_text),
+            provider=generated['provider'],
+            voice=generated['voice'],
         )
+        await attach_timing_track(audio_obj, source_text, generated['speech_marks'], generated['duration_ms'])
 
         audio_dict = audio_obj.model_dump()
         audio_dict["created_at"] = audio_dict["created_at"].isoformat()
 
         # Save DB record
         await db.audios.insert_one(audio_dict)
-        await db.sections.update_one(
-            {"id": section_id},
-            {"$inc": {"audios_count": 1}}
-        )
+        await counter_service.media_added(db, "audios", section_id)
+        widget_cache.invalidate(section_id)
+        background_tasks.add_task(process_audio_renditions, audio_obj.id)
 
         return audio_obj
 
@@ -1321,9 +2357,170 @@ async def generate_audio(
             detail=f"Audio generation failed: {str(e)}"
         )
 
+@api_router.post("/sections/{section_id}/audio/generate-long", response_model=Job, status_code=202)
+async def generate_long_form_audio(
+    section_id: str,
+    background_tasks: BackgroundTasks,
+    language: str = Form(...),
+    voice: Optional[str] = Form(None),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Generate Polly audio for a long section without blocking the request.
+    Returns a job; poll GET /jobs/{job_id} until it has succeeded (result.audio_id) or failed.
+    """
+    section = await db.sections.find_one({"id": section_id}, {"_id": 0})
+    if not section:
+        raise HTTPException(status_code=404, detail="Section not found")
+    
+    page = await db.pages.find_one({"id": section['page_id']}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    source_text = section.get("text_content") or section.get("selected_text", "")
+    if not source_text:
+        raise HTTPException(status_code=400, detail="Section has no text to generate audio from")
+    if len(source_text) > polly_service.LONG_FORM_MAX_CHARS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Section text exceeds {polly_service.LONG_FORM_MAX_CHARS} characters"
+        )
+    
+    voice = voice if voice != "alloy" else None
+    job = await create_job(
+        "long_form_audio",
+        current_user['id'],
+        page['website_id'],
+        {"section_id": section_id, "language": language, "voice": voice}
+    )
+    background_tasks.add_task(run_job, job.id, synthesize_long_form_audio, section_id, source_text, language, voice)
+    return job
+
+@api_router.post("/pages/{page_id}/narration", response_model=Job, status_code=202)
+async def generate_page_narration(
+    page_id: str,
+    background_tasks: BackgroundTasks,
+    language: str = Form(...),
+    voice: Optional[str] = Form(None),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Build a single narration of the whole page in one language, with a chapter per section.
+    Existing section audio is reused; sections without it are synthesized with Polly.
+    Returns a job; poll GET /jobs/{job_id} for the result.
+    """
+    page = await db.pages.find_one({"id": page_id}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    voice = voice if voice != "alloy" else None
+    job = await create_job(
+        "page_narration",
+        current_user['id'],
+        page['website_id'],
+        {"page_id": page_id, "language": language, "voice": voice},
+        args=[page_id, language, voice]
+    )
+    background_tasks.add_task(run_job, job.id, build_page_narration, page_id, language, voice)
+    return job
+
+@api_router.get("/pages/{page_id}/narration", response_model=List[Narration])
+async def get_page_narrations(page_id: str, current_user: dict = Depends(get_current_user)):
+    page = await db.pages.find_one({"id": page_id}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    narrations = await db.narrations.find({"page_id": page_id}, {"_id": 0}).to_list(100)
+    for narration in narrations:
+        narration['audio_url'] = sign_media_url(narration['audio_url'], narration.get('file_path'))
+    return narrations
+
+async def voice_page_sections(job_id: str, page_id: str, language: str, voice: Optional[str], only_missing: bool) -> dict:
+    """Job handler: generate Polly audio for the sections of a page, storing each batch as soon as it is synthesized"""
+    sections = await db.sections.find({"page_id": page_id}, {"_id": 0}).sort("position_order", 1).to_list(1000)
+    if only_missing:
+        voiced = await db.audios.distinct("section_id", {
+            "section_id": {"$in": [section['id'] for section in sections]},
+            "language": language
+        })
+        sections = [section for section in sections if section['id'] not in set(voiced)]
+    sections = [section for section in sections if section.get("text_content") or section.get("selected_text")]
+    texts = [section.get("text_content") or section.get("selected_text") for section in sections]
+    await update_job(job_id, progress={"sections_done": 0, "sections": len(sections)})
+    if not sections:
+        return {"sections": 0, "audio_ids": []}
+    
+    audio_ids = []
+    async for indexes, clips in iterate_in_thread(polly_service.synthesize_batch(texts, language, voice, 'neural')):
+        for index, (clip, speech_marks) in zip(indexes, clips):
+            section, text = sections[index], texts[index]
+            audio_url, file_path = await store_generated_audio(clip)
+            audio_obj = Audio(
+                section_id=section['id'],
+                language=language,
+                audio_url=audio_url,
+                file_path=file_path,
+                captions=text,
+                source_hash=content_hash(text),
+                provider="polly",
+                voice=voice,
+            )
+            await attach_timing_track(audio_obj, text, speech_marks, mp3_utils.duration_ms(clip))
+            audio_dict = audio_obj.model_dump()
+            audio_dict["created_at"] = audio_dict["created_at"].isoformat()
+            await db.audios.insert_one(audio_dict)
+            await counter_service.media_added(db, "audios", section['id'])
+            widget_cache.invalidate(section['id'])
+            await process_audio_renditions(audio_obj.id)
+            audio_ids.append(audio_obj.id)
+        await update_job(job_id, progress={"sections_done": len(audio_ids), "sections": len(sections)})
+    
+    return {"sections": len(sections), "audio_ids": audio_ids}
+
+@api_router.post("/pages/{page_id}/audio/generate-batch", response_model=Job, status_code=202)
+async def generate_page_audio_batch(
+    page_id: str,
+    background_tasks: BackgroundTasks,
+    language: str = Form(...),
+    voice: Optional[str] = Form(None),
+    only_missing: bool = Form(True),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Generate Polly audio for every section of a page in one go.
+    Short sections are packed into shared SSML requests and split at speech marks,
+    so a page of headings and list items costs a handful of requests instead of one per section.
+    Returns a job; poll GET /jobs/{job_id}.
+    """
+    page = await db.pages.find_one({"id": page_id}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    job = await create_job(
+        "page_audio_batch",
+        current_user['id'],
+        page['website_id'],
+        {"page_id": page_id, "language": language, "voice": voice, "only_missing": only_missing}
+    )
+    background_tasks.add_task(run_job, job.id, voice_page_sections, page_id, language, voice, only_missing)
+    return job
+
 @api_router.post("/sections/{section_id}/audio/generate-translated", response_model=dict)
 async def generate_translated_audio(
     section_id: str,
+    background_tasks: BackgroundTasks,
     target_language: str = Form(...),
     language_code: str = Form(...),
     provider: str = Form("polly"),  # Use Polly for translated audio
@@ -1350,20 +2547,18 @@ async def generate_translated_audio(
         if not source_text:
             raise HTTPException(status_code=400, detail="Section has no text")
         
-        # Step 1: Translate text
+        # Step 1: Translate text (source language detected once per section text)
         translated_text = translate_service.translate_text(
             text=source_text,
-            source_language='auto',
+            source_language=await get_section_language(section),
             target_language=target_language
         )
         
-        # Step 2: Generate audio from translated text using Polly (run in thread)
-        audio_bytes = await asyncio.to_thread(
-            polly_service.generate_speech,
+        # Step 2: Stream audio (and speech marks) for the translated text from Polly into storage
+        audio_url, file_path, speech_marks, duration_ms = await store_speech_stream(
             translated_text,
             target_language,
-            None,  # Auto-select voice
-            'neural'
+            None  # Auto-select voice
         )
         
         # Step 3: Save translation
@@ -1371,52 +2566,30 @@ async def generate_translated_audio(
             section_id=section_id,
             language=target_language,
             language_code=language_code,
-            text_content=translated_text
+            text_content=translated_text,
+            source_hash=content_hash(source_text)
         )
         translation_dict = translation.model_dump()
         translation_dict['created_at'] = translation_dict['created_at'].isoformat()
         await db.text_translations.insert_one(translation_dict)
         
-        # Step 4: Upload audio to S3
-        file_id = str(uuid.uuid4())
-        file_ext = "mp3"
-        unique_filename = f"audio/{file_id}.{file_ext}"
-        
-        try:
-            # Upload to S3
-            s3_service.s3_client.put_object(
-                Bucket=s3_service.S3_BUCKET_NAME,
-                Key=unique_filename,
-                Body=audio_bytes,
-                ContentType='audio/mpeg'
-            )
-            
-            # Get presigned URL for access
-            audio_url = s3_service.generate_presigned_url(unique_filename)
-            file_path = unique_filename  # Store S3 key
-        except Exception as s3_error:
-            # Fallback to local storage if S3 fails
-            logging.warning(f"S3 upload failed, using local storage: {s3_error}")
-            file_path = AUDIO_DIR / f"{file_id}.{file_ext}"
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(audio_bytes)
-            audio_url = f"/api/uploads/audio/{file_id}.{file_ext}"
-        
         audio_obj = Audio(
             section_id=section_id,
             language=target_language,
             audio_url=audio_url,
             file_path=str(file_path),
             captions=translated_text,
+            source_hash=content_hash(source_text),
+            provider="polly",
         )
+        await attach_timing_track(audio_obj, translated_text, speech_marks, duration_ms)
         
         audio_dict = audio_obj.model_dump()
         audio_dict["created_at"] = audio_dict["created_at"].isoformat()
         await db.audios.insert_one(audio_dict)
-        await db.sections.update_one(
-            {"id": section_id},
-            {"$inc": {"audios_count": 1}}
-        )
+        await counter_service.media_added(db, "audios", section_id)
+        widget_cache.invalidate(section_id)
+        background_tasks.add_task(process_audio_renditions, audio_obj.id)
         
         return {
             "translation": translation,
@@ -1431,8 +2604,16 @@ async def generate_translated_audio(
         )
 
 
-@api_router.get("/sections/{section_id}/audio", response_model=List[Audio])
-async def get_audios(section_id: str, current_user: dict = Depends(get_current_user)):
+@api_router.get("/sections/{section_id}/audio")
+async def get_audios(
+    section_id: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """Audios of a section, oldest first (paginated and projected like GET /websites)"""
     # Security: Verify section belongs to current user
     section = await db.sections.find_one({"id": section_id}, {"_id": 0})
     if not section:
@@ -1446,21 +2627,17 @@ async def get_audios(section_id: str, current_user: dict = Depends(get_current_u
     if not await check_website_access(page['website_id'], current_user['id']):
         raise HTTPException(status_code=403, detail="Access denied: You don't have access to this section")
     
-    audios = await db.audios.find({"section_id": section_id}, {"_id": 0}).to_list(1000)
+    projection = list_projection(Audio, fields)
+    audios = await find_page(db.audios, {"section_id": section_id}, projection, response, limit, cursor)
     
     # SIGN URLS
     for audio in audios:
-        if not audio['audio_url'].startswith("/"):
-            key = audio.get('file_path')
-            if not key and 'amazonaws.com' in audio['audio_url']:
-                key = audio['audio_url'].split('.amazonaws.com/')[-1]
-            if key:
-                audio['audio_url'] = s3_service.generate_presigned_url(key)
+        sign_audio_urls(audio)
     
-    return audios
+    return audios if fields else [Audio(**audio) for audio in audios]
 
 @api_router.delete("/audios/{audio_id}")
-async def delete_audio(audio_id: str, current_user: dict = Depends(get_current_user)):
+async def delete_audio(audio_id: str, background_tasks: BackgroundTasks, current_user: dict = Depends(get_current_user)):
     """Delete an audio file"""
     # Find the audio
     audio = await db.audios.find_one({"id": audio_id}, {"_id": 0})
@@ -1480,10 +2657,42 @@ async def delete_audio(audio_id: str, current_user: dict = Depends(get_current_u
         raise HTTPException(status_code=403, detail="Access denied")
     
     # Delete from database
-    await db.audios.delete_one({"id": audio_id})
+    result = await db.audios.delete_one({"id": audio_id})
+    await counter_service.media_added(db, "audios", audio['section_id'], -result.deleted_count)
+    widget_cache.invalidate(audio['section_id'])
+    s3_keys, local_paths = await collect_stored_files("audios", [audio])
+    await schedule_storage_cleanup(background_tasks, current_user['id'], page['website_id'], s3_keys, local_paths)
     
     return {"message": "Audio deleted successfully"}
 
+@api_router.post("/audios/{audio_id}/renditions")
+async def regenerate_audio_renditions(
+    audio_id: str,
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(get_current_user)
+):
+    """(Re)generate compact Opus/AAC renditions for an audio file, e.g. for audio created before renditions existed"""
+    audio = await db.audios.find_one({"id": audio_id}, {"_id": 0})
+    if not audio:
+        raise HTTPException(status_code=404, detail="Audio not found")
+    
+    section = await db.sections.find_one({"id": audio['section_id']}, {"_id": 0})
+    if not section:
+        raise HTTPException(status_code=404, detail="Section not found")
+    
+    page = await db.pages.find_one({"id": section['page_id']}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    if not media_service.is_available():
+        raise HTTPException(status_code=503, detail="Audio processing is not available on this server")
+    
+    background_tasks.add_task(process_audio_renditions, audio_id)
+    return {"message": "Audio transcoding started", "audio_id": audio_id}
+
 
 # Text Translation API
 @api_router.post("/sections/{section_id}/translations", response_model=TextTranslation)
@@ -1516,6 +2725,7 @@ async def create_text_translation(
         "language": language,
         "language_code": language_code,
         "text_content": text_content,
+        "source_hash": None,  # Written by hand, not derived from the section text
         "created_at": datetime.now(timezone.utc).isoformat()
     }
     
@@ -1539,6 +2749,8 @@ async def create_text_translation(
         translation_dict["id"] = str(uuid.uuid4())
         await db.text_translations.insert_one(translation_dict)
     
+    widget_cache.invalidate(section_id)
+    
     # Remove MongoDB _id for response
     translation_dict.pop("_id", None)
     return translation_dict
@@ -1549,6 +2761,25 @@ async def get_text_translations(section_id: str):
     translations = await db.text_translations.find({"section_id": section_id}, {"_id": 0}).to_list(1000)
     return translations
 
+async def get_section_language(section: dict) -> str:
+    """
+    Source language of a section's text, detected once and stored on the section.
+    The detection is redone only when the text changes. Returns 'auto' if it cannot be determined.
+    """
+    text = section_text(section)
+    text_hash = content_hash(text)
+    if section.get("detected_language_hash") == text_hash:
+        return section.get("detected_language") or "auto"
+    
+    code, method = await asyncio.to_thread(language_service.detect_language, text)
+    await db.sections.update_one(
+        {"id": section['id']},
+        {"$set": {"detected_language": code, "detected_language_hash": text_hash}}
+    )
+    section["detected_language"], section["detected_language_hash"] = code, text_hash
+    logging.info(f"Detected language {code or 'unknown'} for section {section['id']} ({method})")
+    return code or "auto"
+
 @api_router.post("/sections/{section_id}/translations/generate", response_model=TextTranslation)
 async def generate_text_translation(
     section_id: str,
@@ -1580,7 +2811,7 @@ async def generate_text_translation(
         
         translated_text = translate_service.translate_text(
             text=source_text,
-            source_language='auto',  # Auto-detect source language
+            source_language=await get_section_language(section),  # Detected once per section text
             target_language=target_language
         )
         
@@ -1590,6 +2821,7 @@ async def generate_text_translation(
             "language": target_language,
             "language_code": language_code,
             "text_content": translated_text,
+            "source_hash": content_hash(source_text),
             "created_at": datetime.now(timezone.utc).isoformat()
         }
         
@@ -1613,6 +2845,8 @@ async def generate_text_translation(
             translation_dict["id"] = str(uuid.uuid4())
             await db.text_translations.insert_one(translation_dict)
         
+        widget_cache.invalidate(section_id)
+        
         # Remove MongoDB _id for response
         translation_dict.pop("_id", None)
         return translation_dict
@@ -1665,6 +2899,7 @@ async def translate_manual_text(
             "language": target_language,
             "language_code": language_code,
             "text_content": translated_text,
+            "source_hash": None,  # Typed by hand, not derived from the section text
             "created_at": datetime.now(timezone.utc).isoformat()
         }
         
@@ -1688,6 +2923,8 @@ async def translate_manual_text(
             translation_dict["id"] = str(uuid.uuid4())
             await db.text_translations.insert_one(translation_dict)
         
+        widget_cache.invalidate(section_id)
+        
         # Remove MongoDB _id for response
         translation_dict.pop("_id", None)
         return translation_dict
@@ -1725,6 +2962,10 @@ async def generate_all_translations(
         if not source_text:
             raise HTTPException(status_code=400, detail="Section has no text to translate")
         
+        # Detect the source once instead of letting AWS re-detect it for every target language
+        if source_language == "auto":
+            source_language = await get_section_language(section)
+        
         # Get all supported languages
         supported_languages = translate_service.get_supported_languages()
         
@@ -1749,6 +2990,7 @@ async def generate_all_translations(
                     "language": lang_name,
                     "language_code": lang_code,
                     "text_content": translated_text,
+                    "source_hash": content_hash(source_text),
                     "created_at": datetime.now(timezone.utc).isoformat()
                 }
                 
@@ -1771,6 +3013,8 @@ async def generate_all_translations(
                     translation_dict["id"] = str(uuid.uuid4())
                     await db.text_translations.insert_one(translation_dict)
                 
+                widget_cache.invalidate(section_id)
+                
                 # Remove MongoDB _id for response
                 translation_dict.pop("_id", None)
                 translations_created.append(translation_dict)
@@ -1788,6 +3032,273 @@ async def generate_all_translations(
             detail=f"Bulk translation failed: {str(e)}"
         )
 
+async def translate_page(job_id: str, page_id: str, language_codes: List[str], source_language: str) -> dict:
+    """Job handler: translate every section of a page into each language with batched requests"""
+    sections = await db.sections.find(
+        {"page_id": page_id},
+        {"_id": 0, "id": 1, "text_content": 1, "selected_text": 1, "detected_language": 1, "detected_language_hash": 1}
+    ).sort("position_order", 1).to_list(1000)
+    sections = [section for section in sections if section.get("text_content") or section.get("selected_text")]
+    supported_languages = translate_service.get_supported_languages()
+    
+    # Sections are batched per source language (detected once per section text unless given)
+    sections_by_source = {}
+    for section in sections:
+        section_source = source_language if source_language != "auto" else await get_section_language(section)
+        sections_by_source.setdefault(translate_service.normalize_language_code(section_source)
+                                      if section_source != "auto" else "auto", []).append(section)
+    
+    failed = {}
+    for done, lang_code in enumerate(language_codes):
+        await update_job(job_id, progress={"languages_done": done, "languages": len(language_codes), "current": lang_code})
+        translated_pairs = []
+        try:
+            for section_source, source_sections in sections_by_source.items():
+                if section_source == lang_code:
+                    continue
+                texts = [section.get("text_content") or section.get("selected_text") for section in source_sections]
+                translated = await asyncio.to_thread(translate_service.translate_batch, texts, section_source, lang_code)
+                translated_pairs += zip(source_sections, translated)
+        except Exception as e:
+            logging.warning(f"Failed to translate page {page_id} to {lang_code}: {e}")
+            failed[lang_code] = str(e)
+            continue
+        
+        now = datetime.now(timezone.utc).isoformat()
+        # Upsert per section; translations added by hand may use an upper-case code
+        upserts = [
+            UpdateOne(
+                {"section_id": section['id'], "language_code": {"$in": [lang_code, lang_code.upper()]}},
+                {
+                    "$set": {
+                        "language": supported_languages.get(lang_code, lang_code),
+                        "language_code": lang_code,
+                        "text_content": text,
+                        "source_hash": content_hash(section_text(section)),
+                    },
+                    "$setOnInsert": {"id": str(uuid.uuid4()), "section_id": section['id'], "created_at": now},
+                },
+                upsert=True
+            )
+            for section, text in translated_pairs if text
+        ]
+        if upserts:
+            await db.text_translations.bulk_write(upserts, ordered=False)
+            widget_cache.invalidate(page_id)
+    
+    if failed and len(failed) == len(language_codes):
+        raise Exception(f"Translation failed for every language: {failed}")
+    return {"sections": len(sections), "languages": len(language_codes) - len(failed), "failed": failed}
+
+@api_router.post("/pages/{page_id}/translations/generate", response_model=Job, status_code=202)
+async def generate_page_translations(
+    page_id: str,
+    background_tasks: BackgroundTasks,
+    target_languages: str = Form("all"),  # Comma-separated codes (es,fr,...) or "all"
+    source_language: str = Form("auto"),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Translate every section of a page, packing many sections into each AWS Translate request.
+    Existing translations are updated in place. Returns a job; poll GET /jobs/{job_id}.
+    """
+    page = await db.pages.find_one({"id": page_id}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    supported_languages = translate_service.get_supported_languages()
+    if target_languages.strip().lower() == "all":
+        language_codes = list(supported_languages)
+    else:
+        language_codes = [code.strip().lower() for code in target_languages.split(",") if code.strip()]
+        unknown = [code for code in language_codes if code not in supported_languages]
+        if unknown or not language_codes:
+            raise HTTPException(status_code=400, detail=f"Unsupported languages: {', '.join(unknown) or 'none given'}")
+    
+    job = await create_job(
+        "page_translation",
+        current_user['id'],
+        page['website_id'],
+        {"page_id": page_id, "languages": language_codes, "source_language": source_language},
+        args=[page_id, language_codes, source_language]
+    )
+    background_tasks.add_task(run_job, job.id, translate_page, page_id, language_codes, source_language)
+    return job
+
+# Incremental regeneration - only audio/translations built from an older section text are redone
+async def find_stale_artifacts(page_id: str, include_untracked: bool = False) -> tuple[dict, list, list]:
+    """
+    Compare derived artifacts of a page against the current section text.
+    Returns (sections by id, stale translations, stale audios). Artifacts without a source_hash
+    (created before hashes were recorded) count as stale only with include_untracked;
+    uploaded audio and hand-written translations are never regenerated.
+    """
+    sections = await db.sections.find(
+        {"page_id": page_id},
+        {"_id": 0, "id": 1, "text_content": 1, "selected_text": 1, "content_hash": 1,
+         "detected_language": 1, "detected_language_hash": 1}
+    ).to_list(1000)
+    
+    # Backfill hashes for sections created before they were recorded
+    backfill = []
+    for section in sections:
+        current = content_hash(section_text(section))
+        if section.get("content_hash") != current:
+            section["content_hash"] = current
+            backfill.append(UpdateOne({"id": section['id']}, {"$set": {"content_hash": current}}))
+    if backfill:
+        await db.sections.bulk_write(backfill, ordered=False)
+    
+    sections_by_id = {section['id']: section for section in sections if section_text(section)}
+    
+    def is_stale(artifact: dict) -> bool:
+        section = sections_by_id.get(artifact['section_id'])
+        if not section:
+            return False
+        if artifact.get("source_hash") is None:
+            return include_untracked
+        return artifact["source_hash"] != section["content_hash"]
+    
+    query = {"section_id": {"$in": list(sections_by_id)}}
+    # Hand-written translations store source_hash None explicitly; untracked ones predate the field
+    tracked = [{"source_hash": {"$ne": None}}]
+    if include_untracked:
+        tracked.append({"source_hash": {"$exists": False}})
+    translations = await db.text_translations.find({**query, "$or": tracked}, {"_id": 0}).to_list(100000)
+    audios = await db.audios.find({**query, "captions": {"$ne": None}}, {"_id": 0}).to_list(100000)
+    return (
+        sections_by_id,
+        [translation for translation in translations if is_stale(translation)],
+        [audio for audio in audios if is_stale(audio)],
+    )
+
+async def regenerate_stale_artifacts(job_id: str, page_id: str, include_untracked: bool) -> dict:
+    """Job handler: retranslate and re-voice only what is out of date on a page"""
+    sections_by_id, stale_translations, stale_audios = await find_stale_artifacts(page_id, include_untracked)
+    await update_job(job_id, progress={"translations": len(stale_translations), "audios": len(stale_audios)})
+    
+    # Translations: one batched request set per target language and source language
+    by_language = {}
+    for translation in stale_translations:
+        by_language.setdefault(translation['language_code'].lower(), []).append(translation)
+    translated = 0
+    for lang_code, translations in by_language.items():
+        by_source = {}
+        for translation in translations:
+            section = sections_by_id[translation['section_id']]
+            by_source.setdefault(await get_section_language(section), []).append(translation)
+        for source_language, group in by_source.items():
+            texts = [section_text(sections_by_id[translation['section_id']]) for translation in group]
+            results = await asyncio.to_thread(translate_service.translate_batch, texts, source_language, lang_code)
+            upserts = [
+                UpdateOne(
+                    {"id": translation['id']},
+                    {"$set": {
+                        "text_content": text,
+                        "source_hash": sections_by_id[translation['section_id']]['content_hash'],
+                    }}
+                )
+                for translation, text in zip(group, results) if text
+            ]
+            if upserts:
+                await db.text_translations.bulk_write(upserts, ordered=False)
+                translated += len(upserts)
+    
+    # Audio: re-voice from the section's translation in the audio's language (refreshed above), else its text
+    regenerated = 0
+    failed = []
+    for audio in stale_audios:
+        section = sections_by_id[audio['section_id']]
+        text = section_text(section)
+        translation = await db.text_translations.find_one(
+            {"section_id": section['id'], "language": audio['language']},
+            {"_id": 0, "text_content": 1}
+        )
+        if translation:
+            text = translation['text_content']
+        try:
+            generated = await synthesize_to_storage(
+                text, audio['language'], audio.get('provider') or "polly", audio.get('voice') or "alloy"
+            )
+        except Exception as e:
+            logging.warning(f"Failed to regenerate audio {audio['id']}: {e}")
+            failed.append(audio['id'])
+            continue
+        
+        # Same audio id, so the widget and renditions/captions keys stay stable
+        audio_obj = Audio(**{
+            **audio,
+            "audio_url": generated['audio_url'],
+            "file_path": str(generated['file_path']),
+            "captions": text,
+            "source_hash": section['content_hash'],
+            "provider": generated['provider'],
+            "voice": generated['voice'],
+            "renditions": [],
+            "timing": None,
+            "vtt_url": None,
+            "vtt_path": None,
+        })
+        await attach_timing_track(audio_obj, text, generated['speech_marks'], generated['duration_ms'])
+        audio_dict = audio_obj.model_dump(exclude={"id", "created_at"})
+        await db.audios.update_one({"id": audio['id']}, {"$set": audio_dict})
+        try:
+            await asyncio.to_thread(delete_stored_object, audio['file_path'], audio['audio_url'].startswith("/"))
+        except Exception as e:
+            logging.warning(f"Could not delete replaced audio file {audio['file_path']}: {e}")
+        await process_audio_renditions(audio['id'])
+        regenerated += 1
+    
+    widget_cache.invalidate(page_id, *sections_by_id)
+    return {"translations_regenerated": translated, "audios_regenerated": regenerated, "audios_failed": failed}
+
+@api_router.get("/pages/{page_id}/stale")
+async def get_stale_artifacts(page_id: str, include_untracked: bool = False, current_user: dict = Depends(get_current_user)):
+    """List audio and translations built from an older version of their section's text"""
+    page = await db.pages.find_one({"id": page_id}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    _, stale_translations, stale_audios = await find_stale_artifacts(page_id, include_untracked)
+    return {
+        "translations": [{"id": t['id'], "section_id": t['section_id'], "language": t['language']} for t in stale_translations],
+        "audios": [{"id": a['id'], "section_id": a['section_id'], "language": a['language']} for a in stale_audios],
+    }
+
+@api_router.post("/pages/{page_id}/regenerate-stale", response_model=Job, status_code=202)
+async def regenerate_stale(
+    page_id: str,
+    background_tasks: BackgroundTasks,
+    include_untracked: bool = Form(False),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Rebuild only the audio and translations whose section text changed since they were generated.
+    Returns a job; poll GET /jobs/{job_id}.
+    """
+    page = await db.pages.find_one({"id": page_id}, {"_id": 0})
+    if not page:
+        raise HTTPException(status_code=404, detail="Page not found")
+    
+    if not await check_website_access(page['website_id'], current_user['id']):
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    job = await create_job(
+        "regenerate_stale",
+        current_user['id'],
+        page['website_id'],
+        {"page_id": page_id, "include_untracked": include_untracked},
+        args=[page_id, include_untracked]
+    )
+    background_tasks.add_task(run_job, job.id, regenerate_stale_artifacts, page_id, include_untracked)
+    return job
+
 @api_router.delete("/translations/{translation_id}")
 async def delete_text_translation(translation_id: str, current_user: dict = Depends(get_current_user)):
     """Delete a text translation"""
@@ -1810,19 +3321,44 @@ async def delete_text_translation(translation_id: str, current_user: dict = Depe
     
     # Delete from database
     await db.text_translations.delete_one({"id": translation_id})
+    widget_cache.invalidate(translation['section_id'])
     
     return {"message": "Translation deleted successfully"}
 
 # Widget API (Public)
-@api_router.get("/widget/{website_id}/content")
-async def get_widget_content(website_id: str, page_url: str):
-    website = await db.websites.find_one({"id": website_id}, {"_id": 0})
-    if not website:
-        raise HTTPException(status_code=404, detail="Website not found")
-    
-    page = await db.pages.find_one({"website_id": website_id, "url": page_url, "status": "Active"}, {"_id": 0})
+def sign_language_key(language: Optional[str]) -> str:
+    """Widget language code of a stored sign language ("ASL (American Sign Language)" -> "ASL")"""
+    return (language or "").strip().split(" ")[0].upper()
+
+def spoken_language_key(language: Optional[str]) -> str:
+    """
+    Widget language code of a stored spoken language name or code ("Spanish", "es" -> "ES").
+    Languages without a known code keep their own key ("Tagalog" -> "TAGALOG") instead of passing for English.
+    """
+    if not language:
+        return ""
+    return (translate_service.lookup_language_code(language) or language.strip()).upper()
+
+# Characters of section text in the widget outline
+WIDGET_EXCERPT_CHARS = 120
+# What the widget shows per modality: (collection, section field it is added under, stored language field, key function)
+WIDGET_LANGUAGE_SOURCES = {
+    "video": ("videos", "videos", "language", sign_language_key),
+    "audio": ("audios", "audios", "language", spoken_language_key),
+    "text": ("text_translations", "translations", "language_code", spoken_language_key),
+}
+
+async def load_widget_page(website_id: str, page_hash: str, page_url: str) -> dict:
+    """
+    Widget snapshot of a page: its sections (without media), the languages the page has per
+    modality ({code: [stored spellings]}) and the language codes each section has per modality
+    """
+    page = await db.pages.find_one({"website_id": website_id, "url_hash": page_hash, "status": "Active"}, {"_id": 0, "id": 1})
+    if not page:
+        # Pages without a url_hash yet (not migrated, key conflicts, inserted by scripts) still match exactly
+        page = await db.pages.find_one({"website_id": website_id, "url": page_url, "status": "Active"}, {"_id": 0, "id": 1})
     if not page:
-        return {"sections": []}
+        return {"page_id": None}
     
     sections = await db.sections.find({"page_id": page['id'], "status": "Active"}, {"_id": 0}).sort([("position_order", 1), ("order", 1)]).to_list(1000)
     
@@ -1834,54 +3370,146 @@ async def get_widget_content(website_id: str, page_url: str):
         elif 'selected_text' in section and 'text_content' not in section:
             section['text_content'] = section['selected_text']
     
-    # Optimize: Batch fetch all videos and audios to avoid N+1 queries
     section_ids = [section['id'] for section in sections]
+    # (section, stored language) pairs per modality, then the page's narration languages
+    groups = await asyncio.gather(
+        *(db[collection].aggregate([
+            {"$match": {"section_id": {"$in": section_ids}}},
+            {"$group": {"_id": {"section_id": "$section_id", "language": f"${field}"}}},
+        ]).to_list(None) for collection, _, field, _ in WIDGET_LANGUAGE_SOURCES.values()),
+        db.narrations.distinct("language", {"page_id": page['id']}),
+    )
+    languages = {}
+    section_languages = {section_id: {} for section_id in section_ids}
+    for modality, pairs in zip(WIDGET_LANGUAGE_SOURCES, groups):
+        key = WIDGET_LANGUAGE_SOURCES[modality][3]
+        languages[modality] = {}
+        for pair in pairs:
+            language = pair['_id'].get('language')
+            if not language:
+                continue
+            code = key(language)
+            spellings = languages[modality].setdefault(code, [])
+            if language not in spellings:
+                spellings.append(language)
+            codes = section_languages[pair['_id']['section_id']].setdefault(modality, [])
+            if code not in codes:
+                codes.append(code)
+    languages["narration"] = {}
+    for language in groups[-1]:
+        if language:
+            languages["narration"].setdefault(spoken_language_key(language), []).append(language)
     
-    if section_ids:
-        all_videos = await db.videos.find({"section_id": {"$in": section_ids}}, {"_id": 0}).to_list(10000)
-        all_audios = await db.audios.find({"section_id": {"$in": section_ids}}, {"_id": 0}).to_list(10000)
-        all_translations = await db.text_translations.find({"section_id": {"$in": section_ids}}, {"_id": 0}).to_list(10000)
-        
-        # Create lookup dictionaries for O(1) access AND SIGN URLS
-        videos_by_section = {}
-        for video in all_videos:
-            # SIGN VIDEO URL
-            if not video['video_url'].startswith("/"):
-                key = video.get('file_path')
-                if not key and 'amazonaws.com' in video['video_url']:
-                    key = video['video_url'].split('.amazonaws.com/')[-1]
-                if key:
-                    video['video_url'] = s3_service.generate_presigned_url(key)
-
-            if video['section_id'] not in videos_by_section:
-                videos_by_section[video['section_id']] = []
-            videos_by_section[video['section_id']].append(video)
-        
-        audios_by_section = {}
-        for audio in all_audios:
-            # SIGN AUDIO URL
-            if not audio['audio_url'].startswith("/"):
-                key = audio.get('file_path')
-                if not key and 'amazonaws.com' in audio['audio_url']:
-                    key = audio['audio_url'].split('.amazonaws.com/')[-1]
-                if key:
-                    audio['audio_url'] = s3_service.generate_presigned_url(key)
-
-            if audio['section_id'] not in audios_by_section:
-                audios_by_section[audio['section_id']] = []
-            audios_by_section[audio['section_id']].append(audio)
-        
-        translations_by_section = {}
-        for translation in all_translations:
-            if translation['section_id'] not in translations_by_section:
-                translations_by_section[translation['section_id']] = []
-            translations_by_section[translation['section_id']].append(translation)
-        
-        # Attach videos, audios, and translations to each section
-        for section in sections:
-            section['videos'] = videos_by_section.get(section['id'], [])
-            section['audios'] = audios_by_section.get(section['id'], [])
-            section['translations'] = translations_by_section.get(section['id'], [])
+    return {
+        "page_id": page['id'],
+        "sections": sections,
+        "section_ids": section_ids,
+        "section_languages": section_languages,
+        "languages": languages,
+    }
+
+async def load_widget_media(page: dict, code: str, section_ids: list) -> dict:
+    """Widget snapshot of one language's signed videos, audios and translations for some of a page's sections, by section"""
+    queries = {}
+    for modality, (collection, _, field, _) in WIDGET_LANGUAGE_SOURCES.items():
+        spellings = page['languages'][modality].get(code)
+        if spellings:
+            queries[modality] = db[collection].find(
+                {"section_id": {"$in": section_ids}, field: {"$in": spellings}}, {"_id": 0}
+            ).to_list(None)
+    results = dict(zip(queries, await asyncio.gather(*queries.values())))
+    
+    by_section = {}
+    for modality, (_, section_field, _, _) in WIDGET_LANGUAGE_SOURCES.items():
+        for item in results.get(modality, []):
+            if modality == "video":
+                sign_video_urls(item)
+            elif modality == "audio":
+                sign_audio_urls(item)
+            item['language_key'] = code
+            by_section.setdefault(item['section_id'], {}).setdefault(section_field, []).append(item)
+    return by_section
+
+async def load_widget_narrations(page: dict, code: str) -> list:
+    """Widget snapshot of a page's whole-page narrations in one language (chapters point at sections)"""
+    spellings = page['languages']['narration'].get(code)
+    if not spellings:
+        return []
+    narrations = await db.narrations.find({"page_id": page['page_id'], "language": {"$in": spellings}}, {"_id": 0}).to_list(None)
+    for narration in narrations:
+        narration['audio_url'] = sign_media_url(narration['audio_url'], narration.get('file_path'))
+        narration['language_key'] = code
+    return narrations
+
+async def widget_page(website_id: str, page_url: str) -> dict:
+    """Cached widget snapshot of the page at page_url (one indexed lookup on a miss, whatever URL variant the browser reports)"""
+    website = await widget_cache.get(
+        ("website", website_id),
+        lambda: db.websites.find_one({"id": website_id}, {"_id": 0, "id": 1, "url_rules": 1})
+    )
+    if not website:
+        raise HTTPException(status_code=404, detail="Website not found")
+    page_hash = url_service.url_hash(page_url, website.get('url_rules'))
+    # Pages not found are not cached, so a page that is added or activated shows up right away
+    return await widget_cache.get(
+        ("page", website_id, page_hash),
+        lambda: load_widget_page(website_id, page_hash, page_url),
+        keep=lambda page: page['page_id'] is not None,
+        tags=lambda page: [page['page_id'], *page['section_ids']]
+    )
+
+def widget_languages(page: dict, languages: Optional[str]) -> tuple[dict, list]:
+    """
+    (codes the page has per modality, codes to return) for a comma-separated preference list -
+    unknown codes are dropped, and no list means every language the page has
+    """
+    available = {modality: sorted(codes) for modality, codes in page['languages'].items()}
+    all_codes = sorted({code for codes in available.values() for code in codes})
+    if languages is None:
+        return available, all_codes
+    return available, list(dict.fromkeys(
+        code.strip().upper() for code in languages.split(",") if code.strip().upper() in all_codes
+    ))
+
+async def widget_narrations(page: dict, codes: list) -> list:
+    narrations = await asyncio.gather(*(
+        widget_cache.get(("narrations", page['page_id'], code), lambda code=code: load_widget_narrations(page, code))
+        for code in codes
+    ))
+    return [narration for by_language in narrations for narration in by_language]
+
+def with_widget_media(section: dict, media: list) -> dict:
+    """Copy of a cached section with the media of each language snapshot added (snapshots are shared, so never modified)"""
+    section = {**section, "videos": [], "audios": [], "translations": []}
+    for by_section in media:
+        for field, items in by_section.get(section['id'], {}).items():
+            section[field] = section[field] + items
+    return section
+
+@api_router.get("/widget/{website_id}/content")
+async def get_widget_content(website_id: str, page_url: str, languages: Optional[str] = None):
+    """
+    Sections of the page at page_url with their media and translations.
+
+    `languages` is the visitor's comma-separated language codes in order of preference (e.g.
+    "ASL,EN,ES"); only media in those languages is returned, preferred first. Without it every
+    language is returned. `languages` in the response lists the codes the page has per modality.
+    """
+    page = await widget_page(website_id, page_url)
+    if not page['page_id']:
+        return {"sections": [], "narrations": [], "languages": {}}
+    
+    available, codes = widget_languages(page, languages)
+    media = await asyncio.gather(*(
+        widget_cache.get(
+            ("media", page['page_id'], code),
+            lambda code=code: load_widget_media(page, code, page['section_ids']),
+            tags=lambda _: page['section_ids']
+        )
+        for code in codes
+    ))
+    sections = [with_widget_media(section, media) for section in page['sections']]
+    narrations = await widget_narrations(page, codes)
     
     # Track analytics
     await db.analytics.update_one(
@@ -1890,17 +3518,77 @@ async def get_widget_content(website_id: str, page_url: str):
         upsert=True
     )
     
-    return {"sections": sections}
+    return {"sections": sections, "narrations": narrations, "languages": available}
+
+@api_router.get("/widget/{website_id}/outline")
+async def get_widget_outline(website_id: str, page_url: str, languages: Optional[str] = None):
+    """
+    Lightweight table of contents of the page at page_url: per section its id, a short excerpt
+    and the language codes it has per modality, plus the page's narrations in `languages` (see
+    the content endpoint). The widget loads section details on demand from /sections/{section_id}.
+    """
+    page = await widget_page(website_id, page_url)
+    if not page['page_id']:
+        return {"page_id": None, "sections": [], "narrations": [], "languages": {}}
+    
+    available, codes = widget_languages(page, languages)
+    sections = [
+        {
+            "id": section['id'],
+            "position_order": section.get('position_order'),
+            "excerpt": (section.get('text_content') or "")[:WIDGET_EXCERPT_CHARS],
+            "languages": page['section_languages'].get(section['id'], {}),
+        }
+        for section in page['sections']
+    ]
+    narrations = await widget_narrations(page, codes)
+    
+    # Track analytics (the outline is what opens the widget on a page)
+    await db.analytics.update_one(
+        {"website_id": website_id, "page_url": page_url},
+        {"$inc": {"views": 1}},
+        upsert=True
+    )
+    
+    return {"page_id": page['page_id'], "sections": sections, "narrations": narrations, "languages": available}
+
+@api_router.get("/widget/{website_id}/sections/{section_id}")
+async def get_widget_section(website_id: str, section_id: str, page_url: str, languages: Optional[str] = None):
+    """One section of the page at page_url with its text and its media and translations in `languages`"""
+    page = await widget_page(website_id, page_url)
+    section = next((section for section in page.get('sections', []) if section['id'] == section_id), None)
+    if not section:
+        raise HTTPException(status_code=404, detail="Section not found")
+    
+    _, codes = widget_languages(page, languages)
+    media = await asyncio.gather(*(
+        widget_cache.get(
+            ("section", section_id, code),
+            lambda code=code: load_widget_media(page, code, [section_id]),
+            tags=lambda _: [page['page_id']]
+        )
+        for code in codes
+    ))
+    return with_widget_media(section, media)
 
 # Analytics
 @api_router.get("/analytics/{website_id}")
-async def get_analytics(website_id: str, current_user: dict = Depends(get_current_user)):
-    website = await db.websites.find_one({"id": website_id, "owner_id": current_user['id']})
+async def get_analytics(
+    website_id: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """Per-page analytics of a website (paginated and projected like GET /websites)"""
+    website = await db.websites.find_one({"id": website_id, "owner_id": current_user['id']}, {"_id": 1})
     if not website:
         raise HTTPException(status_code=404, detail="Website not found")
     
-    analytics = await db.analytics.find({"website_id": website_id}, {"_id": 0}).to_list(1000)
-    return analytics
+    analytics = await find_page(db.analytics, {"website_id": website_id}, list_projection(Analytics, fields),
+                                response, limit, cursor)
+    return analytics if fields else [Analytics(**record) for record in analytics]
 
 @api_router.get("/analytics/overview")
 async def get_analytics_overview(current_user: dict = Depends(get_current_user)):
@@ -1977,45 +3665,48 @@ async def invite_user(invite: UserInvite, current_user: dict = Depends(get_curre
     
     return {"message": f"Invitation sent to {invite.email}", "invitation_id": invitation['id']}
 
-# Clean up orphaned media files
-@api_router.post("/admin/cleanup-orphaned-media")
-async def cleanup_orphaned_media(current_user: dict = Depends(get_current_user)):
-    """Remove database records for videos/audio files that no longer exist on disk"""
-    
-    videos_removed = 0
-    audios_removed = 0
-    
-    # Check all videos
-    videos = await db.videos.find({}, {"_id": 0}).to_list(10000)
-    for video in videos:
-        file_path = Path(video.get('file_path', ''))
-        if not file_path.exists():
-            await db.videos.delete_one({"id": video['id']})
-            # Update section video count
-            await db.sections.update_one(
-                {"id": video['section_id']},
-                {"$inc": {"videos_count": -1}}
-            )
-            videos_removed += 1
-    
-    # Check all audios
-    audios = await db.audios.find({}, {"_id": 0}).to_list(10000)
-    for audio in audios:
-        file_path = Path(audio.get('file_path', ''))
-        if not file_path.exists():
-            await db.audios.delete_one({"id": audio['id']})
-            # Update section audio count
-            await db.sections.update_one(
-                {"id": audio['section_id']},
-                {"$inc": {"audios_count": -1}}
-            )
-            audios_removed += 1
-    
-    return {
-        "message": "Cleanup complete",
-        "videos_removed": videos_removed,
-        "audios_removed": audios_removed
-    }
+@api_router.get("/admin/cache-stats")
+async def get_cache_stats(current_user: dict = Depends(get_admin_user)):
+    """Hit/miss/eviction counters of the in-process authentication and widget caches"""
+    return {**auth_cache.stats(), "widget": widget_cache.stats()}
+
+@api_router.get("/admin/password-pool-stats")
+async def get_password_pool_stats(current_user: dict = Depends(get_admin_user)):
+    """Queue depth, timings and load-shedding counters of the bcrypt worker pool"""
+    return password_service.stats()
+
+# Storage reconciliation (orphaned files and records pointing at missing files)
+async def reconcile_storage_job(job_id: str, dry_run: bool) -> dict:
+    """Job handler: diff S3 and local storage against the media records and fix both sides"""
+    return await reconcile_service.reconcile_storage(db, UPLOAD_DIR, dry_run=dry_run)
+
+@api_router.post("/admin/cleanup-orphaned-media", response_model=Job, status_code=202)
+async def cleanup_orphaned_media(
+    background_tasks: BackgroundTasks,
+    dry_run: bool = Form(False),
+    current_user: dict = Depends(get_admin_user)
+):
+    """
+    Delete stored files no record uses and records whose files are gone.
+    Returns a job; poll GET /jobs/{job_id} for the report.
+    """
+    job = await create_job("storage_reconciliation", current_user['id'], None, {"dry_run": dry_run}, args=[dry_run])
+    background_tasks.add_task(run_job, job.id, reconcile_storage_job, dry_run)
+    return job
+
+async def repair_counters_job(job_id: str) -> dict:
+    """Job handler: recompute the maintained counters and fix the ones that drifted"""
+    return await counter_service.repair_counters(db)
+
+@api_router.post("/admin/repair-counters", response_model=Job, status_code=202)
+async def repair_counters(background_tasks: BackgroundTasks, current_user: dict = Depends(get_admin_user)):
+    """
+    Recompute website, page, section and user counters now instead of waiting for the periodic pass.
+    Returns a job; poll GET /jobs/{job_id} for the report.
+    """
+    job = await create_job("counter_repair", current_user['id'], None, {}, args=[])
+    background_tasks.add_task(run_job, job.id, repair_counters_job)
+    return job
 
 # Serve uploaded files
 from fastapi.staticfiles import StaticFiles
@@ -2262,6 +3953,92 @@ app.include_router(api_router)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def open_http_clients():
+    await openai_tts_service.startup()
+
+@app.on_event("startup")
+async def create_indexes():
+    # Upload dedup looks objects up by content hash; storage cleanup by key
+    await db.media_objects.create_index("id", unique=True)
+    await db.media_objects.create_index("file_key")
+    # Paginated listings walk these in order (see find_page)
+    await db.websites.create_index([("owner_id", 1), ("_id", 1)])
+    await db.websites.create_index([("collaborators", 1), ("_id", 1)])
+    await db.pages.create_index([("website_id", 1), ("_id", 1)])
+    await db.sections.create_index([("page_id", 1), ("position_order", 1), ("_id", 1)])
+    await db.videos.create_index([("section_id", 1), ("_id", 1)])
+    await db.audios.create_index([("section_id", 1), ("_id", 1)])
+    await db.analytics.create_index([("website_id", 1), ("_id", 1)])
+    # Section translations are joined per section ($lookup in the page overview) and listed per section
+    await db.text_translations.create_index([("section_id", 1), ("_id", 1)])
+    # One narration per page and language (build_page_narration replaces it in place)
+    await db.narrations.create_index([("page_id", 1), ("language", 1)], unique=True)
+    await db.user_stats.create_index("id", unique=True)
+    # Unfinished jobs are looked up at startup
+    await db.jobs.create_index("status")
+    # Widget fallback for pages without a url_hash
+    await db.pages.create_index([("website_id", 1), ("url", 1)])
+    # One page per canonical URL; pages not keyed yet (url_hash missing) are left out until migrated
+    await db.pages.create_index(
+        [("website_id", 1), ("url_hash", 1)],
+        unique=True,
+        partialFilterExpression={"url_hash": {"$type": "string"}}
+    )
+
+@app.on_event("startup")
+async def start_migrations():
+    # In the background so startup is not held up; an interrupted run resumes on the next start
+    app.state.migrations = asyncio.create_task(migration_service.run_migrations(db))
+
+# Job types that are safe to run again from their stored args when a restart interrupted them.
+# Long-form audio is left out: its Polly task may already be running and would be started twice.
+RESUMABLE_JOBS = {
+    "storage_cleanup": delete_stored_files,
+    "page_narration": build_page_narration,
+    "page_translation": translate_page,
+    "regenerate_stale": regenerate_stale_artifacts,
+    "storage_reconciliation": reconcile_storage_job,
+    "counter_repair": repair_counters_job,
+}
+
+async def recover_jobs() -> dict:
+    """
+    Settle jobs a restart left queued or running: resumable ones (see RESUMABLE_JOBS) run again
+    from their stored args, the rest are marked failed so clients polling them stop waiting
+    """
+    jobs = await db.jobs.find(
+        {"status": {"$in": ["queued", "running"]}},
+        {"_id": 0, "id": 1, "type": 1, "args": 1}
+    ).to_list(None)
+    resumable = [job for job in jobs if job['type'] in RESUMABLE_JOBS and 'args' in job]
+    failed = [job['id'] for job in jobs if job not in resumable]
+    if failed:
+        await db.jobs.update_many({"id": {"$in": failed}}, {"$set": {
+            "status": "failed",
+            "error": "Interrupted by a server restart, please start it again",
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }})
+    app.state.resumed_jobs = [
+        asyncio.create_task(run_job(job['id'], RESUMABLE_JOBS[job['type']], *job['args'])) for job in resumable
+    ]
+    if jobs:
+        logger.info(f"Recovered jobs interrupted by a restart: {len(resumable)} resumed, {len(failed)} failed")
+    return {"resumed": len(resumable), "failed": len(failed)}
+
+@app.on_event("startup")
+async def start_interrupted_jobs():
+    # Background tasks die with the process - nothing else would ever finish these jobs
+    await recover_jobs()
+
+@app.on_event("startup")
+async def start_counter_repair():
+    # First pass backfills counters of existing records, later passes fix any drift
+    app.state.counter_repair = asyncio.create_task(counter_service.repair_periodically(db))
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    app.state.counter_repair.cancel()
     client.close()
+    await openai_tts_service.shutdown()
+    password_service.shutdown()
@@ -38,6 +38,15 @@
   let darkMode = true;
   let highContrast = false;
   let firstOpen = true;
+  // Page elements matched to each section, looked up once instead of on every play
+  const pageElementIndex = new Map();
+  // Whole-page narration plays in one element that survives re-renders; chapters drive the current section
+  const narrationAudio = new Audio();
+  narrationAudio.preload = 'none';
+  let narrationChapter = -1;
+  // Section text and media are fetched on demand: requests in flight and loaded sections by id
+  const sectionRequests = new Map();
+  const loadedSections = new Map();
   
   // Load preferences from localStorage
   const savedPreferences = localStorage.getItem('pivot-widget-preferences');
@@ -373,6 +382,10 @@
       padding-left: 12px;
       color: #1a1a1a;
     }
+    .pivot-word.active {
+      background: rgba(0, 206, 209, 0.35);
+      border-radius: 3px;
+    }
 
     /* Bottom Navigation */
     .pivot-bottom-nav {
@@ -790,6 +803,91 @@
     }
   }
 
+  // Language codes to request content in, most preferred first (sign language, audio, text)
+  function preferredLanguages() {
+    return [...new Set([selectedLanguages.video, selectedLanguages.audio, selectedLanguages.text].map(code => code.toUpperCase()))];
+  }
+
+  // Full section at index (text, media and translations), fetched once; null past the last section
+  function loadSection(index) {
+    const outline = contentData && contentData.sections[index];
+    if (!outline) return null;
+    // Built-in content comes complete
+    if (outline.videos) return Promise.resolve(outline);
+    if (!sectionRequests.has(outline.id)) {
+      const requestedFor = contentData;
+      const params = `page_url=${encodeURIComponent(window.location.href)}&languages=${encodeURIComponent(contentData.requestedLanguages.join(','))}`;
+      const request = fetch(`${CONFIG.apiBaseUrl}/widget/${CONFIG.websiteId}/sections/${outline.id}?${params}`)
+        .then(response => {
+          if (!response.ok) throw new Error(`Section request failed: ${response.status}`);
+          return response.json();
+        })
+        .then(detail => {
+          const section = { ...outline, ...detail };
+          // Content reloaded in other languages meanwhile - do not mix the old response in
+          if (contentData === requestedFor) loadedSections.set(outline.id, section);
+          return section;
+        })
+        .catch(error => {
+          sectionRequests.delete(outline.id);
+          throw error;
+        });
+      sectionRequests.set(outline.id, request);
+    }
+    return sectionRequests.get(outline.id);
+  }
+
+  // Items in one language (items without a language_key, e.g. built-in content, always match)
+  function inLanguage(items, code) {
+    return (items || []).filter(item => !item.language_key || item.language_key === code.toUpperCase());
+  }
+
+  // Narration in the selected audio language, if the page has one
+  function currentNarration() {
+    const narrations = (contentData && contentData.narrations) || [];
+    return inLanguage(narrations, selectedLanguages.audio)[0] || null;
+  }
+
+  function narrationButtonLabel() {
+    return narrationAudio.paused ? '▶ Listen to the whole page' : '❚❚ Pause page narration';
+  }
+
+  function updateNarrationButton() {
+    const narrationBtn = document.getElementById('pivot-narration-btn');
+    if (narrationBtn) narrationBtn.textContent = narrationButtonLabel();
+  }
+
+  // Seek the narration to the chapter of a section (no-op if that chapter is already playing)
+  function seekNarrationToSection(narration, sectionId) {
+    const index = narration.chapters.findIndex(c => c.section_id === sectionId);
+    if (index < 0 || index === narrationChapter) return;
+    narrationChapter = index;
+    narrationAudio.currentTime = narration.chapters[index].start_ms / 1000;
+  }
+
+  // Manual section navigation moves a playing narration along with it
+  function followSectionWithNarration() {
+    const narration = currentNarration();
+    if (narration && !narrationAudio.paused) {
+      seekNarrationToSection(narration, contentData.sections[currentSectionIndex].id);
+    }
+  }
+
+  narrationAudio.addEventListener('play', updateNarrationButton);
+  narrationAudio.addEventListener('pause', updateNarrationButton);
+  narrationAudio.addEventListener('timeupdate', () => {
+    const narration = currentNarration();
+    if (!narration || !contentData) return;
+    const index = findTimingIndex(narration.chapters.map(c => [c.start_ms]), narrationAudio.currentTime * 1000);
+    if (index < 0 || index === narrationChapter) return;
+    narrationChapter = index;
+    const sectionIndex = contentData.sections.findIndex(s => s.id === narration.chapters[index].section_id);
+    if (sectionIndex >= 0 && sectionIndex !== currentSectionIndex) {
+      currentSectionIndex = sectionIndex;
+      if (isOpen && currentView === 'content') renderContent();
+    }
+  });
+
   function closeWidget() {
     isOpen = false;
     button.classList.remove('hidden');
@@ -850,6 +948,34 @@
     }, 100);
   }
 
+  // Wrap each timed word of the caption text in a span (offsets come from the audio's timing track)
+  function renderTimedText(text, timing) {
+    let html = '';
+    let cursor = 0;
+    timing.words.forEach(([, start, end], i) => {
+      html += text.slice(cursor, start) + `<span class="pivot-word" data-word="${i}">${text.slice(start, end)}</span>`;
+      cursor = end;
+    });
+    return html + text.slice(cursor);
+  }
+
+  // Index of the last timing entry starting at or before timeMs (entries are sorted by time)
+  function findTimingIndex(entries, timeMs) {
+    let lo = 0;
+    let hi = entries.length - 1;
+    let found = -1;
+    while (lo <= hi) {
+      const mid = (lo + hi) >> 1;
+      if (entries[mid][0] <= timeMs) {
+        found = mid;
+        lo = mid + 1;
+      } else {
+        hi = mid - 1;
+      }
+    }
+    return found;
+  }
+
   function renderContent() {
     currentView = 'content';
     const mainContent = document.getElementById('pivot-main-content');
@@ -860,7 +986,8 @@
       return;
     }
 
-    const section = contentData.sections[currentSectionIndex];
+    const outline = contentData.sections[currentSectionIndex];
+    const section = outline.videos ? outline : loadedSections.get(outline.id);
     
     // Count active modalities
     const activeCount = Object.values(enabledModalities).filter(v => v).length;
@@ -870,6 +997,26 @@
       showGettingStarted();
       return;
     }
+
+    // Fetch the section, then render it if the visitor is still on it
+    if (!section) {
+      const index = currentSectionIndex;
+      modal.className = 'pivot-widget-modal open content-view';
+      mainContent.innerHTML = '<div class="pivot-loading">Loading...</div>';
+      loadSection(index).then(() => {
+        if (currentView === 'content' && currentSectionIndex === index) renderContent();
+      }).catch(error => {
+        console.error('Failed to load section:', error);
+        if (currentView === 'content' && currentSectionIndex === index) {
+          mainContent.innerHTML = '<div class="pivot-loading">Unable to load content</div>';
+        }
+      });
+      return;
+    }
+
+    // Prefetch the next section in the background so moving forward is instant
+    const next = loadSection(currentSectionIndex + 1);
+    if (next) next.catch(() => {});
     
     // Apply dynamic height based on number of active modalities
     modal.className = `pivot-widget-modal open content-view content-view-${activeCount}`;
@@ -882,17 +1029,22 @@
     const textLangFlag = SPOKEN_LANGUAGES.find(l => l.code === selectedLanguages.text)?.flag || '🇺🇸';
     const audioLangFlag = SPOKEN_LANGUAGES.find(l => l.code === selectedLanguages.audio)?.flag || '🇺🇸';
     
+    // Content is requested in the selected languages only; audio and translations may hold two of them
+    const videos = inLanguage(section.videos, selectedLanguages.video);
+    const audios = inLanguage(section.audios, selectedLanguages.audio);
+    const translation = inLanguage(section.translations, selectedLanguages.text).find(t => t.language_key);
+
     // Video modality
     if (enabledModalities.video) {
-      if (section.videos && section.videos.length > 0) {
+      if (videos.length > 0) {
         contentHTML += `
           <div class="pivot-video-container">
             <div style="position: absolute; top: 8px; left: 8px; background: rgba(0,0,0,0.7); padding: 6px 10px; border-radius: 20px; display: flex; align-items: center; gap: 4px; z-index: 10;">
               <span style="font-size: 18px;">${videoLangFlag}</span>
               <span style="color: white; font-size: 11px; font-weight: 600;">ASL</span>
             </div>
-            <video class="pivot-video-player" id="pivot-video" controls controlsList="nodownload" disablePictureInPicture>
-              <source src="${section.videos[0].video_url}" type="video/mp4">
+            <video class="pivot-video-player" id="pivot-video" controls controlsList="nodownload" disablePictureInPicture preload="none"${videos[0].poster_url ? ` poster="${videos[0].poster_url}"` : ''}>
+              <source src="${videos[0].video_url}" type="video/mp4">
             </video>
             <div class="pivot-video-speed-selector">
               <select id="speed-select" class="pivot-speed-dropdown">
@@ -909,6 +1061,9 @@
       }
     }
 
+    // Karaoke-style highlighting is possible when the audio was generated from the displayed text
+    const timedAudio = translation ? null : audios.find(a => a.timing && a.timing.words && a.timing.words.length && a.captions === section.text_content);
+
     // Text modality
     if (enabledModalities.text) {
       contentHTML += `
@@ -917,26 +1072,36 @@
             <span style="font-size: 16px;">${textLangFlag}</span>
             <span style="color: white; font-size: 10px; font-weight: 600;">${selectedLanguages.text}</span>
           </div>
-          <p id="pivot-text-paragraph">${section.text_content || 'No text content available'}</p>
+          <p id="pivot-text-paragraph">${timedAudio ? renderTimedText(section.text_content, timedAudio.timing) : ((translation ? translation.text_content : section.text_content) || 'No text content available')}</p>
         </div>
       `;
     }
 
     // Audio modality
-    if (enabledModalities.audio && section.audios && section.audios.length > 0) {
+    if (enabledModalities.audio && audios.length > 0) {
+      const playableAudio = timedAudio || audios[0];
       contentHTML += `
         <div class="pivot-audio-player" style="position: relative; padding-top: 8px;">
           <div style="position: absolute; top: 0; left: 8px; background: rgba(0,0,0,0.7); padding: 4px 8px; border-radius: 12px; display: flex; align-items: center; gap: 4px; z-index: 10;">
             <span style="font-size: 16px;">${audioLangFlag}</span>
             <span style="color: white; font-size: 10px; font-weight: 600;">${selectedLanguages.audio}</span>
           </div>
-          <audio id="pivot-audio" controls controlsList="nodownload" style="margin-top: 16px;">
-            <source src="${section.audios[0].audio_url}" type="audio/mpeg">
+          <audio id="pivot-audio" controls controlsList="nodownload" preload="none" style="margin-top: 16px;">
+            ${(playableAudio.renditions || []).map(r => `<source src="${r.audio_url}" type="${r.content_type}">`).join('')}
+            <source src="${playableAudio.audio_url}" type="audio/mpeg">
           </audio>
         </div>
       `;
     }
 
+    // Whole-page narration
+    const narration = enabledModalities.audio ? currentNarration() : null;
+    if (narration) {
+      contentHTML += `
+        <button class="pivot-language-btn" id="pivot-narration-btn" style="margin-top: 8px;" onclick="window.PIVOTWidget.toggleNarration()">${narrationButtonLabel()}</button>
+      `;
+    }
+
     // Bottom navigation
     const navHTML = `
       <div class="pivot-bottom-nav">
@@ -978,18 +1143,12 @@
       // Webpage text highlighting - find and highlight matching text on the actual page
       const currentSectionText = section.text_content || section.selected_text || '';
       
-      function highlightTextOnPage() {
-        // Remove any existing highlights
-        document.querySelectorAll('.pivot-highlighted-section').forEach(el => {
-          el.classList.remove('pivot-highlighted-section');
-          el.style.background = '';
-          el.style.outline = '';
-          el.style.transition = '';
-        });
-        
-        if (!currentSectionText) return;
-        
-        // Search for matching text in the page DOM
+      // Search the page DOM once per section; later plays reuse the indexed element
+      function findPageElement() {
+        if (pageElementIndex.has(section.id)) {
+          return pageElementIndex.get(section.id);
+        }
+        let match = null;
         const allElements = document.querySelectorAll('p, h1, h2, h3, h4, h5, h6, div, span, section, article');
         
         for (let element of allElements) {
@@ -1003,16 +1162,57 @@
           // Check if this element contains the section text (partial or full match)
           if (elementText && currentSectionText.includes(elementText.substring(0, 50)) || 
               elementText.includes(currentSectionText.substring(0, 50))) {
-            element.classList.add('pivot-highlighted-section');
-            element.style.background = 'rgba(0, 206, 209, 0.15)';
-            element.style.outline = '3px solid #00CED1';
-            element.style.transition = 'all 0.3s ease';
-            
-            // Scroll element into view
-            element.scrollIntoView({ behavior: 'smooth', block: 'center' });
+            match = element;
             break;
           }
         }
+        pageElementIndex.set(section.id, match);
+        return match;
+      }
+      
+      function highlightTextOnPage() {
+        // Remove any existing highlights
+        document.querySelectorAll('.pivot-highlighted-section').forEach(el => {
+          el.classList.remove('pivot-highlighted-section');
+          el.style.background = '';
+          el.style.outline = '';
+          el.style.transition = '';
+        });
+        
+        if (!currentSectionText) return;
+        
+        const element = findPageElement();
+        if (element) {
+          element.classList.add('pivot-highlighted-section');
+          element.style.background = 'rgba(0, 206, 209, 0.15)';
+          element.style.outline = '3px solid #00CED1';
+          element.style.transition = 'all 0.3s ease';
+          
+          // Scroll element into view
+          element.scrollIntoView({ behavior: 'smooth', block: 'center' });
+        }
+      }
+      
+      // Word highlighting follows the audio clock through the precomputed timing track
+      const wordSpans = textParagraph ? textParagraph.querySelectorAll('.pivot-word') : [];
+      let activeWord = -1;
+      let wordFrame = null;
+      
+      function setActiveWord(index) {
+        if (index === activeWord) return;
+        if (activeWord >= 0 && wordSpans[activeWord]) wordSpans[activeWord].classList.remove('active');
+        if (index >= 0 && wordSpans[index]) wordSpans[index].classList.add('active');
+        activeWord = index;
+      }
+      
+      function followAudio() {
+        setActiveWord(findTimingIndex(timedAudio.timing.words, audio.currentTime * 1000));
+        wordFrame = requestAnimationFrame(followAudio);
+      }
+      
+      function stopFollowingAudio() {
+        if (wordFrame) cancelAnimationFrame(wordFrame);
+        wordFrame = null;
       }
       
       function removeHighlightFromPage() {
@@ -1030,11 +1230,28 @@
         video.onended = removeHighlightFromPage;
       }
       
+      // The page narration follows the sections, so keep the matching page text highlighted
+      if (!narrationAudio.paused) {
+        highlightTextOnPage();
+      }
+      
       // Highlight when audio plays
       if (audio) {
-        audio.onplay = highlightTextOnPage;
-        audio.onpause = removeHighlightFromPage;
-        audio.onended = removeHighlightFromPage;
+        const karaoke = timedAudio && wordSpans.length > 0;
+        audio.onplay = () => {
+          narrationAudio.pause();
+          highlightTextOnPage();
+          if (karaoke) followAudio();
+        };
+        audio.onpause = () => {
+          removeHighlightFromPage();
+          stopFollowingAudio();
+        };
+        audio.onended = () => {
+          removeHighlightFromPage();
+          stopFollowingAudio();
+          setActiveWord(-1);
+        };
       }
     }, 0);
   }
@@ -1352,8 +1569,14 @@
     
     // Normal API flow for other pages
     try {
-      const response = await fetch(`${CONFIG.apiBaseUrl}/widget/${CONFIG.websiteId}/content?page_url=${encodeURIComponent(window.location.href)}`);
-      contentData = await response.json();
+      // Only the outline up front; sections are fetched as they are shown
+      const languages = preferredLanguages();
+      const response = await fetch(`${CONFIG.apiBaseUrl}/widget/${CONFIG.websiteId}/outline?page_url=${encodeURIComponent(window.location.href)}&languages=${encodeURIComponent(languages.join(','))}`);
+      const outline = await response.json();
+      sectionRequests.clear();
+      loadedSections.clear();
+      contentData = outline;
+      contentData.requestedLanguages = languages;
       // Only render if we're in content view (not instructional or getting-started)
       if (currentView === 'content') {
         renderContent();
@@ -1372,15 +1595,34 @@
     prevSection: () => {
       if (currentSectionIndex > 0) {
         currentSectionIndex--;
+        followSectionWithNarration();
         renderContent();
       }
     },
     nextSection: () => {
       if (contentData && currentSectionIndex < contentData.sections.length - 1) {
         currentSectionIndex++;
+        followSectionWithNarration();
         renderContent();
       }
     },
+    toggleNarration: () => {
+      const narration = currentNarration();
+      if (!narration) return;
+      if (!narrationAudio.paused) {
+        narrationAudio.pause();
+        return;
+      }
+      if (narrationAudio.dataset.narrationId !== narration.id) {
+        narrationAudio.src = narration.audio_url;
+        narrationAudio.dataset.narrationId = narration.id;
+        narrationChapter = -1;
+      }
+      const sectionAudio = document.getElementById('pivot-audio');
+      if (sectionAudio) sectionAudio.pause();
+      seekNarrationToSection(narration, contentData.sections[currentSectionIndex].id);
+      narrationAudio.play();
+    },
     showLanguages,
     showGettingStarted,
     skipToGettingStarted: () => {
@@ -1393,6 +1635,13 @@
     updateLanguage: (modality, languageCode) => {
       selectedLanguages[modality] = languageCode;
       savePreferences();
+      // Fetch the page again if it has content in a language that was not requested
+      const code = languageCode.toUpperCase();
+      const languages = (contentData && contentData.languages) || {};
+      const available = [...(languages[modality] || []), ...(modality === 'audio' ? languages.narration || [] : [])];
+      if (contentData && contentData.requestedLanguages && !contentData.requestedLanguages.includes(code) && available.includes(code)) {
+        loadContent();
+      }
       // Update the flag icon in real-time
       const flagElement = document.querySelector(`#${modality}-lang-select`);
       if (flagElement) {
@@ -0,0 +1,70 @@
+"""
+Timing Track Service
+Turns Polly word/sentence speech marks into a compact timing track and WebVTT captions
+"""
+import re
+import html
+import logging
+
+logger = logging.getLogger(__name__)
+
+SSML_TAG = re.compile(r'<[^>]+>')
+
+def _locate(text: str, value: str, cursor: int):
+    """Find a mark's text in the caption text at or after cursor; returns (start, end) or None"""
+    value = html.unescape(SSML_TAG.sub('', value)).strip()
+    if not value:
+        return None
+    start = text.find(value, cursor)
+    if start < 0:
+        return None
+    return start, start + len(value)
+
+def build_timing_track(text: str, marks: list[dict], duration_ms: int) -> dict:
+    """
+    Build a compact timing track from speech marks
+
+    Offsets are character offsets into text (not Polly's byte offsets), found by
+    matching each mark's value in reading order, so they stay valid when the audio
+    was synthesized in chunks or in a batch.
+
+    Args:
+        text: Caption text the audio was generated from
+        marks: Speech marks ({"time", "type", "value"}) with times relative to this audio
+        duration_ms: Total audio duration
+
+    Returns:
+        dict: {"duration": ms, "words": [[time_ms, start, end], ...], "sentences": [[time_ms, start, end], ...]}
+    """
+    track = {"duration": duration_ms, "words": [], "sentences": []}
+    cursors = {"word": 0, "sentence": 0}
+    for mark in sorted(marks, key=lambda m: m["time"]):
+        kind = mark.get("type")
+        if kind not in cursors:
+            continue
+        span = _locate(text, mark.get("value", ""), cursors[kind])
+        if span is None:
+            logger.debug(f"Could not place {kind} mark {mark.get('value')!r} in caption text")
+            continue
+        track[f"{kind}s"].append([int(mark["time"]), span[0], span[1]])
+        # Sentences may overlap their own start (e.g. repeated phrases), words always move forward
+        cursors[kind] = span[1] if kind == "word" else span[0] + 1
+    return track
+
+def _timestamp(ms: int) -> str:
+    hours, ms = divmod(int(ms), 3_600_000)
+    minutes, ms = divmod(ms, 60_000)
+    seconds, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{ms:03d}"
+
+def to_webvtt(text: str, track: dict) -> str:
+    """Render the sentence timings of a track as WebVTT cues (a single cue if there are none)"""
+    sentences = track.get("sentences") or [[0, 0, len(text)]]
+    lines = ["WEBVTT", ""]
+    for index, (start_ms, start, end) in enumerate(sentences):
+        end_ms = sentences[index + 1][0] if index + 1 < len(sentences) else track.get("duration", start_ms)
+        cue = " ".join(text[start:end].split())
+        if not cue or end_ms <= start_ms:
+            continue
+        lines += [str(index + 1), f"{_timestamp(start_ms)} --> {_timestamp(end_ms)}", cue, ""]
+    return "\n".join(lines)
@@ -8,6 +8,12 @@ import os
 from dotenv import load_dotenv
 from pathlib import Path
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from typing import Optional
+
+from bs4 import BeautifulSoup
 
 load_dotenv()
 
@@ -26,6 +32,16 @@ translate_client = boto3.client(
     region_name=AWS_REGION
 )
 
+# Batch translation: many segments are packed into one HTML document (<div id="sN"> per segment)
+# and sent with TranslateDocument, which accepts up to 100 KB; segments that do not come back
+# intact are retried one by one with TranslateText, split into pieces of up to 10,000 bytes
+BATCH_MAX_BYTES = int(os.getenv("TRANSLATE_BATCH_MAX_BYTES", "90000"))
+TEXT_MAX_BYTES = 10000
+BATCH_CONCURRENCY = int(os.getenv("TRANSLATE_BATCH_CONCURRENCY", "4"))
+batch_pool = ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY, thread_name_prefix="translate-batch")
+
+SEGMENT_ID = re.compile(r'^s(\d+)$')
+
 # Language name to code mapping
 LANGUAGE_CODE_MAP = {
     'english': 'en',
@@ -88,27 +104,39 @@ SUPPORTED_LANGUAGES = {
     'da': 'Danish',
 }
 
-def normalize_language_code(language: str) -> str:
+def lookup_language_code(language: str) -> Optional[str]:
     """
-    Normalize language input to AWS Translate format
-    Returns: 2-letter language code (e.g., 'en', 'es', 'fr')
+    2-letter code of a language name or code ('Spanish', 'es', 'en-US', 'Chinese (Simplified)'),
+    None if it is not a supported language
     """
     language_lower = language.lower().strip()
     
-    # Check direct mapping
-    if language_lower in LANGUAGE_CODE_MAP:
-        return LANGUAGE_CODE_MAP[language_lower]
+    # Check direct mapping, also without a qualifier such as "(Simplified)"
+    for name in (language_lower, language_lower.split('(')[0].strip()):
+        if name in LANGUAGE_CODE_MAP:
+            return LANGUAGE_CODE_MAP[name]
     
     # Check if already a 2-letter code
-    if len(language) == 2 and language.lower() in SUPPORTED_LANGUAGES:
-        return language.lower()
+    if len(language_lower) == 2 and language_lower in SUPPORTED_LANGUAGES:
+        return language_lower
     
     # Check if it's a language-region code (e.g., 'en-US' -> 'en')
-    if '-' in language:
-        base_code = language.split('-')[0].lower()
+    if '-' in language_lower:
+        base_code = language_lower.split('-')[0]
         if base_code in SUPPORTED_LANGUAGES:
             return base_code
     
+    return None
+
+def normalize_language_code(language: str) -> str:
+    """
+    Normalize language input to AWS Translate format
+    Returns: 2-letter language code (e.g., 'en', 'es', 'fr')
+    """
+    code = lookup_language_code(language)
+    if code:
+        return code
+    
     # Default to English if unknown
     logger.warning(f"Unknown language '{language}', defaulting to 'en'")
     return 'en'
@@ -159,6 +187,164 @@ def translate_text(text: str, source_language: str = 'auto', target_language: st
         logger.error(error_msg)
         raise Exception(error_msg)
 
+def _split_text(text: str, max_bytes: int = TEXT_MAX_BYTES) -> list[str]:
+    """
+    Cut text into consecutive pieces of at most max_bytes UTF-8 bytes (joined they give back text),
+    at line breaks where possible, else at sentence ends, else between words
+    """
+    if len(text.encode('utf-8')) <= max_bytes:
+        return [text]
+    for boundary in (r'(?<=\n)', r'(?<=[.!?。！？])(?=\s)', r'(?=\s)'):
+        parts = [part for part in re.split(boundary, text) if part]
+        if len(parts) > 1:
+            break
+    else:
+        # One unbroken run of characters - cut at a character boundary
+        cut = len(text.encode('utf-8')[:max_bytes].decode('utf-8', errors='ignore'))
+        return [text[:cut], *_split_text(text[cut:], max_bytes)]
+    pieces, current = [], ""
+    for part in parts:
+        if len((current + part).encode('utf-8')) <= max_bytes:
+            current += part
+            continue
+        if current:
+            pieces.append(current)
+        current = part
+        if len(part.encode('utf-8')) > max_bytes:
+            pieces += _split_text(part, max_bytes)
+            current = ""
+    if current:
+        pieces.append(current)
+    return pieces
+
+def _translate_text(text: str, source_code: str, target_code: str) -> str:
+    """TranslateText for text of any length - pieces over its request limit are translated separately"""
+    translated = []
+    for piece in _split_text(text):
+        if not piece.strip():
+            translated.append(piece)
+            continue
+        # TranslateText trims the whitespace around a piece, keep it so the pieces join up as before
+        leading = piece[:len(piece) - len(piece.lstrip())]
+        trailing = piece[len(piece.rstrip()):]
+        response = translate_client.translate_text(Text=piece.strip(), SourceLanguageCode=source_code, TargetLanguageCode=target_code)
+        translated.append(leading + response['TranslatedText'] + trailing)
+    return "".join(translated)
+
+def _segment_html(index: int, text: str) -> str:
+    # Line breaks would be collapsed as HTML whitespace, so carry them as <br>
+    return f'<div id="s{index}">' + "<br>".join(escape(line, quote=False) for line in text.split("\n")) + "</div>"
+
+def _pack_documents(texts: list[str], indices: list[int]) -> tuple[list[list[int]], list[int]]:
+    """Group segment indices into documents under BATCH_MAX_BYTES; returns (documents, oversized indices)"""
+    documents, oversized = [], []
+    current, current_bytes = [], 0
+    for index in indices:
+        size = len(_segment_html(index, texts[index]).encode('utf-8'))
+        if size > BATCH_MAX_BYTES:
+            oversized.append(index)
+            continue
+        if current and current_bytes + size > BATCH_MAX_BYTES:
+            documents.append(current)
+            current, current_bytes = [], 0
+        current.append(index)
+        current_bytes += size
+    if current:
+        documents.append(current)
+    return documents, oversized
+
+def _translate_document(texts: list[str], indices: list[int], source_code: str, target_code: str) -> dict[int, str]:
+    """Translate one packed HTML document; returns {index: translation} for the segments that came back intact"""
+    document = "<html><body>" + "".join(_segment_html(index, texts[index]) for index in indices) + "</body></html>"
+    response = translate_client.translate_document(
+        Document={'Content': document.encode('utf-8'), 'ContentType': 'text/html'},
+        SourceLanguageCode=source_code,
+        TargetLanguageCode=target_code
+    )
+    soup = BeautifulSoup(response['TranslatedDocument']['Content'], 'html.parser')
+    translated = {}
+    for div in soup.find_all('div', id=SEGMENT_ID):
+        for br in div.find_all('br'):
+            br.replace_with("\n")
+        translated[int(SEGMENT_ID.match(div['id']).group(1))] = div.get_text().strip()
+    wanted = set(indices)
+    return {index: text for index, text in translated.items() if index in wanted and text}
+
+def translate_batch(texts: list[str], source_language: str = 'auto', target_language: str = 'es') -> list[str]:
+    """
+    Translate many segments in as few requests as possible
+    
+    Segments are packed into size-bounded HTML documents with one <div id> per segment
+    and translated with TranslateDocument; the ids map results back to segments, so order
+    is kept even if the translation reorders text. Segments missing from a response (or
+    whole documents that fail) fall back to TranslateText, split into pieces under its limit.
+    With 'auto', each document's source language is detected from its own text.
+    
+    Args:
+        texts: Segments to translate, in order
+        source_language: Source language code or name (use 'auto' for auto-detect)
+        target_language: Target language code or name (e.g., 'es', 'Spanish', 'fr-FR')
+    
+    Returns:
+        list: Translations, one per input segment ("" for empty segments)
+    """
+    if not AWS_ACCESS_KEY_ID or not AWS_SECRET_ACCESS_KEY:
+        raise Exception("AWS credentials not configured for Translate")
+    
+    target_code = normalize_language_code(target_language)
+    source_code = 'auto' if source_language.lower() == 'auto' else normalize_language_code(source_language)
+    results = ["" for _ in texts]
+    pending = [index for index, text in enumerate(texts) if text and text.strip()]
+    if not pending:
+        return results
+    
+    if source_code == target_code:
+        for index in pending:
+            results[index] = texts[index]
+        return results
+    # Imported here - language_service builds on this module
+    import language_service
+    
+    try:
+        documents, oversized = _pack_documents(texts, pending)
+        
+        def run_document(indices: list[int]) -> dict[int, str]:
+            document_source = source_code
+            if document_source == 'auto':
+                # TranslateDocument needs an explicit source language: detect it from the document's text,
+                # and leave segments of an undetectable document to TranslateText's own detection
+                document_source, _ = language_service.detect_language("\n".join(texts[index] for index in indices))
+                if not document_source:
+                    return {}
+            if document_source == target_code:
+                return {index: texts[index] for index in indices}
+            try:
+                return _translate_document(texts, indices, document_source, target_code)
+            except ClientError as e:
+                logger.warning(f"Document translation of {len(indices)} segments failed, translating them one by one: {e}")
+                return {}
+        
+        translated = {}
+        for part in batch_pool.map(run_document, documents):
+            translated.update(part)
+        
+        retry = oversized + [index for indices in documents for index in indices if index not in translated]
+        if retry:
+            logger.warning(f"Translating {len(retry)} of {len(pending)} segments individually")
+        for index in retry:
+            translated[index] = _translate_text(texts[index], source_code, target_code)
+        
+        for index, text in translated.items():
+            results[index] = text
+        
+        logger.info(f"Batch translated {len(pending)} segments from {source_code} to {target_code} in {len(documents)} document(s) + {len(retry)} single request(s)")
+        return results
+        
+    except ClientError as e:
+        error_msg = f"AWS Translate error: {str(e)}"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+
 def get_supported_languages():
     """
     Get list of supported languages
@@ -0,0 +1,78 @@
+"""
+URL Canonicalization Service
+Reduces the URLs a page can be visited under (tracking parameters, fragments, trailing slashes,
+http/https, www, default ports, parameter order) to one canonical form, and hashes it into the
+compact key pages are stored and looked up by
+"""
+import re
+import hashlib
+from typing import Optional
+from urllib.parse import urlsplit, parse_qsl, urlencode, quote, unquote
+
+# Bump when canonicalization changes - stored page keys are recomputed on the next start
+CANONICAL_VERSION = 2
+
+# Query parameters that never change page content (a trailing * matches any suffix)
+DEFAULT_IGNORED_PARAMS = [
+    "utm_*", "gclid", "gbraid", "wbraid", "dclid", "fbclid", "msclkid", "yclid", "twclid", "ttclid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "_hsenc", "_hsmi", "mkt_tok", "igshid", "ref_src",
+]
+DEFAULT_PORTS = {"http": 80, "https": 443}
+# Characters left as they are in a path segment, everything else is percent-encoded
+PATH_SAFE = ":@!$&'()*+,;=-._~"
+
+def _param_matcher(patterns: list) -> re.Pattern:
+    parts = [re.escape(p[:-1].lower()) + ".*" if p.endswith("*") else re.escape(p.lower()) for p in patterns]
+    return re.compile("^(" + "|".join(parts) + ")$") if parts else re.compile("(?!)")
+
+_default_ignored = _param_matcher(DEFAULT_IGNORED_PARAMS)
+
+def _normalize_path(path: str) -> str:
+    # Segment by segment, so an encoded slash (%2F) stays part of its segment
+    path = "/".join(quote(unquote(segment), safe=PATH_SAFE) for segment in re.sub("/{2,}", "/", path).split("/"))
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return path or "/"
+
+def canonicalize(url: str, rules: Optional[dict] = None) -> str:
+    """
+    Canonical form of a page URL: host/path?query, without scheme, fragment or ignored parameters
+
+    Args:
+        url: URL as entered or as reported by the browser (a missing scheme is accepted)
+        rules: Per-site rules - {"ignored_params": [...], "path_aliases": {alias path: canonical path}}
+
+    Returns:
+        str: Canonical URL (e.g. "example.com/pricing?plan=pro")
+    """
+    rules = rules or {}
+    url = url.strip()
+    if "://" not in url:
+        url = f"https://{url}"
+    parts = urlsplit(url)
+
+    host = (parts.hostname or "").lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+
+    path = _normalize_path(parts.path)
+    aliases = {_normalize_path(alias): _normalize_path(target) for alias, target in (rules.get("path_aliases") or {}).items()}
+    path = aliases.get(path, path)
+
+    site_ignored = _param_matcher(rules.get("ignored_params") or [])
+    params = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _default_ignored.match(key.lower()) and not site_ignored.match(key.lower())
+    )
+    query = urlencode(params)
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+def url_hash(url: str, rules: Optional[dict] = None) -> str:
+    """Compact key of a page URL (hex of a 128-bit BLAKE2b digest of its canonical form)"""
+    return hashlib.blake2b(canonicalize(url, rules).encode("utf-8"), digest_size=16).hexdigest()
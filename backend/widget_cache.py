@@ -0,0 +1,94 @@
+"""
+Widget Content Cache
+Short-lived in-process snapshots of the parts of widget payloads - a page's sections and
+language manifest, and one language's media for that page - so repeat widget loads skip
+Mongo and URL signing. Entries must expire well before the signed media URLs inside them.
+Writes drop the snapshots they affect with invalidate(), by the ids the snapshots depend on.
+"""
+import os
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Cache Configuration (presigned media URLs are valid for an hour, keep the TTL far below that)
+WIDGET_CACHE_TTL_SECONDS = int(os.getenv("WIDGET_CACHE_TTL_SECONDS", "300"))
+WIDGET_CACHE_MAX_SIZE = int(os.getenv("WIDGET_CACHE_MAX_SIZE", "5000"))
+
+# key -> (snapshot, ids it depends on)
+snapshots = TTLCache(maxsize=WIDGET_CACHE_MAX_SIZE, ttl=WIDGET_CACHE_TTL_SECONDS)
+# One load per key at a time - a burst of visitors to the same page waits for the same load
+_loading: dict[tuple, asyncio.Task] = {}
+# Bumped by invalidate() - a load that overlapped an invalidation is returned but not stored
+_generation = 0
+metrics = {"hits": 0, "misses": 0, "invalidated": 0}
+
+async def _load(key: tuple, load: Callable[[], Awaitable[Any]], keep, tags, generation: int) -> Any:
+    value = await load()
+    if generation == _generation and keep(value):
+        snapshots[key] = (value, frozenset(key) | frozenset(tags(value) if tags else ()))
+    return value
+
+def _forget(key: tuple, task: asyncio.Task):
+    if _loading.get(key) is task:
+        del _loading[key]
+
+async def get(
+    key: tuple,
+    load: Callable[[], Awaitable[Any]],
+    keep: Callable[[Any], bool] = lambda value: value is not None,
+    tags: Optional[Callable[[Any], Iterable]] = None
+) -> Any:
+    """
+    Snapshot for key, building it with load on a miss
+
+    Args:
+        key: Cache key, e.g. ("page", website_id, url_hash) - its parts are ids the snapshot depends on
+        load: Builds the snapshot (exceptions are not cached)
+        keep: Whether a loaded value is stored (misses such as None are returned but not cached)
+        tags: More ids the snapshot depends on, from the loaded value
+
+    Returns:
+        The shared snapshot - callers must not modify it
+    """
+    try:
+        value, _ = snapshots[key]
+        metrics["hits"] += 1
+        return value
+    except KeyError:
+        metrics["misses"] += 1
+
+    task = _loading.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_load(key, load, keep, tags, _generation))
+        _loading[key] = task
+        task.add_done_callback(lambda done: _forget(key, done))
+    # Shielded so one visitor disconnecting does not cancel the load the others are waiting for
+    return await asyncio.shield(task)
+
+def invalidate(*ids):
+    """Drop every snapshot that depends on any of ids (e.g. after a write to a section, page or website)"""
+    global _generation
+    _generation += 1
+    # Later visitors start a fresh load instead of joining one that may read the old data
+    _loading.clear()
+    ids = set(ids)
+    stale = [key for key, (_, depends_on) in list(snapshots.items()) if not ids.isdisjoint(depends_on)]
+    for key in stale:
+        snapshots.pop(key, None)
+    metrics["invalidated"] += len(stale)
+
+def stats() -> dict:
+    lookups = metrics["hits"] + metrics["misses"]
+    return {
+        "size": len(snapshots),
+        "max_size": snapshots.maxsize,
+        "ttl_seconds": WIDGET_CACHE_TTL_SECONDS,
+        "hits": metrics["hits"],
+        "misses": metrics["misses"],
+        "invalidated": metrics["invalidated"],
+        "hit_rate": round(metrics["hits"] / lookups, 4) if lookups else None,
+    }
@@ -0,0 +1,13 @@
+import axios from 'axios';
+
+const API = `${process.env.REACT_APP_BACKEND_URL}/api`;
+
+// Poll a background job until it finishes; resolves with the job, rejects if it failed
+export async function waitForJob(jobId, intervalMs = 3000) {
+  for (;;) {
+    const { data: job } = await axios.get(`${API}/jobs/${jobId}`);
+    if (job.status === 'succeeded') return job;
+    if (job.status === 'failed') throw new Error(job.error || 'Job failed');
+    await new Promise((resolve) => setTimeout(resolve, intervalMs));
+  }
+}
@@ -0,0 +1,13 @@
+import axios from 'axios';
+
+// Fetch every page of a cursor-paginated list endpoint; `fields` limits the returned fields
+export async function fetchAll(url, { fields, limit = 1000 } = {}) {
+  const items = [];
+  let cursor;
+  do {
+    const response = await axios.get(url, { params: { fields, limit, cursor } });
+    items.push(...response.data);
+    cursor = response.headers['x-next-cursor'];
+  } while (cursor);
+  return items;
+}
@@ -0,0 +1,12 @@
+// Hex SHA-256 of a file, used to store identical uploads once.
+// Returns null where Web Crypto is unavailable (non-HTTPS origins); the upload then gets its own copy.
+export async function sha256Hex(file) {
+  if (!window.crypto?.subtle) return null;
+  try {
+    const digest = await window.crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+    return Array.from(new Uint8Array(digest), (byte) => byte.toString(16).padStart(2, '0')).join('');
+  } catch (error) {
+    console.warn('Could not hash file, uploading without deduplication:', error);
+    return null;
+  }
+}
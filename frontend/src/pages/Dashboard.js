@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import axios from 'axios';
+import { fetchAll } from '@/lib/pagination';
 import { useAuth } from '@/contexts/AuthContext';
 import DashboardLayout from '@/components/DashboardLayout';
 import { Button } from '@/components/ui/button';
@@ -31,14 +32,14 @@ export default function Dashboard() {
       console.log('🔍 Fetching dashboard data from:', `${API}/websites`);
       console.log('🔑 Auth header:', axios.defaults.headers.common['Authorization'] ? 'Present' : 'Missing');
       // Fetch websites and stats in parallel
-      const [websitesRes, statsRes] = await Promise.all([
-        axios.get(`${API}/websites`),
+      const [websiteList, statsRes] = await Promise.all([
+        fetchAll(`${API}/websites`, { fields: 'id' }),
         axios.get(`${API}/stats`)
       ]);
       
-      console.log('✅ Websites response:', websitesRes.data);
+      console.log('✅ Websites response:', websiteList);
       console.log('✅ Stats response:', statsRes.data);
-      setWebsites(websitesRes.data);
+      setWebsites(websiteList);
       setTotalPages(statsRes.data.total_pages);
     } catch (error) {
       console.error('❌ Error fetching dashboard data:', error);
@@ -7,9 +7,16 @@ import { CSS } from '@dnd-kit/utilities';
 import DashboardLayout from '@/components/DashboardLayout';
 import { Button } from '@/components/ui/button';
 import { toast } from 'sonner';
+import { waitForJob } from '@/lib/jobs';
 import { ArrowLeft, FileText, Video, Volume2, GripVertical } from 'lucide-react';
 
 const API = `${process.env.REACT_APP_BACKEND_URL}/api`;
+const NARRATION_LANGUAGES = ['English', 'Spanish', 'French', 'Chinese', 'Arabic', 'Hindi', 'Portuguese', 'Russian', 'Japanese', 'Korean'];
+
+function formatDuration(ms) {
+  const seconds = Math.round(ms / 1000);
+  return `${Math.floor(seconds / 60)}:${String(seconds % 60).padStart(2, '0')}`;
+}
 
 function SortableSectionItem({ section, navigate }) {
   const { attributes, listeners, setNodeRef, transform, transition } = useSortable({ id: section.id });
@@ -18,6 +25,8 @@ function SortableSectionItem({ section, navigate }) {
     transform: CSS.Transform.toString(transform),
     transition,
   };
+  const { coverage } = section;
+  const staleCount = coverage.audios.stale + coverage.translations.stale;
 
   return (
     <div
@@ -51,14 +60,23 @@ function SortableSectionItem({ section, navigate }) {
             {section.selected_text}
           </p>
           <div className="flex items-center gap-6 text-sm text-gray-600">
-            <span className="flex items-center gap-2">
+            <span className="flex items-center gap-2" title={coverage.videos.languages.join(', ')}>
               <Video className="h-4 w-4 text-[#00CED1]" />
-              {section.videos_count} videos
+              {coverage.videos.count} videos
             </span>
-            <span className="flex items-center gap-2">
+            <span className="flex items-center gap-2" title={coverage.audios.languages.join(', ')}>
               <Volume2 className="h-4 w-4 text-[#00CED1]" />
-              {section.audios_count} audio files
+              {coverage.audios.count} audio files
             </span>
+            <span className="flex items-center gap-2" title={coverage.translations.languages.join(', ')}>
+              <FileText className="h-4 w-4 text-[#00CED1]" />
+              {coverage.translations.count} translations
+            </span>
+            {staleCount > 0 && (
+              <span className="text-xs px-2 py-1 bg-amber-100 text-amber-800 rounded">
+                {staleCount} outdated
+              </span>
+            )}
           </div>
         </div>
       </div>
@@ -74,6 +92,11 @@ export default function PageDetail() {
   const [loading, setLoading] = useState(true);
   const [showAddSection, setShowAddSection] = useState(false);
   const [newSectionText, setNewSectionText] = useState('');
+  const [narrations, setNarrations] = useState([]);
+  const [narrationLanguage, setNarrationLanguage] = useState('English');
+  const [buildingNarration, setBuildingNarration] = useState(false);
+  const [translatingPage, setTranslatingPage] = useState(false);
+  const [regeneratingStale, setRegeneratingStale] = useState(false);
 
   const sensors = useSensors(
     useSensor(PointerSensor),
@@ -88,14 +111,11 @@ export default function PageDetail() {
 
   const fetchData = async () => {
     try {
-      const [pageRes, sectionsRes] = await Promise.all([
-        axios.get(`${API}/pages/${pageId}`),
-        axios.get(`${API}/pages/${pageId}/sections`)
-      ]);
-      setPage(pageRes.data);
-      // Sort sections by position_order
-      const sortedSections = sectionsRes.data.sort((a, b) => a.position_order - b.position_order);
-      setSections(sortedSections);
+      // Page, narrations and per-section coverage (sections arrive sorted by position_order)
+      const { data } = await axios.get(`${API}/pages/${pageId}/overview`);
+      setPage(data.page);
+      setNarrations(data.narrations);
+      setSections(data.sections);
     } catch (error) {
       toast.error('Failed to load page data');
       navigate('/');
@@ -158,6 +178,55 @@ export default function PageDetail() {
     }
   };
 
+  const handleBuildNarration = async () => {
+    setBuildingNarration(true);
+    const formData = new FormData();
+    formData.append('language', narrationLanguage);
+    try {
+      const { data: job } = await axios.post(`${API}/pages/${pageId}/narration`, formData);
+      toast.loading('Building page narration...', { id: 'narration' });
+      await waitForJob(job.id);
+      toast.success('Page narration ready!', { id: 'narration' });
+      fetchData();
+    } catch (error) {
+      toast.error(error.response?.data?.detail || error.message || 'Failed to build narration', { id: 'narration' });
+    } finally {
+      setBuildingNarration(false);
+    }
+  };
+
+  const handleTranslatePage = async () => {
+    setTranslatingPage(true);
+    const formData = new FormData();
+    formData.append('target_languages', 'all');
+    try {
+      const { data: job } = await axios.post(`${API}/pages/${pageId}/translations/generate`, formData);
+      toast.loading('Translating all sections...', { id: 'page-translation' });
+      const { result } = await waitForJob(job.id);
+      const failedCount = Object.keys(result.failed || {}).length;
+      toast.success(`Translated ${result.sections} sections into ${result.languages} languages${failedCount ? ` (${failedCount} failed)` : ''}`, { id: 'page-translation' });
+    } catch (error) {
+      toast.error(error.response?.data?.detail || error.message || 'Failed to translate page', { id: 'page-translation' });
+    } finally {
+      setTranslatingPage(false);
+    }
+  };
+
+  const handleRegenerateStale = async () => {
+    setRegeneratingStale(true);
+    try {
+      const { data: job } = await axios.post(`${API}/pages/${pageId}/regenerate-stale`, new FormData());
+      toast.loading('Regenerating outdated audio and translations...', { id: 'regenerate-stale' });
+      const { result } = await waitForJob(job.id);
+      const failedCount = (result.audios_failed || []).length;
+      toast.success(`Updated ${result.translations_regenerated} translations and ${result.audios_regenerated} audio files${failedCount ? ` (${failedCount} failed)` : ''}`, { id: 'regenerate-stale' });
+    } catch (error) {
+      toast.error(error.response?.data?.detail || error.message || 'Failed to regenerate outdated content', { id: 'regenerate-stale' });
+    } finally {
+      setRegeneratingStale(false);
+    }
+  };
+
   if (loading) {
     return (
       <DashboardLayout>
@@ -193,15 +262,74 @@ export default function PageDetail() {
                 Click on a section to add ASL videos and audio files. Drag to reorder.
               </p>
             </div>
-            <Button
-              onClick={() => setShowAddSection(!showAddSection)}
-              className="bg-[#21D4B4] hover:bg-[#91EED2] text-black font-semibold"
-            >
-              {showAddSection ? 'Cancel' : '+ Add Section'}
-            </Button>
+            <div className="flex gap-3">
+              <Button
+                onClick={handleTranslatePage}
+                disabled={translatingPage || sections.length === 0}
+                variant="outline"
+              >
+                {translatingPage ? 'Translating...' : 'Translate All Sections'}
+              </Button>
+              <Button
+                onClick={handleRegenerateStale}
+                disabled={regeneratingStale || sections.length === 0}
+                variant="outline"
+              >
+                {regeneratingStale ? 'Regenerating...' : 'Regenerate Outdated'}
+              </Button>
+              <Button
+                onClick={() => setShowAddSection(!showAddSection)}
+                className="bg-[#21D4B4] hover:bg-[#91EED2] text-black font-semibold"
+              >
+                {showAddSection ? 'Cancel' : '+ Add Section'}
+              </Button>
+            </div>
           </div>
         </div>
 
+        <div className="bg-white border border-gray-200 rounded-xl p-6 mb-6">
+          <div className="flex items-center justify-between gap-4">
+            <div>
+              <h3 className="text-lg font-semibold text-gray-900 mb-1">Page Narration</h3>
+              <p className="text-sm text-gray-600">
+                One audio file for the whole page, with a chapter per section. Existing section audio is reused.
+              </p>
+            </div>
+            <div className="flex items-center gap-3">
+              <select
+                value={narrationLanguage}
+                onChange={(e) => setNarrationLanguage(e.target.value)}
+                className="h-10 px-3 border border-gray-300 rounded-md text-sm"
+              >
+                {NARRATION_LANGUAGES.map((lang) => (
+                  <option key={lang} value={lang}>{lang}</option>
+                ))}
+              </select>
+              <Button
+                onClick={handleBuildNarration}
+                disabled={buildingNarration}
+                className="bg-[#21D4B4] hover:bg-[#91EED2] text-black font-semibold"
+              >
+                <Volume2 className="h-4 w-4 mr-2" />
+                {buildingNarration ? 'Building...' : 'Build Narration'}
+              </Button>
+            </div>
+          </div>
+          {narrations.length > 0 && (
+            <div className="mt-4 space-y-3">
+              {narrations.map((narration) => (
+                <div key={narration.id} className="flex items-center gap-4">
+                  <span className="text-sm font-medium text-gray-900 w-24">{narration.language}</span>
+                  <audio controls preload="none" src={narration.audio_url} className="flex-1" />
+                  <span className="text-sm text-gray-600">
+                    {formatDuration(narration.duration_ms)} · {narration.chapters.length} chapters
+                  </span>
+                </div>
+              ))}
+            </div>
+          )}
+        </div>
+
         {showAddSection && (
           <div className="bg-white border border-gray-200 rounded-xl p-6 mb-6">
             <h3 className="text-lg font-semibold text-gray-900 mb-4">Add New Section</h3>
@@ -7,6 +7,8 @@ import { Button } from '@/components/ui/button';
 import { Label } from '@/components/ui/label';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
 import { toast } from 'sonner';
+import { waitForJob } from '@/lib/jobs';
+import { sha256Hex } from '@/lib/uploads';
 import { ArrowLeft, Upload, Sparkles, Video, Volume2, FileText, Loader2, ExternalLink } from 'lucide-react';
 
 const API = `${process.env.REACT_APP_BACKEND_URL}/api`;
@@ -32,7 +34,9 @@ function getMediaUrl(url) {
 
 // VideoPlayer Component with Loading State and Delete Button
 function VideoPlayer({ video, onDelete }) {
-  const [loadingState, setLoadingState] = useState('loading'); // 'loading', 'loaded', 'error'
+  // With a poster we can show the player right away and skip fetching video bytes until play
+  const hasPoster = Boolean(video.poster_url);
+  const [loadingState, setLoadingState] = useState(hasPoster ? 'loaded' : 'loading'); // 'loading', 'loaded', 'error'
   const [retryCount, setRetryCount] = useState(0);
   // Backend now returns signed URL which might change, so we rely on that instead of cache busting
   const [deleting, setDeleting] = useState(false);
@@ -41,7 +45,9 @@ function VideoPlayer({ video, onDelete }) {
   const videoUrl = getMediaUrl(video.video_url);
 
   const handleLoadStart = () => {
-    setLoadingState('loading');
+    if (!hasPoster) {
+      setLoadingState('loading');
+    }
     setErrorMsg('');
   };
 
@@ -140,8 +146,9 @@ function VideoPlayer({ video, onDelete }) {
       <video
         key={`${video.id}-${retryCount}`}
         src={videoUrl}
+        poster={video.poster_url || undefined}
         controls
-        preload="metadata"
+        preload={hasPoster ? 'none' : 'metadata'}
         className={`w-full rounded ${loadingState !== 'loaded' ? 'hidden' : ''}`}
         onLoadStart={handleLoadStart}
         onCanPlay={handleCanPlay}
@@ -153,6 +160,8 @@ function VideoPlayer({ video, onDelete }) {
 
 const ASL_LANGUAGES = ['ASL (American Sign Language)', 'LSM (Mexican)', 'BSL (British)', 'LSF (French)', 'Auslan (Australian)', 'JSL (Japanese)', 'KSL (Korean)', 'LIBRAS (Brazilian)'];
 const AUDIO_LANGUAGES = ['English', 'Spanish', 'French', 'Chinese', 'Arabic', 'Hindi', 'Portuguese', 'Russian', 'Japanese', 'Korean'];
+// Sections longer than this are synthesized as a background job instead of in the request
+const LONG_FORM_MIN_CHARS = 10000;
 const TTS_VOICES = [
   { value: 'alloy', label: 'Alloy (Neutral)' },
   { value: 'echo', label: 'Echo (Smooth)' },
@@ -183,35 +192,12 @@ export default function SectionDetail() {
   const fetchData = async () => {
     setLoading(true);
     try {
-      // Fetch section first to verify it exists
-      const sectionRes = await axios.get(`${API}/sections/${sectionId}`);
-      setSection(sectionRes.data);
-      
-      // Then fetch videos and audios (these can fail without breaking the page)
-      try {
-        const videosRes = await axios.get(`${API}/sections/${sectionId}/videos`);
-        setVideos(videosRes.data);
-      } catch (videoError) {
-        console.error('Failed to load videos:', videoError);
-        setVideos([]);
-      }
-      
-      try {
-        const audiosRes = await axios.get(`${API}/sections/${sectionId}/audio`);
-        setAudios(audiosRes.data);
-      } catch (audioError) {
-        console.error('Failed to load audio:', audioError);
-        setAudios([]);
-      }
-      
-      // Fetch text translations
-      try {
-        const translationsRes = await axios.get(`${API}/sections/${sectionId}/translations`);
-        setTranslations(translationsRes.data);
-      } catch (translationError) {
-        console.error('Failed to load translations:', translationError);
-        setTranslations([]);
-      }
+      // Section, media and translations in one request
+      const { data } = await axios.get(`${API}/sections/${sectionId}/full`);
+      setSection(data.section);
+      setVideos(data.videos);
+      setAudios(data.audios);
+      setTranslations(data.translations);
     } catch (error) {
       console.error('Failed to load section data:', error);
       // Only navigate away if it's a 404 (section not found)
@@ -248,21 +234,27 @@ export default function SectionDetail() {
     setUploading(true);
     try {
       // Step 1: Get presigned upload URL from backend
+      const contentSha256 = await sha256Hex(videoFile);
       const { data: uploadData } = await axios.post(`${API}/sections/${sectionId}/video/upload-url`, {
         filename: videoFile.name,
         content_type: videoFile.type || 'video/mp4',
-        file_size: videoFile.size
+        file_size: videoFile.size,
+        content_sha256: contentSha256
       });
       
       // Step 2: Upload directly to S3 using presigned PUT URL
       toast.loading('Uploading video to S3...', { id: 'video-upload' });
-      await uploadToS3WithFetch(uploadData.upload_url, videoFile);
+      // Identical video is already stored - nothing to upload
+      if (!uploadData.exists) {
+        await uploadToS3WithFetch(uploadData.upload_url, videoFile);
+      }
       
       // Step 3: Confirm upload with backend
       await axios.post(`${API}/sections/${sectionId}/video/confirm`, {
         file_key: uploadData.file_key,
         public_url: uploadData.public_url,
-        language: language
+        language: language,
+        content_sha256: uploadData.content_sha256
       });
       
       toast.success('Video uploaded successfully! Refreshing...', { id: 'video-upload' });
@@ -301,21 +293,27 @@ export default function SectionDetail() {
     setUploading(true);
     try {
       // Step 1: Get presigned upload URL
+      const contentSha256 = await sha256Hex(audioFile);
       const { data: uploadData } = await axios.post(`${API}/sections/${sectionId}/audio/upload-url`, {
         filename: audioFile.name,
         content_type: audioFile.type || 'audio/mpeg',
-        file_size: audioFile.size
+        file_size: audioFile.size,
+        content_sha256: contentSha256
       });
       
       // Step 2: Upload directly to S3 using presigned PUT URL
       toast.loading('Uploading audio to S3...', { id: 'audio-upload' });
-      await uploadToS3WithFetch(uploadData.upload_url, audioFile);
+      // Identical audio is already stored - nothing to upload
+      if (!uploadData.exists) {
+        await uploadToS3WithFetch(uploadData.upload_url, audioFile);
+      }
       
       // Step 3: Confirm upload
       await axios.post(`${API}/sections/${sectionId}/audio/confirm`, {
         file_key: uploadData.file_key,
         public_url: uploadData.public_url,
-        language: language
+        language: language,
+        content_sha256: uploadData.content_sha256
       });
       
       toast.success('Audio uploaded successfully! Refreshing...', { id: 'audio-upload' });
@@ -343,12 +341,21 @@ export default function SectionDetail() {
     const formData = new FormData(e.target);
     setGenerating(true);
     try {
-      await axios.post(`${API}/sections/${sectionId}/audio/generate`, formData);
+      const text = section?.text_content || section?.selected_text || '';
+      if (text.length > LONG_FORM_MIN_CHARS) {
+        const { data: job } = await axios.post(`${API}/sections/${sectionId}/audio/generate-long`, formData);
+        toast.loading('Generating long audio in the background...', { id: 'long-audio' });
+        await waitForJob(job.id);
+        toast.dismiss('long-audio');
+      } else {
+        await axios.post(`${API}/sections/${sectionId}/audio/generate`, formData);
+      }
       toast.success('Audio generated!');
       e.target.reset();
       fetchData();
     } catch (error) {
-      toast.error(error.response?.data?.detail || 'Failed to generate audio');
+      toast.dismiss('long-audio');
+      toast.error(error.response?.data?.detail || error.message || 'Failed to generate audio');
     } finally {
       setGenerating(false);
     }
@@ -455,6 +462,8 @@ export default function SectionDetail() {
     }
   };
 
+  // Generated from an older version of the section text (untracked and hand-written items have no source_hash)
+  const isOutdated = (item) => Boolean(item.source_hash && section?.content_hash && item.source_hash !== section.content_hash);
 
   if (loading) {
     return (
@@ -546,10 +555,10 @@ export default function SectionDetail() {
                 <Button
                   onClick={async () => {
                     try {
-                      await axios.patch(`${API}/sections/${sectionId}`, {
+                      const { data: updated } = await axios.patch(`${API}/sections/${sectionId}`, {
                         text_content: editedText
                       });
-                      setSection({...section, selected_text: editedText, text_content: editedText});
+                      setSection({...section, ...updated, selected_text: editedText, text_content: editedText});
                       setEditingText(false);
                       toast.success('Text updated successfully!');
                     } catch (error) {
@@ -728,7 +737,12 @@ export default function SectionDetail() {
                   {audios.map((audio) => (
                     <div key={audio.id} className="border border-gray-200 rounded-lg p-3">
                       <div className="flex items-center justify-between mb-2">
-                        <p className="text-sm font-medium text-gray-900">{audio.language}</p>
+                        <div className="flex items-center gap-2">
+                          <p className="text-sm font-medium text-gray-900">{audio.language}</p>
+                          {isOutdated(audio) && (
+                            <span className="text-xs px-2 py-1 bg-amber-100 text-amber-800 rounded">Outdated</span>
+                          )}
+                        </div>
                         <Button
                           onClick={() => handleDeleteAudio(audio.id)}
                           size="sm"
@@ -750,6 +764,17 @@ export default function SectionDetail() {
                           e.target.parentNode.appendChild(errorDiv);
                         }}
                       />
+                      {audio.vtt_url && (
+                        <a
+                          href={audio.vtt_url}
+                          target="_blank"
+                          rel="noopener noreferrer"
+                          className="inline-flex items-center text-xs text-[#00CED1] hover:underline mt-2"
+                        >
+                          <ExternalLink className="h-3 w-3 mr-1" />
+                          Captions (WebVTT)
+                        </a>
+                      )}
                     </div>
                   ))}
                 </div>
@@ -923,6 +948,9 @@ export default function SectionDetail() {
                       <div className="flex items-center gap-2">
                         <span className="text-sm font-semibold text-gray-900">{translation.language}</span>
                         <span className="text-xs px-2 py-1 bg-gray-100 rounded">{translation.language_code}</span>
+                        {isOutdated(translation) && (
+                          <span className="text-xs px-2 py-1 bg-amber-100 text-amber-800 rounded">Outdated</span>
+                        )}
                       </div>
                       <Button
                         onClick={() => handleDeleteTranslation(translation.id)}
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import axios from 'axios';
+import { fetchAll } from '@/lib/pagination';
 import DashboardLayout from '@/components/DashboardLayout';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
@@ -28,12 +29,12 @@ export default function WebsiteDetail() {
 
   const fetchData = async () => {
     try {
-      const [websiteRes, pagesRes] = await Promise.all([
+      const [websiteRes, pageList] = await Promise.all([
         axios.get(`${API}/websites/${websiteId}`),
-        axios.get(`${API}/websites/${websiteId}/pages`)
+        fetchAll(`${API}/websites/${websiteId}/pages`, { fields: 'id,url,status' })
       ]);
       setWebsite(websiteRes.data);
-      setPages(pagesRes.data);
+      setPages(pageList);
     } catch (error) {
       toast.error('Failed to load website data');
       navigate('/');
@@ -52,7 +53,7 @@ export default function WebsiteDetail() {
       setUrl('');
       fetchData();
     } catch (error) {
-      toast.error('Failed to create page');
+      toast.error(error.response?.data?.detail || 'Failed to create page');
     } finally {
       setCreating(false);
     }
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import axios from 'axios';
+import { fetchAll } from '@/lib/pagination';
 import DashboardLayout from '@/components/DashboardLayout';
 import { Button } from '@/components/ui/button';
 import { toast } from 'sonner';
@@ -21,9 +22,9 @@ export default function Websites() {
     try {
       console.log('🔍 Fetching websites from:', `${API}/websites`);
       console.log('🔑 Auth header:', axios.defaults.headers.common['Authorization'] ? 'Present' : 'Missing');
-      const response = await axios.get(`${API}/websites`);
-      console.log('✅ Websites response:', response.data);
-      setWebsites(response.data);
+      const websiteList = await fetchAll(`${API}/websites`, { fields: 'id,name,url,image_url,pages_count' });
+      console.log('✅ Websites response:', websiteList);
+      setWebsites(websiteList);
     } catch (error) {
       console.error('❌ Error fetching websites:', error);
       console.error('Response:', error.response?.data);
@@ -107,7 +108,10 @@ export default function Websites() {
                 {/* Website Info */}
                 <div className="p-4">
                   <h3 className="font-semibold text-gray-900 mb-1">{website.name}</h3>
-                  <p className="text-sm text-gray-600 mb-4 truncate">{website.url}</p>
+                  <p className="text-sm text-gray-600 mb-1 truncate">{website.url}</p>
+                  <p className="text-xs text-gray-500 mb-4">
+                    {website.pages_count} {website.pages_count === 1 ? 'page' : 'pages'}
+                  </p>
                   
                   <Button
                     onClick={() => navigate(`/websites/${website.id}`)}
@@ -0,0 +1,82 @@
+import mp3_utils
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo: 417 bytes and 1152 samples per frame
+MPEG1_HEADER = bytes([0xFF, 0xFB, 0x90, 0x00])
+MPEG1_LENGTH = 417
+# MPEG-2 Layer III, 48 kbps, 24 kHz (what Polly returns): 144 bytes and 576 samples (24 ms) per frame
+MPEG2_HEADER = bytes([0xFF, 0xF3, 0x64, 0x00])
+MPEG2_LENGTH = 144
+
+def frame(header=MPEG2_HEADER, length=MPEG2_LENGTH, fill=0):
+    return header + bytes([fill]) * (length - 4)
+
+def mp3(count, header=MPEG2_HEADER, length=MPEG2_LENGTH):
+    # A distinct fill per frame so tests can tell frames apart
+    return b"".join(frame(header, length, fill=index + 1) for index in range(count))
+
+def id3_tag(size=20):
+    # ID3v2 header with a syncsafe size, followed by that many bytes of tag data
+    return b"ID3" + bytes([4, 0, 0, 0, 0, 0, size]) + b"\x00" * size
+
+def info_frame():
+    # MPEG-2 stereo side info is 17 bytes, so the Xing tag starts 21 bytes into the frame
+    data = bytearray(frame())
+    data[21:25] = b"Xing"
+    return bytes(data)
+
+def test_parses_mpeg1_and_mpeg2_headers():
+    mpeg1 = mp3_utils._parse_header(frame(MPEG1_HEADER, MPEG1_LENGTH), 0)
+    assert (mpeg1.length, mpeg1.samples, mpeg1.sample_rate) == (MPEG1_LENGTH, 1152, 44100)
+    mpeg2 = mp3_utils._parse_header(frame(), 0)
+    assert (mpeg2.length, mpeg2.samples, mpeg2.sample_rate) == (MPEG2_LENGTH, 576, 24000)
+    assert mpeg2.duration_ms == 24
+
+def test_rejects_non_layer3_and_invalid_headers():
+    assert mp3_utils._parse_header(b"\x00\x00\x00\x00", 0) is None
+    # Layer II
+    assert mp3_utils._parse_header(bytes([0xFF, 0xFD, 0x90, 0x00]), 0) is None
+    # Bitrate index 15 and reserved sample rate index 3
+    assert mp3_utils._parse_header(bytes([0xFF, 0xFB, 0xF0, 0x00]), 0) is None
+    assert mp3_utils._parse_header(bytes([0xFF, 0xFB, 0x9C, 0x00]), 0) is None
+    # Truncated header
+    assert mp3_utils._parse_header(MPEG2_HEADER[:3], 0) is None
+
+def test_iter_frames_skips_garbage_and_info_frame():
+    data = info_frame() + b"junk" + mp3(3)
+    frames = list(mp3_utils.iter_frames(data))
+    assert [f.offset for f in frames] == [MPEG2_LENGTH + 4 + i * MPEG2_LENGTH for i in range(3)]
+
+def test_duration_and_sample_rate_ignore_id3_tags():
+    data = id3_tag() + mp3(10) + b"TAG" + b"\x00" * 125
+    assert mp3_utils.duration_ms(data) == 240
+    assert mp3_utils.sample_rate(data) == 24000
+    assert mp3_utils.sample_rate(b"") == 0
+
+def test_concat_joins_audio_frames_only():
+    first, second = mp3(2), mp3(3)
+    joined = mp3_utils.concat([id3_tag() + info_frame() + first, id3_tag(5) + second])
+    assert joined == first + second
+    assert mp3_utils.duration_ms(joined) == 120
+
+def test_split_assigns_frames_by_midpoint():
+    data = mp3(10)
+    # Frame midpoints are at 12, 36, 60, 84, ... ms
+    segments = mp3_utils.split(id3_tag() + data, [50, 100])
+    assert [len(segment) // MPEG2_LENGTH for segment in segments] == [2, 2, 6]
+    assert b"".join(segments) == data
+
+def test_split_without_boundaries_returns_the_audio():
+    data = mp3(4)
+    assert mp3_utils.split(data, []) == [data]
+
+def test_frame_stream_matches_concat_across_chunk_boundaries():
+    files = [id3_tag() + info_frame() + mp3(5), id3_tag(3) + mp3(4)]
+    stream = mp3_utils.FrameStream()
+    output = bytearray()
+    for data in files:
+        stream.reset()
+        for start in range(0, len(data), 7):
+            output += stream.feed(data[start:start + 7])
+    assert bytes(output) == mp3_utils.concat(files)
+    assert stream.duration_ms == 9 * 24
+    assert stream.sample_rate == 24000
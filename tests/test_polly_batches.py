@@ -0,0 +1,34 @@
+import polly_service
+from polly_service import _batch_ssml, _pack_batches
+
+def ssml_sizes(texts, batches):
+    return [len(_batch_ssml([texts[i] for i in batch])) for batch in batches]
+
+def test_packs_in_order_under_the_text_limit():
+    texts = ["a" * 10] * 5
+    assert _pack_batches(texts, 25) == [[0, 1], [2, 3], [4]]
+
+def test_text_over_the_limit_gets_its_own_batch():
+    assert _pack_batches(["a" * 30, "b", "c"], 25) == [[0], [1, 2]]
+
+def test_many_short_headings_stay_under_the_ssml_limit():
+    # Markup per heading is far larger than the heading itself
+    texts = [f"Heading {i}" for i in range(500)]
+    batches = _pack_batches(texts, polly_service.BATCH_MAX_CHARS)
+    assert len(batches) > 1
+    assert max(ssml_sizes(texts, batches)) <= polly_service.SSML_MAX_CHARS
+    assert [i for batch in batches for i in batch] == list(range(500))
+
+def test_escaped_entities_count_towards_the_ssml_limit():
+    texts = ['Q&A "quoted" <tag>'] * 200
+    batches = _pack_batches(texts, polly_service.BATCH_MAX_CHARS, max_ssml_chars=1000)
+    assert max(ssml_sizes(texts, batches)) <= 1000
+    # A batch one text longer would not have fit
+    assert all(
+        len(_batch_ssml(texts[:len(batch) + 1])) > 1000 for batch in batches[:-1]
+    )
+
+def test_batch_ssml_marks_each_text_by_position():
+    assert _batch_ssml(["one", "two"]) == (
+        f'<speak><mark name="s0"/>one{polly_service.BATCH_BREAK}<mark name="s1"/>two</speak>'
+    )
@@ -0,0 +1,65 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import reconcile_service
+from reconcile_service import _Reconciliation, _diff, _reference_stages
+
+NOW = datetime(2025, 1, 2, tzinfo=timezone.utc)
+OLD = NOW - timedelta(days=2)
+
+async def stream(items):
+    for item in items:
+        yield item
+
+def ref(key, collection="audios", field="file", record_id="r1"):
+    return {"key": key, "collection": collection, "field": field, "id": record_id, "section_id": "s1"}
+
+def diff(stored, referenced):
+    async def collect():
+        return [(kind, item) async for kind, item in _diff(stream(stored), stream(referenced))]
+    return asyncio.run(collect())
+
+def test_diff_merges_sorted_listings():
+    stored = [("a", OLD, 1), ("b", OLD, 2), ("d", OLD, 4)]
+    referenced = [ref("b"), ref("b", record_id="r2"), ref("c"), ref("e")]
+    assert diff(stored, referenced) == [
+        ("orphan", ("a", OLD, 1)),
+        ("dangling", ref("c")),
+        ("orphan", ("d", OLD, 4)),
+        ("dangling", ref("e")),
+    ]
+
+def test_diff_of_matching_listings_is_empty():
+    assert diff([("a", OLD, 1)], [ref("a")]) == []
+    assert diff([], []) == []
+
+def test_dry_run_reports_without_fixing(tmp_path):
+    existing = tmp_path / "still-there.mp3"
+    existing.write_bytes(b"x")
+    stored = [("a", OLD, 10), ("b", NOW, 20)]
+    referenced = [
+        ref(str(tmp_path / "gone.mp3")),
+        ref(str(tmp_path / "gone.vtt"), field="vtt"),
+        # Listed after the listing passed it, but the file exists
+        ref(str(existing)),
+    ]
+    reconciliation = _Reconciliation(db=None, local=True, dry_run=True, orphaned_before=NOW - timedelta(hours=1))
+    report = asyncio.run(reconciliation.run(stream(sorted(stored)), stream(sorted(referenced, key=lambda r: r["key"]))))
+    assert report["orphaned_objects"] == 1
+    assert report["orphaned_bytes"] == 10
+    assert report["recent_unreferenced"] == 1
+    assert report["dangling_records"] == 1
+    assert report["dangling_derived_files"] == 1
+    assert report["deleted_objects"] == 0
+    assert reconciliation.orphan_keys == []
+    assert all(not ops for ops in reconciliation.record_ops.values())
+
+def test_reference_stages_keep_records_without_a_string_created_at():
+    match = _reference_stages("videos", False, "^videos/", NOW.isoformat())[0]["$match"]
+    # $lt on a string would drop BSON dates and missing values, whose files would then look orphaned
+    assert match == {"created_at": {"$not": {"$gte": NOW.isoformat()}}}
+
+def test_reference_stages_cover_every_file_field():
+    stages = _reference_stages("audios", True, "^/", NOW.isoformat())
+    files = stages[1]["$project"]["files"]["$concatArrays"][0]
+    assert [f["field"] for f in files] == [name for name, _, _ in reconcile_service.FILE_REFERENCES["audios"]]
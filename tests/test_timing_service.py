@@ -0,0 +1,46 @@
+from timing_service import build_timing_track, to_webvtt
+
+TEXT = "Hello world. Hello again."
+
+def marks():
+    return [
+        {"time": 0, "type": "sentence", "value": "Hello world."},
+        {"time": 6, "type": "word", "value": "Hello"},
+        {"time": 300, "type": "word", "value": "world"},
+        {"time": 900, "type": "sentence", "value": "Hello again."},
+        {"time": 900, "type": "word", "value": "Hello"},
+        {"time": 1200, "type": "word", "value": "again"},
+        {"time": 1200, "type": "viseme", "value": "p"},
+    ]
+
+def test_offsets_are_characters_found_in_reading_order():
+    track = build_timing_track(TEXT, marks(), 1800)
+    assert track["duration"] == 1800
+    # The second "Hello" is placed after the first, not on top of it
+    assert track["words"] == [[6, 0, 5], [300, 6, 11], [900, 13, 18], [1200, 19, 24]]
+    assert track["sentences"] == [[0, 0, 12], [900, 13, 25]]
+
+def test_marks_are_ordered_by_time_and_ssml_is_stripped():
+    unordered = [
+        {"time": 300, "type": "word", "value": "b&amp;c"},
+        {"time": 0, "type": "word", "value": "<mark name=\"s0\"/>a"},
+    ]
+    track = build_timing_track("a b&c", unordered, 500)
+    assert track["words"] == [[0, 0, 1], [300, 2, 5]]
+
+def test_marks_missing_from_the_text_are_skipped():
+    track = build_timing_track(TEXT, [{"time": 0, "type": "word", "value": "absent"}], 100)
+    assert track["words"] == []
+
+def test_webvtt_has_one_cue_per_sentence():
+    track = build_timing_track(TEXT, marks(), 1800)
+    assert to_webvtt(TEXT, track) == "\n".join([
+        "WEBVTT", "",
+        "1", "00:00:00.000 --> 00:00:00.900", "Hello world.", "",
+        "2", "00:00:00.900 --> 00:00:01.800", "Hello again.", "",
+    ])
+
+def test_webvtt_without_sentences_is_one_cue():
+    vtt = to_webvtt("Just  text\nhere", {"duration": 3_723_004, "sentences": []})
+    assert vtt.splitlines()[2:4] == ["1", "00:00:00.000 --> 01:02:03.004"]
+    assert vtt.splitlines()[4] == "Just text here"
@@ -0,0 +1,50 @@
+from url_service import canonicalize, url_hash
+
+def test_strips_tracking_parameters_and_sorts_the_rest():
+    url = "https://example.com/pricing?utm_source=x&plan=pro&gclid=1&fbclid=2&a=1&UTM_Medium=y"
+    assert canonicalize(url) == "example.com/pricing?a=1&plan=pro"
+
+def test_site_ignored_parameters_with_wildcards():
+    rules = {"ignored_params": ["session", "ab_*"]}
+    url = "example.com/p?session=1&ab_variant=b&ab=keep"
+    assert canonicalize(url, rules) == "example.com/p?ab=keep"
+    assert canonicalize(url) == "example.com/p?ab=keep&ab_variant=b&session=1"
+
+def test_scheme_www_case_default_port_fragment_and_trailing_slash():
+    variants = [
+        "https://www.Example.com/About/",
+        "http://example.com/About",
+        "https://example.com:443/About#team",
+        "http://WWW.EXAMPLE.COM:80/About//",
+        "example.com/About",
+    ]
+    assert {canonicalize(url) for url in variants} == {"example.com/About"}
+
+def test_other_ports_and_path_case_are_kept():
+    assert canonicalize("http://example.com:8080/") == "example.com:8080/"
+    assert canonicalize("example.com/about") != canonicalize("example.com/About")
+
+def test_root_and_repeated_slashes():
+    assert canonicalize("https://example.com") == "example.com/"
+    assert canonicalize("https://example.com//a///b/") == "example.com/a/b"
+
+def test_path_aliases():
+    rules = {"path_aliases": {"/home/": "/", "/old-pricing": "/pricing"}}
+    assert canonicalize("example.com/home", rules) == "example.com/"
+    assert canonicalize("example.com/old-pricing/?x=1", rules) == "example.com/pricing?x=1"
+
+def test_percent_encoding_is_normalized():
+    assert canonicalize("example.com/caf%c3%a9") == canonicalize("example.com/café") == "example.com/caf%C3%A9"
+    assert canonicalize("example.com/%7Euser") == "example.com/~user"
+    assert canonicalize("example.com/a b") == "example.com/a%20b"
+
+def test_encoded_slash_stays_in_its_segment():
+    assert canonicalize("example.com/a%2Fb") == "example.com/a%2Fb"
+    assert canonicalize("example.com/a%2fb") != canonicalize("example.com/a/b")
+
+def test_url_hash_is_a_stable_128_bit_key_of_the_canonical_url():
+    key = url_hash("https://www.example.com/pricing/?utm_source=x")
+    assert key == url_hash("example.com/pricing")
+    assert len(key) == 32 and int(key, 16) >= 0
+    assert key != url_hash("example.com/pricing?plan=pro")
+    assert url_hash("example.com/home", {"path_aliases": {"/home": "/"}}) == url_hash("example.com")